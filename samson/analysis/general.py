@@ -2,8 +2,11 @@ from math import log, sqrt, pi, ceil, log1p
 from samson.math.general import random_int
 from tqdm import tqdm
 import operator as _operator
-import json
+from collections import Counter
+from array import array
+import itertools
 import difflib as _difflib
+import sys
 import os
 
 RC4_BIAS_MAP = [163, 0, 131, 4, 5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 240, 17, 18, 0, 20, 21, 22, 0, 24, 25, 26, 0, 28, 29, 0, 31, 224, 33, 0, 0, 0, 0, 38, 0, 0, 0, 0, 0, 0, 0, 0, 0, 208, 0, 0, 0]
@@ -364,34 +367,125 @@ def simulate_until_event(p: float, runs: int, visual: bool=False) -> float:
     return total / runs
 
 
-def generate_rc4_bias_map(ciphertexts):
-    bias_map = [{} for i in range(256)]
+def rc4_bias_counts(ciphertexts: list, positions: int=256, counts: array=None) -> array:
+    """
+    Accumulates byte frequencies per position into a flat `positions*256` count matrix. Memory stays
+    O(positions*256) regardless of how many ciphertexts are counted.
+
+    Parameters:
+        ciphertexts (iter): Ciphertexts (only the first `positions` bytes are counted).
+        positions    (int): Number of positions in the matrix.
+        counts     (array): (Optional) Matrix to accumulate into.
+
+    Returns:
+        array: Counts where `counts[i*256 + b]` is the number of ciphertexts with byte `b` at position `i`.
+
+    Examples:
+        >>> from samson.analysis.general import rc4_bias_counts
+        >>> counts = rc4_bias_counts([b'ab', b'ac', b'a'], positions=2)
+        >>> counts[ord('a')], counts[256 + ord('b')], counts[256 + ord('c')]
+        (3, 1, 1)
+
+    """
+    if counts is None:
+        counts = array('Q', bytes(8*256*positions))
+
+    # Ciphertexts of the same length are packed so each position is a strided slice counted at C speed
+    blobs = {}
+    for ciphertext in ciphertexts:
+        ciphertext = ciphertext[:positions]
+        blobs.setdefault(len(ciphertext), bytearray()).extend(ciphertext)
+
+    for length, blob in blobs.items():
+        for i in range(length):
+            base = i*256
+            for byte, count in Counter(blob[i::length]).items():
+                counts[base + byte] += count
+
+    return counts
 
-    for c in ciphertexts:
-        for i, byte in enumerate(c):
-            if byte in bias_map[i]:
-                bias_map[i][byte] = bias_map[i][byte] + 1
-            else:
-                bias_map[i][byte] = 1
 
-    for i,_ in enumerate(bias_map):
-        bias_map[i] = sorted(bias_map[i].items(), key=lambda kv: kv[1], reverse=True)
+
+def rc4_bias_map_from_counts(counts: array) -> list:
+    """
+    Converts a count matrix from `rc4_bias_counts` into a bias map (per position, the `(byte, count)` pairs sorted
+    by descending count).
+
+    Parameters:
+        counts (array): Count matrix.
+
+    Returns:
+        list: Bias map.
+    """
+    bias_map = []
+    for i in range(0, len(counts), 256):
+        row = [(byte, count) for byte, count in enumerate(counts[i:i+256]) if count]
+        bias_map.append(sorted(row, key=lambda kv: kv[1], reverse=True))
 
     return bias_map
 
 
 
-def generate_random_rc4_bias_map(data=b'\x00' * 51, key_size=128, sample_size=2**20):
+def generate_rc4_bias_map(ciphertexts):
+    return rc4_bias_map_from_counts(rc4_bias_counts(ciphertexts))
+
+
+
+def generate_random_rc4_bias_counts(data=b'\x00' * 51, key_size=128, sample_size=2**20, counts=None):
     from samson.stream_ciphers.rc4 import RC4
-    ciphertexts = []
+    xor_data  = int.from_bytes(data, 'big')
+    keys      = (os.urandom(key_size // 8) for _ in range(sample_size))
+    positions = len(data)
 
-    for _ in range(sample_size):
-        key = os.urandom(key_size // 8)
-        cipher = RC4(key)
-        ciphertexts.append(cipher.generate(len(data)) ^ data)
+    # Count in batches to bound the size of the packed ciphertexts
+    for _ in range(0, sample_size, 2**16):
+        batch  = itertools.islice(RC4.keystreams(keys, positions), 2**16)
+        counts = rc4_bias_counts(((int.from_bytes(keystream, 'big') ^ xor_data).to_bytes(positions, 'big') for keystream in batch), positions, counts)
 
+    return counts
 
-    return generate_rc4_bias_map(ciphertexts)
+
+
+def generate_random_rc4_bias_map(data=b'\x00' * 51, key_size=128, sample_size=2**20):
+    return rc4_bias_map_from_counts(generate_random_rc4_bias_counts(data, key_size, sample_size))
+
+
+
+def save_rc4_bias_counts(filepath: str, counts: array):
+    """
+    Writes a count matrix as raw little-endian uint64s.
+
+    Parameters:
+        filepath (str): Path to write to.
+        counts (array): Count matrix.
+    """
+    if sys.byteorder == 'big':
+        counts = array('Q', counts)
+        counts.byteswap()
+
+    with open(filepath, 'wb') as f:
+        counts.tofile(f)
+
+
+
+def load_rc4_bias_counts(filepath: str) -> array:
+    """
+    Reads a count matrix written by `save_rc4_bias_counts`.
+
+    Parameters:
+        filepath (str): Path to read from.
+
+    Returns:
+        array: Count matrix.
+    """
+    counts = array('Q')
+    with open(filepath, 'rb') as f:
+        counts.frombytes(f.read())
+
+    if sys.byteorder == 'big':
+        counts.byteswap()
+
+    return counts
 
 
 
@@ -410,26 +504,24 @@ def incremental_rc4_bias_map_gen(filepath, start_idx=0, data=b'\x00' * 51, key_s
         else:
             mod_sample_size = chunk_size
 
-        bias_map = generate_random_rc4_bias_map(data, key_size, mod_sample_size)
-
-
-        with open(filepath + ".{}".format(i), "w+") as f:
-            f.write(json.dumps(bias_map))
-
-        del bias_map
+        counts = generate_random_rc4_bias_counts(data, key_size, mod_sample_size)
+        save_rc4_bias_counts(filepath + ".{}".format(i), counts)
 
 
 
 def merge_rc4_bias_map_files(base_path, num):
-    bias_maps = []
+    merged = None
 
     for i in range(num):
-        with open("{}.{}".format(base_path, i)) as f:
-            content = f.read()
+        counts = load_rc4_bias_counts("{}.{}".format(base_path, i))
 
-        bias_maps.append(json.loads(content))
+        if merged is None:
+            merged = counts
+        else:
+            for j, count in enumerate(counts):
+                merged[j] += count
 
-    return merge_rc4_bias_maps(bias_maps)
+    return rc4_bias_map_from_counts(merged)
 
 
 
@@ -25,6 +25,20 @@ class Analyzer(object):
         raise NotImplementedError("The `analyze` method must be implemented by a subclass.")
 
 
+    def analyze_batch(self, candidates: list) -> list:
+        """
+        Analyzes a list of bytes-like objects and returns their scores. Subclasses may override this
+        to share work across candidates; scores must match `analyze`.
+
+        Parameters:
+            candidates (list): The bytes-like objects to be analyzed.
+
+        Returns:
+            list: The scores in the same order as `candidates`.
+        """
+        return [self.analyze(candidate) for candidate in candidates]
+
+
     def select_highest_scores(self, in_list: list, num: int=1, key: FunctionType=lambda item: item) -> list:
         """
         Analyzes a list `in_list`, sorts the list, and returns the top `num` scores.
@@ -37,4 +51,7 @@ class Analyzer(object):
         Returns:
             list: `in_list` sorted and truncated.
         """
-        return sorted(in_list, key=lambda item: self.analyze(key(item)), reverse=True)[:num]
+        in_list = list(in_list)
+        scores  = self.analyze_batch([key(item) for item in in_list])
+        ranked  = sorted(range(len(in_list)), key=scores.__getitem__, reverse=True)
+        return [in_list[idx] for idx in ranked[:num]]
@@ -31,7 +31,7 @@ class CBCPaddingOracleAttack(object):
             block_size       (int): Block size of the block cipher being used.
             alphabet        (list): Bytes range the plaintext is made out of.
             batch_requests  (bool): Whether or not the oracle can take batch requests.
-            threads          (int): Number of threads to use.
+            threads          (int): Number of workers to use (see `RUNTIME.executor`).
         """
         self.oracle     = oracle
         self.iv         = Bytes.wrap(iv)
@@ -91,12 +91,17 @@ class CBCPaddingOracleAttack(object):
                     log.debug(f"Found working byte: {last_working_char}")
 
                 else:
-                    @RUNTIME.threaded(threads=self.threads, starmap=True)
                     def attempt_exploit_block(exploit_block, byte):
                         if self.oracle.check_padding(exploit_block):
                             return byte
 
-                    last_working_char = max([b for b in attempt_exploit_block(exploit_blocks.items()) if b is not None])
+                    executor = RUNTIME.get_executor(self.threads)
+
+                    # Once a plaintext byte is known the padding is unambiguous, so stop at the first hit
+                    if plaintext:
+                        last_working_char = executor.first(attempt_exploit_block, exploit_blocks.items(), starmap=True)
+                    else:
+                        last_working_char = max([b for b in executor.map(attempt_exploit_block, exploit_blocks.items(), starmap=True) if b is not None])
 
                 plaintext = last_working_char + plaintext
 
@@ -1,4 +1,5 @@
-from samson.math.general import random_int_between, crt, mod_inv, bsgs
+from samson.math.general import random_int_between, crt, bsgs
+from samson.math.algebra.curves.multi_scalar_mul import multi_exponentiation
 from samson.math.factorization.general import trial_division
 from samson.math.algebra.rings.integer_ring import ZZ
 from samson.utilities.runtime import RUNTIME
@@ -72,11 +73,17 @@ class DiffieHellmanSubgroupConfinementAttack(object):
                     t = random_int_between(2, self.p)
                     h = pow(t, (self.p-1) // subgroup, self.p)
 
+                # Candidates are h^i for i stepping by subgroup/fac, so each one is a multiplication away from the last
+                step      = pow(h, subgroup // fac, self.p)
+                candidate = pow(h, res, self.p)
+
                 for i in range(res, subgroup+1, subgroup // fac):
-                    if self.oracle.request(h, pow(h, i, self.p)):
+                    if self.oracle.request(h, candidate):
                         res = i
                         break
 
+                    candidate = candidate * step % self.p
+
                 res %= subgroup
 
             return res, subgroup
@@ -92,7 +99,7 @@ class DiffieHellmanSubgroupConfinementAttack(object):
             return n
 
         g_prime = pow(self.g, r, self.p)
-        y_prime = (public_key * mod_inv(pow(self.g, n, self.p), self.p)) % self.p
+        y_prime = multi_exponentiation([public_key, self.g], [1, -n], self.p)
 
         log.info(f'Recovered {"%.2f"%math.log(reduce(int.__mul__, facs, 1), 2)}/{"%.2f"%math.log(self.order, 2)} bits')
         log.info(f'Found relation: x = {n} + m*{r}')
@@ -1,4 +1,5 @@
 from samson.utilities.bytes import Bytes
+from samson.macs.ghash import ghash_blocks
 from samson.math.algebra.all import FF, ZZ
 from samson.math.polynomial import Polynomial
 from samson.math.symbols import Symbol
@@ -14,12 +15,7 @@ def elem_to_int(a):
     return int(bin(int(a))[2:].zfill(128)[::-1], 2)
 
 def gcm_to_poly(ad, ciphertext, tag):
-    l = (len(ad) << (3 + 64)) | (len(ciphertext) << 3)
-
-    ct_ints = [chunk.int() for chunk in ciphertext.pad_congruent_right(16).chunk(16)[::-1]]
-    ad_ints = [chunk.int() for chunk in ad.pad_congruent_right(16).chunk(16)[::-1]]
-
-    return Polynomial([int_to_elem(coeff) for coeff in [tag.int(), l, *ct_ints, *ad_ints]])
+    return Polynomial([int_to_elem(coeff) for coeff in [tag.int(), *ghash_blocks(ad, ciphertext)[::-1]]])
 
 
 class ForbiddenAttack(object):
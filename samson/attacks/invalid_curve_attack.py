@@ -165,14 +165,19 @@ class InvalidCurveAttack(object):
             for curr_e in range(exponent-exp_mod*2):
                 subgroup = first_subgroup // fac**curr_e
 
+                # Candidates are bad_pub*subgroup*(res + i*fac^curr_e), so each one is an addition away from the last
+                query     = bad_pub*subgroup
+                step      = bad_pub*(subgroup*fac**curr_e)
+                candidate = bad_pub*(subgroup*res)
+
                 curr_r = fac-1
                 for i in range(fac-1):
-                    pub_mod = subgroup*(res + i*fac**curr_e)
-
-                    if self.oracle.request(bad_pub*subgroup, mal_ecdhe.derive_key(bad_pub*pub_mod)):
+                    if self.oracle.request(query, mal_ecdhe.derive_key(candidate)):
                         curr_r = i
                         break
 
+                    candidate += step
+
                 res += curr_r * fac**curr_e
 
             return res, full_pp_group // fac**(exp_mod*2)
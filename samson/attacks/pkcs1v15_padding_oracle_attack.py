@@ -1,7 +1,9 @@
 from samson.oracles.padding_oracle import PaddingOracle
 from samson.utilities.bytes import Bytes
 from samson.utilities.runtime import RUNTIME
+from samson.math.general import mod_inv
 from random import randint
+import threading
 import math
 
 import logging
@@ -22,6 +24,27 @@ def _append_and_merge(new_a, new_b, intervals):
     intervals.append((new_a, new_b))
 
 
+def _candidates(a: int, b: int, r: int, n: int, B: int):
+    # For `m` in [a, b], `m*s` can only land in [2B + rn, 3B - 1 + rn] for `s` in the range below. Walking these
+    # ranges over increasing `r` skips the holes where no `s` can produce a conforming plaintext
+    last = 0
+    while True:
+        lo = max(last + 1, _ceil(2*B + r*n, b))
+        hi = (3*B - 1 + r*n) // a
+
+        yield from range(lo, hi + 1)
+
+        last = max(last, hi)
+        r   += 1
+
+
+def _interleave(generators: list):
+    while True:
+        for generator in generators:
+            yield next(generator)
+
+
+
 class PKCS1v15PaddingOracleAttack(object):
     """
     Performs a plaintext recovery attack.
@@ -30,61 +53,93 @@ class PKCS1v15PaddingOracleAttack(object):
     takes advantage of an information leak through the validation of the plaintext's padding. Using RSA's homomorphic
     properties, the algorithm can iteratively converge on the correct plaintext.
 
+    Besides the original algorithm, this implementation uses trimmers and skips `s` values that can't produce a
+    conforming plaintext (Bardou et al.), and searches all intervals at once in step 2.b (Klima, Pokorny, Rosa).
+    With `threads` > 1, candidate `s` values are probed speculatively in parallel and outstanding probes are
+    cancelled once one conforms. The number of oracle queries is kept in `queries`.
+
     Conditions:
         * RSA is being used
         * PKCS#1 v1.5 padding is being used
         * The user has access to an oracle that allows abitrary plaintext input and leaks whether the padding is correct.
+
+    References:
+        "Chosen Ciphertext Attacks Against Protocols Based on the RSA Encryption Standard PKCS #1" (Bleichenbacher)
+        "Attacking RSA-based Sessions in SSL/TLS" (Klima, Pokorny, Rosa)
+        "Efficient Padding Oracle Attacks on Cryptographic Hardware" (Bardou, Focardi, Kawamoto, Simionato, Steel, Tsay)
     """
 
-    def __init__(self, oracle: PaddingOracle):
+    def __init__(self, oracle: PaddingOracle, threads: int=1, trimmers: int=50):
         """
         Parameters:
             oracle (PaddingOracle): An oracle that takes in an integer and returns whether the padding is correct.
+            threads          (int): Number of concurrent oracle queries (see `RUNTIME.executor`).
+            trimmers         (int): Number of trimmer denominators to try before step 2 (0 to disable).
         """
-        self.oracle = oracle
+        self.oracle   = oracle
+        self.threads  = threads
+        self.trimmers = trimmers
+        self.queries  = 0
+        self._lock    = threading.Lock()
 
 
 
-    @RUNTIME.report
-    def execute(self, ciphertext: int, n: int, e: int, key_length: int) -> Bytes:
-        """
-        Executes the attack.
+    def _check(self, c: int) -> bool:
+        with self._lock:
+            self.queries += 1
 
-        Parameters:
-            ciphertext (int): The ciphertext represented as an integer.
-                     n (int): The RSA instance's modulus.
-                     e (int): The RSA instance's public exponent.
-            key_length (int): The the bit length of the RSA instance (2048, 4096, etc).
-        
-        Returns:
-            Bytes: The ciphertext's corresponding plaintext.
-        """
-        key_byte_len = key_length // 8
+        return self.oracle.check_padding(c)
 
-        # Convenience variables
-        B = 2 ** (8 * (key_byte_len - 2))
 
-        # Initial values
-        c = ciphertext
-        c_0 = ciphertext
-        M = [(2*B, 3*B - 1)]
-        i = 1
 
-        if not self.oracle.check_padding(c):
-            log.debug("Initial padding not correct; attempting blinding")
+    def _first(self, probe, candidates) -> object:
+        if self.threads == 1:
+            for candidate in candidates:
+                result = probe(candidate)
+                if result is not None:
+                    return result
+
+        else:
+            return RUNTIME.get_executor(self.threads).first(probe, candidates)
+
+
+
+    def _search(self, c_0: int, candidates, n: int, e: int) -> int:
+        return self._first(lambda s: s if self._check(c_0 * pow(s, e, n) % n) else None, candidates)
+
+
 
-            # Step 1: Blinding
-            while True:
-                s = randint(0, n - 1)
-                c_0 = (c * pow(s, e, n)) % n
+    def _trim(self, c_0: int, n: int, e: int, B: int) -> list:
+        # If `m*u/t` is conforming then (with overwhelming probability) `t` divides `m`, so `m` lies in
+        # [2B*t/u, (3B - 1)*t/u]. Intersecting these for every conforming fraction shrinks the initial interval
+        fractions = [(u, t) for t in range(3, self.trimmers + 3) for u in (t - 1, t + 1) if 2*t < 3*u and 2*u < 3*t]
+        probe     = lambda u, t: (u, t) if self._check(c_0 * pow(u * mod_inv(t, n), e, n) % n) else None
 
-                if self.oracle.check_padding(c_0):
-                    log.debug("Padding is now correct; blinding complete")
-                    break
+        if self.threads == 1:
+            hits = [probe(u, t) for u, t in fractions]
+        else:
+            hits = RUNTIME.get_executor(self.threads).map(probe, fractions, starmap=True)
 
+        a, b = 2*B, 3*B - 1
+        for hit in hits:
+            if hit:
+                u, t = hit
+                a    = max(a, _ceil(2*B*t, u))
+                b    = min(b, (3*B - 1)*t // u)
+
+        # A false positive can make the constraints inconsistent
+        if a > b:
+            return [(2*B, 3*B - 1)]
+
+        return [(a, b)]
+
+
+
+    def _narrow(self, c_0: int, M: list, n: int, e: int, B: int) -> int:
         # Setup reporting
-        last_log_diff = math.log(M[0][1] - M[0][0], 2)
+        last_log_diff = math.log(M[0][1] - M[0][0] + 1, 2)
         progress = RUNTIME.report_progress(None, total=last_log_diff)
+        i = 1
 
         # Step 2
         while True:
@@ -97,25 +152,14 @@ class PKCS1v15PaddingOracleAttack(object):
 
             # Step 2.a
             if i == 1:
-                s = _ceil(n, 3*B)
-
-                log.debug(f"Starting search at {s}")
-
-                while True:
-                    c = c_0 * pow(s, e, n) % n
-                    if self.oracle.check_padding(c):
-                        break
+                a, b = M[0]
+                s = self._search(c_0, _candidates(a, b, 1, n, B), n, e)
+                log.debug(f"Found first conforming s: {s}")
 
-                    s += 1
-            # Step 2.b
+            # Step 2.b: run a step 2.c search for every interval at once
             elif len(M) >= 2:
                 log.debug(f"Intervals left: {M}")
-                while True:
-                    s += 1
-                    c = c_0 * pow(s, e, n) % n
-
-                    if self.oracle.check_padding(c):
-                        break
+                s = self._search(c_0, _interleave([_candidates(a, b, _ceil(2 * (b*s - 2*B), n), n, B) for a, b in M]), n, e)
 
             # Step 2.c
             elif len(M) == 1:
@@ -124,20 +168,9 @@ class PKCS1v15PaddingOracleAttack(object):
                 a, b = M[0]
 
                 if a == b:
-                    return Bytes(b'\x00' + Bytes(a))
-
-                r = _ceil(2 * (b*s - 2*B), n)
-                s = _ceil(2*B + r*n, b)
-
-                while True:
-                    c = c_0 * pow(s, e, n) % n
-                    if self.oracle.check_padding(c):
-                        break
+                    return a
 
-                    s += 1
-                    if s > (3*B + r*n) // a:
-                        r += 1
-                        s = _ceil(2*B + r*n, b)
+                s = self._search(c_0, _candidates(a, b, _ceil(2 * (b*s - 2*B), n), n, B), n, e)
 
             M_new = []
 
@@ -158,7 +191,74 @@ class PKCS1v15PaddingOracleAttack(object):
 
 
             if len(M_new) == 0:
-                raise Exception("There are zero intervals in 'M_new'")
+                return None
 
             M = M_new
             i += 1
+
+
+
+    @RUNTIME.report
+    def execute(self, ciphertext: int, n: int, e: int, key_length: int) -> Bytes:
+        """
+        Executes the attack.
+
+        Parameters:
+            ciphertext (int): The ciphertext represented as an integer.
+                     n (int): The RSA instance's modulus.
+                     e (int): The RSA instance's public exponent.
+            key_length (int): The the bit length of the RSA instance (2048, 4096, etc).
+
+        Returns:
+            Bytes: The ciphertext's corresponding plaintext.
+        """
+        key_byte_len = key_length // 8
+        self.queries = 0
+
+        # Convenience variables
+        B = 2 ** (8 * (key_byte_len - 2))
+
+        # Initial values
+        c   = ciphertext
+        c_0 = ciphertext
+        s_0 = 1
+
+        if not self._check(c):
+            log.debug("Initial padding not correct; attempting blinding")
+
+            # Step 1: Blinding. Successive powers of a random `s` only cost a multiplication each
+            step   = randint(2, n - 1)
+            step_e = pow(step, e, n)
+
+            def blindings():
+                s, c_s = 1, c
+                while True:
+                    s   = s * step % n
+                    c_s = c_s * step_e % n
+                    yield s, c_s
+
+            s_0, c_0 = self._first(lambda blinding: blinding if self._check(blinding[1]) else None, blindings())
+
+            log.debug("Padding is now correct; blinding complete")
+
+
+        initial_intervals = [[(2*B, 3*B - 1)]]
+        if self.trimmers:
+            initial_intervals.insert(0, self._trim(c_0, n, e, B))
+            log.debug(f"Trimmed initial interval to {initial_intervals[0]}")
+
+
+        for M in initial_intervals:
+            m = self._narrow(c_0, M, n, e, B)
+
+            if m is not None:
+                break
+
+            log.debug("Intervals vanished; retrying without trimming")
+
+        else:
+            raise Exception("There are zero intervals in 'M_new'")
+
+
+        log.info(f"Recovered plaintext in {self.queries} oracle queries")
+        return Bytes(b'\x00' + Bytes(m * mod_inv(s_0, n) % n))
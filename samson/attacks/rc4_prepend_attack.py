@@ -1,6 +1,7 @@
-from samson.analysis.general import generate_rc4_bias_map, RC4_BIAS_MAP
+from samson.analysis.general import rc4_bias_counts, RC4_BIAS_MAP
 from samson.oracles.chosen_plaintext_oracle import ChosenPlaintextOracle
 from samson.utilities.runtime import RUNTIME
+from samson.utilities.executors import ProcessExecutor
 from samson.utilities.bytes import Bytes
 from samson.ace.decorators import define_exploit
 from samson.ace.consequence import Consequence, Requirement, Manipulation
@@ -8,7 +9,6 @@ import multiprocessing
 import itertools
 import struct
 import math
-import gc
 
 import logging
 log = logging.getLogger(__name__)
@@ -43,8 +43,9 @@ class RC4PrependAttack(object):
         self.strongest_biases = [1, 15, 31]
 
 
-    def _encrypt_chunk(self, payload: bytes, chunk_size: int):
-        return [bytearray(self.oracle.request(payload)) for _ in range(chunk_size)]
+    def _count_chunk(self, payload: bytes, chunk_size: int, positions: int):
+        # Only the count matrix crosses the process boundary, never the ciphertexts
+        return rc4_bias_counts((bytes(self.oracle.request(payload)) for _ in range(chunk_size)), positions)
 
 
     @RUNTIME.report
@@ -55,14 +56,14 @@ class RC4PrependAttack(object):
         Parameters:
             secret_length (int): The length of the secret you're trying to recover.
             sample_size   (int): The amount of samples to collect per byte of the secret. Higher numbers are slower but more accurate.
-            chunk_size    (int): The size of sample chunks per CPU before a forceful garbage collection saves the day.
+            chunk_size    (int): The number of samples each worker counts per task.
         
         Returns:
             Bytes: The recovered plaintext.
         """
         cracked_indices = [set() for i in range(secret_length)]
         cpu_count = multiprocessing.cpu_count()
-        pool = multiprocessing.Pool(processes=cpu_count)
+        executor  = RUNTIME.get_executor(cpu_count, ProcessExecutor)
 
         log.info(f"Running with {cpu_count} cores")
 
@@ -78,19 +79,20 @@ class RC4PrependAttack(object):
 
             payload = b'\x00' * padding_len
             num_chunks = math.ceil(sample_size / chunk_size)
+            positions  = padding_len + secret_length
 
             log.debug(f"Sampling {sample_size} ciphertexts")
-            flattened_list = []
-            for i in range(math.ceil(num_chunks / cpu_count)):
-                random_ciphertexts = [pool.apply_async(self._encrypt_chunk, (payload, chunk_size)) for i in range(min(num_chunks - (i*cpu_count), cpu_count))]
-                flattened_list.extend([result for result_list in random_ciphertexts for result in result_list.get()])
-                gc.collect()
-
-            log.debug("Generating bias map")
-            bias_map = generate_rc4_bias_map(flattened_list)
+            counts = None
+            for chunk_counts in executor.map(self._count_chunk, [(payload, chunk_size, positions)] * num_chunks, starmap=True, ordered=False):
+                if counts is None:
+                    counts = chunk_counts
+                else:
+                    for j, count in enumerate(chunk_counts):
+                        counts[j] += count
 
             for bias_idx in active_biases:
-                cracked_indices[bias_idx - padding_len].add(RC4_BIAS_MAP[bias_idx] ^ bias_map[bias_idx][0][0])
+                row = counts[bias_idx*256:(bias_idx+1)*256]
+                cracked_indices[bias_idx - padding_len].add(RC4_BIAS_MAP[bias_idx] ^ max(range(256), key=row.__getitem__))
 
 
         all_branches = itertools.product(*[list(results) for results in cracked_indices])
@@ -63,15 +63,16 @@ class XORDictionaryAttack(object):
             for i in range(j - last_num_processed):
                 word_scores = []
                 for prepend in prepend_list:
-                    for word in trimmed_list:
-                        mod_word = (prepend + delimiter + word).strip()
-                        xor_result = xor_buffs((bytes(mod_word, 'utf-8') + b'\x00' * cipher_len)[:cipher_len], two_time)[:len(two_time)]
-                        analysis = self.analyzer.analyze(xor_result)
+                    mod_words   = [(prepend + delimiter + word).strip() for word in trimmed_list]
+                    xor_results = [xor_buffs((bytes(mod_word, 'utf-8') + b'\x00' * cipher_len)[:cipher_len], two_time)[:len(two_time)] for mod_word in mod_words]
+                    analyses    = self.analyzer.analyze_batch(xor_results)
+
+                    for mod_word, word, analysis in zip(mod_words, trimmed_list, analyses):
                         word_scores.append((mod_word, analysis / (len(word) ** 2)))
 
                 prepend_list = [word for word, _ in sorted(word_scores, key=lambda score: score[1], reverse=True)[:10 ** (i + 1 + last_num_processed)]]
             last_num_processed = j
 
-            results.append(sorted(prepend_list, key=lambda word: self.analyzer.analyze(xor_buffs((bytes(word, 'utf-8') + b'\x00' * cipher_len)[:cipher_len], two_time)), reverse=True)[:10])
+            results.append(self.analyzer.select_highest_scores(prepend_list, num=10, key=lambda word: xor_buffs((bytes(word, 'utf-8') + b'\x00' * cipher_len)[:cipher_len], two_time)))
 
         return results
@@ -52,13 +52,10 @@ class XORTranspositionAttack(object):
         # Transposition analysis first (transposition)
         transposed_plaintexts = []
         for cipher in RUNTIME.report_progress(transposed_ciphers, desc='Transposition analysis', unit='ciphers'):
-            all_chars = {}
-            for char in range(256):
-                plaintext = Bytes(struct.pack('B', char)).stretch(len(cipher)) ^ cipher
+            plaintexts = [Bytes(struct.pack('B', char)).stretch(len(cipher)) ^ cipher for char in range(256)]
+            scores     = self.analyzer.analyze_batch(plaintexts)
 
-                all_chars[char] = (self.analyzer.analyze(plaintext), plaintext)
-
-            transposed_plaintexts.append(sorted(all_chars.items(), key=lambda kv: kv[1][0], reverse=True)[0][1][1])
+            transposed_plaintexts.append(plaintexts[max(range(256), key=scores.__getitem__)])
 
 
         retransposed_plaintexts = [bytearray(transposed) for transposed in zip(*transposed_plaintexts)]
@@ -71,20 +68,19 @@ class XORTranspositionAttack(object):
             differential_mask = bytearray()
 
             for i in RUNTIME.report_progress(range(min_size), desc='Building differential mask', unit='bytes'):
-                all_chars = {}
+                cipher_copies = []
 
                 for char in range(256):
-                    full_text_analyses = []
-
                     for curr_cipher in retransposed_plaintexts:
-                        cipher_copy = bytearray([_ for _ in curr_cipher])
-                        cipher_copy[i] = ord(Bytes(struct.pack('B', char)) ^ struct.pack('B', curr_cipher[i]))
-
-                        full_text_analyses.append(self.analyzer.analyze(cipher_copy))
-
-                    all_chars[char] = (sum(full_text_analyses), char)
-
-                best_char = sorted(all_chars.items(), key=lambda kv: kv[1][0], reverse=True)[0][1][1]
+                        cipher_copy    = bytearray(curr_cipher)
+                        cipher_copy[i] = char ^ curr_cipher[i]
+                        cipher_copies.append(cipher_copy)
+
+                # Score every (char, ciphertext) pair in one batch, then total per char
+                scores     = self.analyzer.analyze_batch(cipher_copies)
+                num_texts  = len(retransposed_plaintexts)
+                char_sums  = [sum(scores[char*num_texts:(char+1)*num_texts]) for char in range(256)]
+                best_char  = max(range(256), key=char_sums.__getitem__)
                 differential_mask += struct.pack('B', best_char)
 
             retransposed_plaintexts = [Bytes.wrap(cipher) ^ differential_mask for cipher in retransposed_plaintexts]
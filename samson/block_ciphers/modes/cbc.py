@@ -74,11 +74,15 @@ class CBC(BlockCipherMode):
 
         self.check_ciphertext_length(ciphertext)
 
-        last_block = self.iv
-        for block in get_blocks(ciphertext, self.cipher.block_size):
-            enc_block = last_block ^ Bytes.wrap(self.cipher.decrypt(block))
-            plaintext += enc_block
-            last_block = block
+        if hasattr(self.cipher, 'decrypt_blocks'):
+            # Every block's chaining value is known up front, so decrypt them all at once
+            plaintext = (Bytes.wrap(self.iv) + ciphertext[:-self.cipher.block_size]) ^ self.cipher.decrypt_blocks(ciphertext)
+        else:
+            last_block = self.iv
+            for block in get_blocks(ciphertext, self.cipher.block_size):
+                enc_block = last_block ^ Bytes.wrap(self.cipher.decrypt(block))
+                plaintext += enc_block
+                last_block = block
 
         if unpad:
             plaintext = self.padder.unpad(plaintext)
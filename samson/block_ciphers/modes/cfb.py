@@ -1,4 +1,3 @@
-from samson.utilities.manipulation import get_blocks
 from samson.utilities.bytes import Bytes
 from samson.core.primitives import EncryptionAlg, StreamingBlockCipherMode, Primitive
 from samson.core.metadata import EphemeralType, EphemeralSpec, SizeType, SizeSpec
@@ -19,12 +18,72 @@ class CFB(StreamingBlockCipherMode):
         Primitive.__init__(self)
         self.cipher = cipher
         self.iv     = iv
+        self.reset()
 
 
+    def reset(self):
+        """
+        Restarts the feedback register from the IV.
+        """
+        self._register  = bytes(self.iv)
+        self._keystream = b''
+        self._position  = 0
+
+
+    def _process_into(self, data: bytes, out: bytearray, decrypt: bool) -> bytearray:
+        out        = self._prepare_out(data, out)
+        view       = memoryview(data)
+        block_size = self.cipher.block_size
+        i          = 0
+
+        while i < len(data):
+            if not self._position:
+                self._keystream = bytes(self.cipher.encrypt(self._register))
+                self._register  = b''
+
+            take  = min(block_size - self._position, len(data) - i)
+            chunk = bytes(view[i:i+take])
+            self._xor_into(chunk, self._keystream[self._position:self._position+take], out, i)
+
+            # The ciphertext feeds back into the next block
+            self._register += chunk if decrypt else bytes(out[i:i+take])
+            self._position  = (self._position + take) % block_size
+            i += take
+
+        return out
+
+
+    def encrypt_into(self, data: bytes, out: bytearray=None) -> bytearray:
+        """
+        Encrypts `data` into `out`, continuing from where the last call left off. `out` may be `data` itself.
+
+        Parameters:
+            data    (bytes): Bytes-like object to be encrypted.
+            out (bytearray): Writable buffer at least as long as `data`. Allocated if not given.
+
+        Returns:
+            bytearray: `out`.
+        """
+        return self._process_into(data, out, False)
+
+
+    def decrypt_into(self, data: bytes, out: bytearray=None) -> bytearray:
+        """
+        Decrypts `data` into `out`, continuing from where the last call left off. `out` may be `data` itself.
+
+        Parameters:
+            data    (bytes): Bytes-like object to be decrypted.
+            out (bytearray): Writable buffer at least as long as `data`. Allocated if not given.
+
+        Returns:
+            bytearray: `out`.
+        """
+        return self._process_into(data, out, True)
+
 
     def encrypt(self, plaintext: bytes) -> Bytes:
         """
-        Encrypts `plaintext`.
+        Encrypts `plaintext` as a whole message starting from the IV. Use `encrypt_into` to feed chunks.
 
         Parameters:
             plaintext (bytes): Bytes-like object to be encrypted.
@@ -32,23 +91,14 @@ class CFB(StreamingBlockCipherMode):
         Returns:
             Bytes: Resulting ciphertext.
         """
-        ciphertext = b''
-        plaintext  = Bytes.wrap(plaintext)
-
-        last_block = self.iv
-
-        for block in get_blocks(plaintext, self.cipher.block_size, allow_partials=True):
-            enc_block   = self.cipher.encrypt(bytes(last_block))[:len(block)] ^ block
-            ciphertext += enc_block
-            last_block  = enc_block
-
-        return ciphertext
+        self.reset()
+        return Bytes(self.encrypt_into(bytes(plaintext)))
 
 
 
     def decrypt(self, ciphertext: bytes) -> Bytes:
         """
-        Decrypts `ciphertext`.
+        Decrypts `ciphertext` as a whole message starting from the IV. Use `decrypt_into` to feed chunks.
 
         Parameters:
             ciphertext (bytes): Bytes-like object to be decrypted.
@@ -56,14 +106,5 @@ class CFB(StreamingBlockCipherMode):
         Returns:
             Bytes: Resulting plaintext.
         """
-        plaintext  = b''
-        ciphertext = Bytes.wrap(ciphertext)
-
-        last_block = self.iv
-
-        for block in get_blocks(ciphertext, self.cipher.block_size, allow_partials=True):
-            enc_block  = self.cipher.encrypt(bytes(last_block))[:len(block)] ^ block
-            plaintext += enc_block
-            last_block = block
-
-        return plaintext
+        self.reset()
+        return Bytes(self.decrypt_into(bytes(ciphertext)))
@@ -4,6 +4,8 @@ from samson.core.metadata import EphemeralType, EphemeralSpec, SizeType, SizeSpe
 from samson.ace.decorators import register_primitive
 from math import ceil
 
+CTR_SEGMENT_SIZE = 2**16
+
 @register_primitive()
 class CTR(StreamingBlockCipherMode):
     """Counter block cipher mode."""
@@ -25,10 +27,104 @@ class CTR(StreamingBlockCipherMode):
         self.byteorder = self.nonce.byteorder
 
 
+    def __reprdir__(self):
+        return ['cipher', 'nonce', 'counter', 'byteorder']
+
+
+    # Reseeking (e.g. GCM/CCM setting a new counter) discards keystream left over from a partial block
+    @property
+    def nonce(self) -> Bytes:
+        return self._nonce
+
+    @nonce.setter
+    def nonce(self, nonce: bytes):
+        self._nonce    = nonce
+        self._leftover = b''
+
+
+    @property
+    def counter(self) -> int:
+        return self._counter
+
+    @counter.setter
+    def counter(self, counter: int):
+        self._counter  = counter
+        self._leftover = b''
+
+
+    def keystream(self, length: int) -> bytes:
+        """
+        Generates the next `length` bytes of keystream.
+
+        Parameters:
+            length (int): Number of bytes.
+
+        Returns:
+            bytes: Keystream.
+        """
+        leftover = self._leftover
+        if length <= len(leftover):
+            self._leftover = leftover[length:]
+            return leftover[:length]
+
+        block_size = self.cipher.block_size
+        num_blocks = ceil((length - len(leftover)) / block_size)
+        nonce      = bytes(self._nonce)
+        ctr_size   = block_size - len(nonce)
+        byteorder  = self.byteorder
+        counter    = self._counter
+
+        counter_blocks = b''.join([nonce + ctr.to_bytes(ctr_size, byteorder) for ctr in range(counter, counter + num_blocks)])
+        self._counter += num_blocks
+
+        if hasattr(self.cipher, 'encrypt_blocks'):
+            keystream = bytes(self.cipher.encrypt_blocks(counter_blocks))
+        else:
+            keystream = b''.join([bytes(self.cipher.encrypt(counter_blocks[i:i+block_size])) for i in range(0, len(counter_blocks), block_size)])
+
+        keystream      = leftover + keystream
+        self._leftover = keystream[length:]
+        return keystream[:length]
+
+
+    def encrypt_into(self, data: bytes, out: bytearray=None) -> bytearray:
+        """
+        Encrypts `data` into `out`, continuing from where the last call left off. `out` may be `data` itself.
+
+        Parameters:
+            data    (bytes): Bytes-like object to be encrypted.
+            out (bytearray): Writable buffer at least as long as `data`. Allocated if not given.
+
+        Returns:
+            bytearray: `out`.
+        """
+        out  = self._prepare_out(data, out)
+        view = memoryview(data)
+
+        for i in range(0, len(data), CTR_SEGMENT_SIZE):
+            segment = view[i:i+CTR_SEGMENT_SIZE]
+            self._xor_into(segment, self.keystream(len(segment)), out, i)
+
+        return out
+
+
+    def decrypt_into(self, data: bytes, out: bytearray=None) -> bytearray:
+        """
+        Decrypts `data` into `out`, continuing from where the last call left off. `out` may be `data` itself.
+
+        Parameters:
+            data    (bytes): Bytes-like object to be decrypted.
+            out (bytearray): Writable buffer at least as long as `data`. Allocated if not given.
+
+        Returns:
+            bytearray: `out`.
+        """
+        return self.encrypt_into(data, out)
+
 
     def encrypt(self, plaintext: bytes) -> Bytes:
         """
-        Encrypts `plaintext`.
+        Encrypts `plaintext`. Successive calls continue the keystream, so a message may be fed in chunks of any size.
 
         Parameters:
             plaintext (bytes): Bytes-like object to be encrypted.
@@ -36,21 +132,13 @@ class CTR(StreamingBlockCipherMode):
         Returns:
             Bytes: Resulting ciphertext.
         """
-        keystream = Bytes(b'')
-        plaintext = Bytes.wrap(plaintext)
-
-        num_blocks = ceil(len(plaintext) / self.cipher.block_size)
-        for _ in range(num_blocks):
-            keystream += self.cipher.encrypt(self.nonce + self.counter.to_bytes(self.cipher.block_size - len(self.nonce), self.byteorder))
-            self.counter += 1
-
-        return keystream[:len(plaintext)] ^ plaintext
+        return Bytes(self.encrypt_into(bytes(plaintext)))
 
 
 
     def decrypt(self, ciphertext: bytes) -> Bytes:
         """
-        Decrypts `ciphertext`.
+        Decrypts `ciphertext`. Successive calls continue the keystream, so a message may be fed in chunks of any size.
 
         Parameters:
             ciphertext (bytes): Bytes-like object to be decrypted.
@@ -35,6 +35,9 @@ class ECB(BlockCipherMode):
         if pad:
             plaintext = self.padder.pad(plaintext)
 
+        if hasattr(self.cipher, 'encrypt_blocks') and not len(plaintext) % self.cipher.block_size:
+            return self.cipher.encrypt_blocks(plaintext)
+
         ciphertext = Bytes(b'')
         for block in get_blocks(plaintext, self.cipher.block_size):
             ciphertext += self.cipher.encrypt(block)
@@ -58,9 +61,12 @@ class ECB(BlockCipherMode):
 
         self.check_ciphertext_length(ciphertext)
 
-        plaintext = Bytes(b'')
-        for block in get_blocks(ciphertext, self.cipher.block_size):
-            plaintext += self.cipher.decrypt(block)
+        if hasattr(self.cipher, 'decrypt_blocks'):
+            plaintext = self.cipher.decrypt_blocks(ciphertext)
+        else:
+            plaintext = Bytes(b'')
+            for block in get_blocks(ciphertext, self.cipher.block_size):
+                plaintext += self.cipher.decrypt(block)
 
         if unpad:
             plaintext = self.padder.unpad(plaintext)
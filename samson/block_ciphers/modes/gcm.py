@@ -1,21 +1,10 @@
 from samson.block_ciphers.modes.ctr import CTR
+from samson.macs.ghash import GHASH, gcm_shift
 from samson.utilities.bytes import Bytes
 from samson.core.primitives import EncryptionAlg, StreamingBlockCipherMode, Primitive, AuthenticatedCipher
 from samson.core.metadata import EphemeralType, EphemeralSpec, SizeType, SizeSpec, FrequencyType
 from samson.ace.decorators import register_primitive
 
-# Reference
-# https://github.com/tomato42/tlslite-ng/blob/master/tlslite/utils/aesgcm.py
-GCM_REDUCTION_TABLE = [
-    0x0000, 0x1c20, 0x3840, 0x2460, 0x7080, 0x6ca0, 0x48c0, 0x54e0,
-    0xe100, 0xfd20, 0xd940, 0xc560, 0x9180, 0x8da0, 0xa9c0, 0xb5e0,
-]
-
-
-def reverse_bits(int32: int) -> int:
-    return int(bin(int32)[2:].zfill(4)[::-1], 2)
-
-
 @register_primitive()
 class GCM(StreamingBlockCipherMode, AuthenticatedCipher):
     """Galois counter mode (GCM) block cipher mode"""
@@ -33,14 +22,7 @@ class GCM(StreamingBlockCipherMode, AuthenticatedCipher):
         self.cipher = cipher
         self.H      = self.cipher.encrypt(b'\x00' * 16).int()
         self.ctr    = CTR(self.cipher, b'\x00' * 8)
-
-        # Precompute the product table
-        self.product_table = [0] * 16
-        self.product_table[reverse_bits(1)] = self.H
-
-        for i in range(2, 16, 2):
-            self.product_table[reverse_bits(i)]     = self.gcm_shift(self.product_table[reverse_bits(i // 2)])
-            self.product_table[reverse_bits(i + 1)] = self.product_table[reverse_bits(i)] ^ self.H
+        self.ghash  = GHASH(self.H)
 
 
     def __repr__(self):
@@ -112,26 +94,11 @@ class GCM(StreamingBlockCipherMode, AuthenticatedCipher):
 
 
     def gcm_shift(self, x: int) -> int:
-        high_bit_set = x & 1
-        x >>= 1
-
-        if high_bit_set:
-            x ^= 0xe1 << (128 - 8)
-
-        return x
-
-
-    def mul(self, y):
-        ret = 0
+        return gcm_shift(x)
 
-        for _ in range(0, 128, 4):
-            high_bit = ret & 0xF
-            ret >>= 4
-            ret  ^= GCM_REDUCTION_TABLE[high_bit] << (128 - 16)
-            ret  ^= self.product_table[y & 0xF]
-            y   >>= 4
 
-        return ret
+    def mul(self, y: int) -> int:
+        return self.ghash.mul(y)
 
 
     def auth(self, ciphertext: Bytes, ad: Bytes, tag_mask: Bytes) -> Bytes:
@@ -146,15 +113,4 @@ class GCM(StreamingBlockCipherMode, AuthenticatedCipher):
 
 
     def update(self, y: int, data: Bytes) -> int:
-        for chunk in data.chunk(16):
-            y ^= chunk.int()
-            y  = self.mul(y)
-
-        extra = len(data) % 16
-
-        if extra != 0:
-            block = bytearray(16)
-            block[:extra] = data[-extra:]
-            y ^= int.from_bytes(block, 'big')
-            y  = self.mul(y)
-        return y
+        return self.ghash.hash_blocks(y, data)
@@ -1,4 +1,3 @@
-from samson.block_ciphers.modes.cbc import CBC
 from samson.core.primitives import EncryptionAlg, StreamingBlockCipherMode, Primitive
 from samson.core.metadata import EphemeralType, EphemeralSpec, SizeType, SizeSpec
 from samson.ace.decorators import register_primitive
@@ -20,12 +19,77 @@ class OFB(StreamingBlockCipherMode):
         Primitive.__init__(self)
         self.cipher = cipher
         self.iv     = iv
-        self.cbc    = CBC(cipher, iv)
+        self.reset()
+
+
+    def reset(self):
+        """
+        Restarts the keystream from the IV.
+        """
+        self._register = bytes(self.iv)
+        self._leftover = b''
+
+
+    def keystream(self, length: int) -> bytes:
+        """
+        Generates the next `length` bytes of keystream.
+
+        Parameters:
+            length (int): Number of bytes.
+
+        Returns:
+            bytes: Keystream.
+        """
+        leftover = self._leftover
+        if length <= len(leftover):
+            self._leftover = leftover[length:]
+            return leftover[:length]
+
+        register = self._register
+        blocks   = [leftover]
+        for _ in range(ceil((length - len(leftover)) / self.cipher.block_size)):
+            register = bytes(self.cipher.encrypt(register))
+            blocks.append(register)
+
+        keystream      = b''.join(blocks)
+        self._register = register
+        self._leftover = keystream[length:]
+        return keystream[:length]
+
+
+    def encrypt_into(self, data: bytes, out: bytearray=None) -> bytearray:
+        """
+        Encrypts `data` into `out`, continuing from where the last call left off. `out` may be `data` itself.
+
+        Parameters:
+            data    (bytes): Bytes-like object to be encrypted.
+            out (bytearray): Writable buffer at least as long as `data`. Allocated if not given.
+
+        Returns:
+            bytearray: `out`.
+        """
+        out = self._prepare_out(data, out)
+        self._xor_into(data, self.keystream(len(data)), out)
+        return out
+
+
+    def decrypt_into(self, data: bytes, out: bytearray=None) -> bytearray:
+        """
+        Decrypts `data` into `out`, continuing from where the last call left off. `out` may be `data` itself.
+
+        Parameters:
+            data    (bytes): Bytes-like object to be decrypted.
+            out (bytearray): Writable buffer at least as long as `data`. Allocated if not given.
+
+        Returns:
+            bytearray: `out`.
+        """
+        return self.encrypt_into(data, out)
 
 
     def encrypt(self, plaintext: bytes) -> Bytes:
         """
-        Encrypts `plaintext`.
+        Encrypts `plaintext` as a whole message starting from the IV. Use `encrypt_into` to feed chunks.
 
         Parameters:
             plaintext (bytes): Bytes-like object to be encrypted.
@@ -33,17 +97,14 @@ class OFB(StreamingBlockCipherMode):
         Returns:
             Bytes: Resulting ciphertext.
         """
-        plaintext  = Bytes.wrap(plaintext)
-
-        num_blocks = ceil(len(plaintext) / self.cipher.block_size)
-        keystream  = self.cbc.encrypt(b'\x00' * self.cipher.block_size * num_blocks, False)
+        self.reset()
+        return Bytes(self.encrypt_into(bytes(plaintext)))
 
-        return keystream[:len(plaintext)] ^ plaintext
 
 
     def decrypt(self, ciphertext: bytes) -> Bytes:
         """
-        Decrypts `ciphertext`.
+        Decrypts `ciphertext` as a whole message starting from the IV. Use `decrypt_into` to feed chunks.
 
         Parameters:
             ciphertext (bytes): Bytes-like object to be decrypted.
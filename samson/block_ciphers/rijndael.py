@@ -3,6 +3,7 @@ from samson.utilities.bytes import Bytes
 from samson.core.primitives import BlockCipher, Primitive
 from samson.core.metadata import SizeType, SizeSpec, ConstructionType, FrequencyType
 from samson.ace.decorators import register_primitive
+import struct
 
 def initialize_sbox():
     p = 1
@@ -45,12 +46,51 @@ def invert_sbox(sbox):
     return inv_sbox
 
 
+# https://en.wikipedia.org/wiki/Rijndael_MixColumns
+def gmul(a: int, b: int) -> int:
+    p = 0
+
+    for _ in range(8):
+        if (b & 1) != 0:
+            p ^= a
+
+        hi_bi_set = (a & 0x80) != 0
+        a <<=1
+
+        if hi_bi_set:
+            a ^= 0x1B
+
+        b >>= 1
+
+    return p & 0xFF
+
+
+
+def build_t_tables(sbox: list, column: list) -> list:
+    """
+    Builds the four round tables combining SubBytes and MixColumns on 32-bit big-endian column words.
+    `column` is the first column of the mix matrix; the other tables are byte rotations of the first.
+    """
+    c0, c1, c2, c3 = [GMUL[c] for c in column]
+    T0 = [(c0[x] << 24) | (c1[x] << 16) | (c2[x] << 8) | c3[x] for x in sbox]
+    return [T0] + [[((t >> shift) | (t << (32 - shift))) & 0xFFFFFFFF for t in T0] for shift in (8, 16, 24)]
+
+
 RCON = [0x01, 0x02, 0x04, 0x08, 0x10, 0x20, 0x40, 0x80, 0x1B, 0x36, 0x6C, 0xD8, 0xAB, 0x4D, 0x9A, 0x2F, 0x5E, 0xBC, 0x63, 0xC6, 0x97, 35, 0x6A, 0xD4, 0xB3, 0x7D, 0xFA, 0xEF, 0xC5]
 SBOX = initialize_sbox()
 INV_SBOX = invert_sbox(SBOX)
 MIX_MATRIX = [2, 3, 1, 1, 1, 2, 3, 1, 1, 1, 2, 3, 3, 1, 1, 2]
 INV_MIX_MATRIX = [14, 11, 13, 9, 9, 14, 11, 13, 13, 9, 14, 11, 11, 13, 9, 14]
 
+GMUL = {c: [gmul(c, x) for x in range(256)] for c in set(MIX_MATRIX + INV_MIX_MATRIX)}
+
+TE = build_t_tables(SBOX, MIX_MATRIX[::4])
+TD = build_t_tables(INV_SBOX, INV_MIX_MATRIX[::4])
+
+# Final round S-box outputs pre-shifted into each byte of a column word
+SBOX_SHIFTED     = [[b << shift for b in SBOX] for shift in (24, 16, 8, 0)]
+INV_SBOX_SHIFTED = [[b << shift for b in INV_SBOX] for shift in (24, 16, 8, 0)]
+
 SHIFT_ROW_OFFSETS = [
     *[[0, 1, 2, 3]] * 3,
     [0, 1, 2, 4],
@@ -106,6 +146,15 @@ class Rijndael(BlockCipher):
         Nb = self._chunk_size
         self.num_rounds = NUM_ROUNDS[(Nk - 4) // 2][(Nb - 4) // 2] + 1
 
+        # Round keys as column words for the table-driven core. Decryption uses the equivalent inverse
+        # cipher, so its inner round keys have InvMixColumns applied
+        self._enc_keys = [list(struct.unpack(f'>{Nb}I', round_key)) for round_key in self.round_keys[:self.num_rounds]]
+        self._dec_keys = [self._enc_keys[-1]] + [[self._inv_mix_word(w) for w in words] for words in self._enc_keys[-2:0:-1]] + [self._enc_keys[0]]
+
+        offsets = SHIFT_ROW_OFFSETS[Nb - 4]
+        self._enc_shifts = [[(j + off) % Nb for j in range(Nb)] for off in offsets]
+        self._dec_shifts = [[(j - off) % Nb for j in range(Nb)] for off in offsets]
+
 
     def __reprdir__(self):
         return ['key', 'block_size']
@@ -165,14 +214,94 @@ class Rijndael(BlockCipher):
         Returns:
             Bytes: Resulting ciphertext.
         """
-        return list(self.yield_encrypt(plaintext))[-1]
+        return self.encrypt_blocks(plaintext)
+
+
+    def _inv_mix_word(self, word: int) -> int:
+        # TD includes INV_SBOX, so feed it SBOX outputs to get InvMixColumns alone
+        return TD[0][SBOX[word >> 24]] ^ TD[1][SBOX[(word >> 16) & 255]] ^ TD[2][SBOX[(word >> 8) & 255]] ^ TD[3][SBOX[word & 255]]
+
+
+    def _process_blocks(self, data: bytes, round_keys: list, tables: list, final_tables: list, shifts: list) -> Bytes:
+        Nb = self._chunk_size
+        if len(data) % self.block_size:
+            raise ValueError(f"Input length must be a multiple of the block size ({self.block_size})")
+
+        words = struct.unpack(f'>{len(data) // 4}I', data)
+        T0, T1, T2, T3 = tables
+        F0, F1, F2, F3 = final_tables
+        first_key, inner_keys, last_key = round_keys[0], round_keys[1:-1], round_keys[-1]
+        out = []
+
+        if Nb == 4:
+            k0, k1, k2, k3 = first_key
+            l0, l1, l2, l3 = last_key
+            _, (a0, a1, a2, a3), (b0, b1, b2, b3), (c0, c1, c2, c3) = shifts
+
+            for i in range(0, len(words), 4):
+                s = (words[i] ^ k0, words[i+1] ^ k1, words[i+2] ^ k2, words[i+3] ^ k3)
+
+                for r0, r1, r2, r3 in inner_keys:
+                    s = (
+                        T0[s[0] >> 24] ^ T1[(s[a0] >> 16) & 255] ^ T2[(s[b0] >> 8) & 255] ^ T3[s[c0] & 255] ^ r0,
+                        T0[s[1] >> 24] ^ T1[(s[a1] >> 16) & 255] ^ T2[(s[b1] >> 8) & 255] ^ T3[s[c1] & 255] ^ r1,
+                        T0[s[2] >> 24] ^ T1[(s[a2] >> 16) & 255] ^ T2[(s[b2] >> 8) & 255] ^ T3[s[c2] & 255] ^ r2,
+                        T0[s[3] >> 24] ^ T1[(s[a3] >> 16) & 255] ^ T2[(s[b3] >> 8) & 255] ^ T3[s[c3] & 255] ^ r3
+                    )
+
+                out.extend((
+                    F0[s[0] >> 24] ^ F1[(s[a0] >> 16) & 255] ^ F2[(s[b0] >> 8) & 255] ^ F3[s[c0] & 255] ^ l0,
+                    F0[s[1] >> 24] ^ F1[(s[a1] >> 16) & 255] ^ F2[(s[b1] >> 8) & 255] ^ F3[s[c1] & 255] ^ l1,
+                    F0[s[2] >> 24] ^ F1[(s[a2] >> 16) & 255] ^ F2[(s[b2] >> 8) & 255] ^ F3[s[c2] & 255] ^ l2,
+                    F0[s[3] >> 24] ^ F1[(s[a3] >> 16) & 255] ^ F2[(s[b3] >> 8) & 255] ^ F3[s[c3] & 255] ^ l3
+                ))
+
+        else:
+            _, shift1, shift2, shift3 = shifts
+            columns = list(zip(range(Nb), shift1, shift2, shift3))
+
+            for i in range(0, len(words), Nb):
+                s = [w ^ k for w, k in zip(words[i:i+Nb], first_key)]
+
+                for round_key in inner_keys:
+                    s = [T0[s[j] >> 24] ^ T1[(s[a] >> 16) & 255] ^ T2[(s[b] >> 8) & 255] ^ T3[s[c] & 255] ^ k for (j, a, b, c), k in zip(columns, round_key)]
+
+                out.extend([F0[s[j] >> 24] ^ F1[(s[a] >> 16) & 255] ^ F2[(s[b] >> 8) & 255] ^ F3[s[c] & 255] ^ k for (j, a, b, c), k in zip(columns, last_key)])
+
+        return Bytes(struct.pack(f'>{len(out)}I', *out))
+
+
+    def encrypt_blocks(self, plaintext: bytes) -> Bytes:
+        """
+        Encrypts many blocks in one call (i.e. ECB without padding).
+
+        Parameters:
+            plaintext (bytes): Bytes-like object whose length is a multiple of the block size.
+
+        Returns:
+            Bytes: Resulting ciphertext.
+        """
+        return self._process_blocks(plaintext, self._enc_keys, TE, SBOX_SHIFTED, self._enc_shifts)
+
+
+    def decrypt_blocks(self, ciphertext: bytes) -> Bytes:
+        """
+        Decrypts many blocks in one call (i.e. ECB without padding).
+
+        Parameters:
+            ciphertext (bytes): Bytes-like object whose length is a multiple of the block size.
+
+        Returns:
+            Bytes: Resulting plaintext.
+        """
+        return self._process_blocks(ciphertext, self._dec_keys, TD, INV_SBOX_SHIFTED, self._dec_shifts)
 
 
 
     def yield_decrypt(self, ciphertext):
         state_matrix = Bytes.wrap(ciphertext).transpose(4)
 
-        reversed_round_keys = self.round_keys[::-1]
+        reversed_round_keys = self.round_keys[:self.num_rounds][::-1]
 
         for i in range(self.num_rounds):
             round_key = reversed_round_keys[i].transpose(4)
@@ -202,7 +331,7 @@ class Rijndael(BlockCipher):
         Returns:
             Bytes: Resulting plaintext.
         """
-        return list(self.yield_decrypt(ciphertext))[-1]
+        return self.decrypt_blocks(ciphertext)
 
 
     def shift_rows(self, state_matrix):
@@ -215,23 +344,8 @@ class Rijndael(BlockCipher):
         return b''.join([row.rrot(offsets[j] * 8) for j, row in enumerate(state_matrix.chunk(self._chunk_size))])
 
 
-    # https://en.wikipedia.org/wiki/Rijndael_MixColumns
     def _gmul(self, a, b):
-        p = 0
-
-        for _ in range(8):
-            if (b & 1) != 0:
-                p ^= a
-
-            hi_bi_set = (a & 0x80) != 0
-            a <<=1
-
-            if hi_bi_set:
-                a ^= 0x1B
-
-            b >>= 1
-
-        return p
+        return GMUL[a][b] if a in GMUL else gmul(a, b)
 
 
 
@@ -239,10 +353,12 @@ class Rijndael(BlockCipher):
         new_state = [None] * len(state_matrix)
         c0, c1, c2, c3 = [self._chunk_size * i for i in range(4)]
 
+        m = [GMUL[c] for c in mix_matrix]
+
         for i in range(self._chunk_size):
-            new_state[i + c0] = (self._gmul(mix_matrix[0], state_matrix[i + c0]) ^ self._gmul(mix_matrix[1], state_matrix[i + c1]) ^ self._gmul(mix_matrix[2], state_matrix[i + c2]) ^ self._gmul(mix_matrix[3], state_matrix[i + c3])) & 0xFF
-            new_state[i + c1] = (self._gmul(mix_matrix[4], state_matrix[i + c0]) ^ self._gmul(mix_matrix[5], state_matrix[i + c1]) ^ self._gmul(mix_matrix[6], state_matrix[i + c2]) ^ self._gmul(mix_matrix[7], state_matrix[i + c3])) & 0xFF
-            new_state[i + c2] = (self._gmul(mix_matrix[8], state_matrix[i + c0]) ^ self._gmul(mix_matrix[9], state_matrix[i + c1]) ^ self._gmul(mix_matrix[10], state_matrix[i + c2]) ^ self._gmul(mix_matrix[11], state_matrix[i + c3])) & 0xFF
-            new_state[i + c3] = (self._gmul(mix_matrix[12], state_matrix[i + c0]) ^ self._gmul(mix_matrix[13], state_matrix[i + c1]) ^ self._gmul(mix_matrix[14], state_matrix[i + c2]) ^ self._gmul(mix_matrix[15], state_matrix[i + c3])) & 0xFF
+            new_state[i + c0] = m[0][state_matrix[i + c0]] ^ m[1][state_matrix[i + c1]] ^ m[2][state_matrix[i + c2]] ^ m[3][state_matrix[i + c3]]
+            new_state[i + c1] = m[4][state_matrix[i + c0]] ^ m[5][state_matrix[i + c1]] ^ m[6][state_matrix[i + c2]] ^ m[7][state_matrix[i + c3]]
+            new_state[i + c2] = m[8][state_matrix[i + c0]] ^ m[9][state_matrix[i + c1]] ^ m[10][state_matrix[i + c2]] ^ m[11][state_matrix[i + c3]]
+            new_state[i + c3] = m[12][state_matrix[i + c0]] ^ m[13][state_matrix[i + c1]] ^ m[14][state_matrix[i + c2]] ^ m[15][state_matrix[i + c3]]
 
         return new_state
@@ -1,9 +1,8 @@
-from samson.utilities.manipulation import get_blocks
 from samson.utilities.bytes import Bytes
 from samson.core.metadata import ConstructionType
 from samson.core.primitives import Hash
 from types import FunctionType
-from copy import deepcopy
+from copy import copy
 
 
 def md_pad(msg: bytes, fakeLen: int=None, byteorder: str='little', bit_size: int=64, encoded_size_length: int=None) -> bytes:
@@ -28,10 +27,18 @@ class MerkleDamgardConstruction(Hash):
     """
     An iterative construction for building collision-resistant cryptographic hash functions from collision-resistant
     one-way compression functions. Used in MD4, MD5, SHA1, SHA2, RIPEMD, and more.
+
+    Besides the one-shot `hash`, the object keeps a running state for hashlib-style incremental hashing with
+    `update`, `copy` and `digest`. Only the chaining value and a partial block are kept, so arbitrarily long inputs
+    hash in constant memory.
     """
 
     CONSTRUCTION_TYPES = [ConstructionType.MERKLE_DAMGARD]
 
+    # Hashes with a word-oriented core set this to (state struct, core), where `core(words, data, end)` compresses
+    # the blocks of `data[:end]` starting from the chaining value unpacked into a tuple of ints
+    word_core = None
+
     def __init__(self, initial_state: bytes, compression_func: FunctionType, digest_size: int, block_size: int=64, endianness: str='big', encoded_size_length: int=None):
         """
         Parameters:
@@ -54,6 +61,7 @@ class MerkleDamgardConstruction(Hash):
         self.block_size          = block_size
         self.endianness          = endianness
         self.encoded_size_length = encoded_size_length
+        self.reset()
 
 
     def __reprdir__(self):
@@ -83,13 +91,39 @@ class MerkleDamgardConstruction(Hash):
         Returns:
             Bytes: Intermediate, hashed states.
         """
-        state = self.initial_state
+        state  = self.initial_state
+        padded = self.pad_func(message)
 
-        for block in get_blocks(self.pad_func(message), self.block_size):
-            state = self.compression_func(block, state)
+        for i in range(0, len(padded), self.block_size):
+            state = self.compression_func(padded[i:i+self.block_size], state)
             yield state
 
 
+    def process_blocks(self, state: Bytes, data: bytes, end: int) -> Bytes:
+        """
+        Compresses the blocks of `data[:end]` starting from `state`. `end` must be a multiple of the block size.
+
+        Parameters:
+            state (Bytes): Chaining value.
+            data  (bytes): Bytes-like data.
+            end     (int): Number of bytes of `data` to process.
+
+        Returns:
+            Bytes: New chaining value.
+        """
+        if self.word_core:
+            state_struct, core = self.word_core
+            return Bytes(state_struct.pack(*core(state_struct.unpack(state), data, end)))
+
+        block_size = self.block_size
+        compress   = self.compression_func
+
+        for i in range(0, end, block_size):
+            state = compress(Bytes(data[i:i+block_size]), state)
+
+        return state
+
+
     def hash(self, message: bytes) -> Bytes:
         """
         Yields the final, hashed state of the `message`.
@@ -100,8 +134,103 @@ class MerkleDamgardConstruction(Hash):
         Returns:
             Bytes: Fully-hashed state.
         """
-        final_state = list(self.yield_state(message))[-1]
-        return final_state
+        padded = self.pad_func(message)
+        return self.output_func(self.process_blocks(self.initial_state, padded, len(padded)))
+
+
+    def output_func(self, state: Bytes) -> Bytes:
+        """
+        Derives the digest from the final chaining value.
+
+        Parameters:
+            state (Bytes): Final chaining value.
+
+        Returns:
+            Bytes: Digest.
+        """
+        return state
+
+
+    def reset(self) -> 'MerkleDamgardConstruction':
+        """
+        Resets the running state to `initial_state`.
+
+        Returns:
+            MerkleDamgardConstruction: Self, for chaining.
+        """
+        self.state   = self.initial_state
+        self._buffer = b''
+        self._length = 0
+        return self
+
+
+    def update(self, message: bytes) -> 'MerkleDamgardConstruction':
+        """
+        Absorbs `message` into the running state. Data is buffered until a full block is available.
+
+        Parameters:
+            message (bytes): Bytes-like data.
+
+        Returns:
+            MerkleDamgardConstruction: Self, for chaining.
+
+        Examples:
+            >>> from samson.hashes.sha2 import SHA256
+            >>> sha256 = SHA256()
+            >>> sha256.update(b'sam').update(b'son').digest() == SHA256().hash(b'samson')
+            True
+
+        """
+        data = self._buffer + bytes(message)
+        end  = len(data) - len(data) % self.block_size
+
+        if end:
+            self.state = self.process_blocks(self.state, data, end)
+
+        self._buffer  = data[end:]
+        self._length += len(message)
+        return self
+
+
+    def update_stream(self, in_file: 'BufferedIOBase', chunk_size: int=2**20) -> 'MerkleDamgardConstruction':
+        """
+        Absorbs a binary file object `chunk_size` bytes at a time.
+
+        Parameters:
+            in_file (BufferedIOBase): File object to read from.
+            chunk_size         (int): Number of bytes to read at once.
+
+        Returns:
+            MerkleDamgardConstruction: Self, for chaining.
+        """
+        chunk = in_file.read(chunk_size)
+        while chunk:
+            self.update(chunk)
+            chunk = in_file.read(chunk_size)
+
+        return self
+
+
+    def copy(self) -> 'MerkleDamgardConstruction':
+        """
+        Returns a copy of the hash object, including its running state. Useful for reusing the midstate of a common
+        prefix.
+
+        Returns:
+            MerkleDamgardConstruction: Copy.
+        """
+        return copy(self)
+
+
+    def digest(self) -> Bytes:
+        """
+        Returns the hash of the data absorbed so far without modifying the running state.
+
+        Returns:
+            Bytes: Digest.
+        """
+        padded = md_pad(self._buffer, self._length, self.endianness, bit_size=self.block_size, encoded_size_length=self.encoded_size_length)
+        return self.output_func(self.process_blocks(self.state, padded, len(padded)))
 
 
 
@@ -122,12 +251,12 @@ class MerkleDamgardConstruction(Hash):
         Returns:
             (Bytes, Bytes): Result formatted as (crafted input, forged hash).
         """
-        glue = md_pad(message, len(message) + secret_len, self.endianness, bit_size=self.block_size)[len(message):]
-
-        fake_len = secret_len + len(message) + len(glue) + len(bytes_to_append)
+        glue = md_pad(message, len(message) + secret_len, self.endianness, bit_size=self.block_size, encoded_size_length=self.encoded_size_length)[len(message):]
 
-        new_hash_obj = deepcopy(self)
-        new_hash_obj.initial_state = observed_output
-        new_hash_obj.pad_func = lambda msg: md_pad(msg, fake_len, self.endianness, bit_size=self.block_size)
+        # Resume from the observed chaining value as if the secret, message and glue had been absorbed
+        new_hash_obj = self.copy()
+        new_hash_obj.state   = Bytes.wrap(observed_output)
+        new_hash_obj._buffer = b''
+        new_hash_obj._length = secret_len + len(message) + len(glue)
 
-        return Bytes(message + glue + bytes_to_append), new_hash_obj.hash(bytes_to_append)
+        return Bytes(message + glue + bytes_to_append), new_hash_obj.update(bytes_to_append).digest()
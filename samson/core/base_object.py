@@ -50,6 +50,8 @@ def process_field(field):
 
 
 class BaseObject(object):
+    __slots__ = ()
+
     def __reprdir__(self):
         return self.__dict__.keys()
 
@@ -88,6 +88,80 @@ class KDF(Primitive):
         pass
 
 
+    def derive_many(self, passwords: list, *args, workers: int=1, chunksize: int=16, **kwargs) -> list:
+        """
+        Lazily derives keys for many `passwords` with the same parameters. With more than one worker, candidates are
+        streamed through a process pool `chunksize` at a time.
+
+        Parameters:
+            passwords (iter): Passwords to derive keys for.
+            *args     (args): Arguments passed to `derive` after the password (e.g. the salt).
+            workers    (int): Number of worker processes.
+            chunksize  (int): Number of passwords shipped to a worker per task.
+            **kwargs (kwargs): Keyword arguments passed to `derive`.
+
+        Returns:
+            generator: (password, key) pairs in input order.
+
+        Examples:
+            >>> from samson.kdfs.pbkdf2 import PBKDF2
+            >>> from samson.macs.hmac import HMAC
+            >>> from samson.hashes.sha2 import SHA256
+            >>> pbkdf2 = PBKDF2(HMAC.prf(SHA256()), 16, 10)
+            >>> [key.hex() for _, key in pbkdf2.derive_many([b'a', b'b'], b'salt')]
+            [<Bytes: b'5fbcea2463af5ba15a49d7426f6aa18e', byteorder='big'>, <Bytes: b'1b9a69f5345868b8a0c42558d068b399', byteorder='big'>]
+
+        """
+        derive = lambda password: (password, self.derive(password, *args, **kwargs))
+
+        if workers == 1:
+            return map(derive, passwords)
+
+        from samson.utilities.runtime import RUNTIME
+        from samson.utilities.executors import ProcessExecutor
+        return RUNTIME.get_executor(workers, ProcessExecutor, chunksize=chunksize).map(derive, passwords)
+
+
+    def crack(self, passwords: list, target: bytes, *args, workers: int=1, chunksize: int=16, **kwargs) -> bytes:
+        """
+        Searches `passwords` for the one deriving `target`. Workers compare against `target` themselves, so only the
+        hit crosses the process boundary, and the remaining candidates are cancelled once it is found.
+
+        Parameters:
+            passwords (iter): Candidate passwords (e.g. a wordlist).
+            target   (bytes): Captured derived key.
+            *args     (args): Arguments passed to `derive` after the password (e.g. the salt).
+            workers    (int): Number of worker processes.
+            chunksize  (int): Number of passwords shipped to a worker per task.
+            **kwargs (kwargs): Keyword arguments passed to `derive`.
+
+        Returns:
+            bytes: Matching password or None.
+
+        Examples:
+            >>> from samson.kdfs.pbkdf2 import PBKDF2
+            >>> from samson.macs.hmac import HMAC
+            >>> from samson.hashes.sha2 import SHA256
+            >>> pbkdf2 = PBKDF2(HMAC.prf(SHA256()), 16, 10)
+            >>> pbkdf2.crack([b'a', b'b', b'c'], pbkdf2.derive(b'b', b'salt'), b'salt')
+            b'b'
+
+        """
+        target = bytes(target)
+        check  = lambda password: password if bytes(self.derive(password, *args, **kwargs)) == target else None
+
+        if workers == 1:
+            for password in passwords:
+                if check(password) is not None:
+                    return password
+
+            return None
+
+        from samson.utilities.runtime import RUNTIME
+        from samson.utilities.executors import ProcessExecutor
+        return RUNTIME.get_executor(workers, ProcessExecutor).first(check, passwords, chunksize=chunksize)
+
+
 class Hash(Primitive):
     PRIMITIVE_TYPE     = PrimitiveType.HASH
     INPUT_SIZE         = SizeSpec(size_type=SizeType.ARBITRARY)
@@ -205,6 +279,98 @@ class StreamingBlockCipherMode(BlockCipherMode):
     BLOCK_SIZE  = SizeSpec(size_type=SizeType.SINGLE, sizes=8)
 
 
+    @staticmethod
+    def _xor_into(data: bytes, keystream: bytes, out: bytearray, offset: int=0):
+        length = len(data)
+        out[offset:offset+length] = (int.from_bytes(data, 'big') ^ int.from_bytes(keystream, 'big')).to_bytes(length, 'big')
+
+
+    def encrypt_into(self, data: bytes, out: bytearray=None) -> bytearray:
+        """
+        Encrypts `data` into `out`, continuing from where the last call left off. `out` may be `data` itself.
+
+        Parameters:
+            data    (bytes): Bytes-like object to be encrypted.
+            out (bytearray): Writable buffer at least as long as `data`. Allocated if not given.
+
+        Returns:
+            bytearray: `out`.
+        """
+        raise NotImplementedError()
+
+
+    def decrypt_into(self, data: bytes, out: bytearray=None) -> bytearray:
+        """
+        Decrypts `data` into `out`, continuing from where the last call left off. `out` may be `data` itself.
+
+        Parameters:
+            data    (bytes): Bytes-like object to be decrypted.
+            out (bytearray): Writable buffer at least as long as `data`. Allocated if not given.
+
+        Returns:
+            bytearray: `out`.
+        """
+        raise NotImplementedError()
+
+
+    def _prepare_out(self, data: bytes, out: bytearray) -> bytearray:
+        if out is None:
+            out = bytearray(len(data))
+
+        elif len(out) < len(data):
+            raise ValueError("Output buffer is shorter than the input")
+
+        return out
+
+
+    def _process_stream(self, process: 'FunctionType', in_file: 'BufferedIOBase', out_file: 'BufferedIOBase', chunk_size: int) -> int:
+        buffer = bytearray(chunk_size)
+        view   = memoryview(buffer)
+        total  = 0
+
+        while True:
+            read = in_file.readinto(buffer)
+            if not read:
+                break
+
+            chunk = view[:read]
+            process(chunk, chunk)
+            out_file.write(chunk)
+            total += read
+
+        return total
+
+
+    def encrypt_stream(self, in_file: 'BufferedIOBase', out_file: 'BufferedIOBase', chunk_size: int=2**20) -> int:
+        """
+        Encrypts a binary file object into another in place, `chunk_size` bytes at a time.
+
+        Parameters:
+            in_file  (BufferedIOBase): File object to read from (must support `readinto`).
+            out_file (BufferedIOBase): File object to write to.
+            chunk_size          (int): Number of bytes to process at once.
+
+        Returns:
+            int: Number of bytes processed.
+        """
+        return self._process_stream(self.encrypt_into, in_file, out_file, chunk_size)
+
+
+    def decrypt_stream(self, in_file: 'BufferedIOBase', out_file: 'BufferedIOBase', chunk_size: int=2**20) -> int:
+        """
+        Decrypts a binary file object into another in place, `chunk_size` bytes at a time.
+
+        Parameters:
+            in_file  (BufferedIOBase): File object to read from (must support `readinto`).
+            out_file (BufferedIOBase): File object to write to.
+            chunk_size          (int): Number of bytes to process at once.
+
+        Returns:
+            int: Number of bytes processed.
+        """
+        return self._process_stream(self.decrypt_into, in_file, out_file, chunk_size)
+
+
 class AuthenticatedCipher(EncryptionAlg):
     def verify_tag(self, tag: bytes, given_tag: bytes):
         from samson.utilities.runtime import RUNTIME
@@ -80,15 +80,28 @@ def url_b64_decode(bytestring: bytes) -> bytes:
 
 
 # https://en.wikipedia.org/wiki/Non-adjacent_form
-def to_NAF(input_arg: bytes) -> list:
+def to_NAF(input_arg: bytes, width: int=2) -> list:
     """
     Converts bytes/bytearray or int to Non-adjacent form (NAF).
 
     Parameters:
         input_arg (bytes): Raw bytes/integer.
+        width       (int): Window width. Widths greater than 2 produce the width-w NAF whose non-zero digits are odd and less than 2^(`width`-1) in magnitude.
     
     Returns:
         list: Sequence in NAF.
+
+    Examples:
+        >>> from samson.encoding.general import to_NAF
+        >>> to_NAF(7)
+        [1, 0, 0, -1]
+
+        >>> to_NAF(7, width=3)
+        [1, 0, 0, -1]
+
+        >>> to_NAF(1234, width=4)
+        [1, 0, 0, 0, 0, 7, 0, 0, 0, -7, 0]
+
     """
     if type(input_arg) is int:
         E = input_arg
@@ -97,16 +110,22 @@ def to_NAF(input_arg: bytes) -> list:
 
     z = []
 
-    i = 0
+    window = 1 << width
+    half   = window >> 1
+
     while E > 0:
-        if E % 2 == 1:
-            z.append(int(2 - (E % 4)))
-            E -= z[-1]
+        if E & 1:
+            digit = E & (window - 1)
+            if digit >= half:
+                digit -= window
+
+            z.append(digit)
+            E -= digit
         else:
             z.append(0)
 
-        E //= 2
-        i += 1
+        E >>= 1
+
     return z[::-1]
 
 
@@ -1,6 +1,5 @@
-from samson.utilities.manipulation import left_rotate
 from samson.constructions.merkle_damgard_construction import MerkleDamgardConstruction
-from samson.hashes.md5 import state_to_bytes, bytes_to_state
+from samson.hashes.md5 import state_to_bytes
 from samson.utilities.bytes import Bytes
 from samson.core.primitives import Primitive
 from samson.core.metadata import SizeSpec, SizeType
@@ -8,15 +7,6 @@ from samson.ace.decorators import register_primitive
 import struct
 
 
-def F(x,y,z):
-    return (x & y) | (~x & z)
-
-def G(x,y,z):
-    return (x & y) | (x & z) | (y & z)
-
-def H(x,y,z):
-    return x ^ y ^ z
-
 iv = [
         0x67452301,
         0xefcdab89,
@@ -24,41 +14,62 @@ iv = [
         0x10325476
     ]
 
+# (message word, rotation, constant) for each of the three rounds
+ROUNDS = [
+    [(k, s, 0) for k, s in zip(range(16), (3, 7, 11, 19)*4)],
+    [(4*(r % 4) + r//4, s, 0x5a827999) for r, s in zip(range(16), (3, 5, 9, 13)*4)],
+    [(k, s, 0x6ed9eba1) for k, s in zip((0, 8, 4, 12, 2, 10, 6, 14, 1, 9, 5, 13, 3, 11, 7, 15), (3, 9, 11, 15)*4)]
+]
 
+_BLOCK_STRUCT = struct.Struct('<16L')
+STATE_STRUCT  = struct.Struct('<4L')
 
-def compression_func(message, state):
-    X = list(struct.unpack("<16I", message) + (None,) * (80-16))
-    h = bytes_to_state(state)
-    last_state = [x for x in h]
 
-    # Round 1
-    s = (3,7,11,19)
-    for r in range(16):
-        i = (16-r)%4
-        k = r
-        h[i] = left_rotate((h[i] + F(h[(i+1)%4], h[(i+2)%4], h[(i+3)%4]) + X[k]) % 2**32, s[r%4])
 
+def compress_blocks(state: tuple, data: bytes, end: int) -> tuple:
+    """
+    Word-oriented MD4 core. Compresses the 64-byte blocks of `data[:end]`.
+
+    Parameters:
+        state (tuple): Chaining value as four 32-bit integers.
+        data  (bytes): Bytes-like data.
+        end     (int): Number of bytes of `data` to process.
+
+    Returns:
+        tuple: New chaining value.
+    """
+    h0, h1, h2, h3 = state
+    unpack = _BLOCK_STRUCT.unpack_from
+    M = 0xFFFFFFFF
+    R0, R1, R2 = ROUNDS
+
+    for offset in range(0, end, 64):
+        X = unpack(data, offset)
+        a, b, c, d = h0, h1, h2, h3
 
-    # Round 2
-    s = (3,5,9,13)
-    for r in range(16):
-        i = (16-r)%4
-        k = 4*(r%4) + r//4
-        h[i] = left_rotate((h[i] + G(h[(i+1)%4], h[(i+2)%4], h[(i+3)%4]) + X[k] + 0x5a827999) % 2**32, s[r%4])
+        for k, s, K in R0:
+            t = (a + (d ^ (b & (c ^ d))) + X[k]) & M
+            a, b, c, d = d, (t << s | t >> (32 - s)) & M, b, c
 
+        for k, s, K in R1:
+            t = (a + ((b & c) | (d & (b | c))) + X[k] + K) & M
+            a, b, c, d = d, (t << s | t >> (32 - s)) & M, b, c
 
-    # Round 3
-    s = (3,9,11,15)
-    k = (0,8,4,12,2,10,6,14,1,9,5,13,3,11,7,15)
-    for r in range(16):
-        i = (16-r)%4
-        h[i] = left_rotate((h[i] + H(h[(i+1)%4], h[(i+2)%4], h[(i+3)%4]) + X[k[r]] + 0x6ed9eba1) % 2**32, s[r%4])
+        for k, s, K in R2:
+            t = (a + (b ^ c ^ d) + X[k] + K) & M
+            a, b, c, d = d, (t << s | t >> (32 - s)) & M, b, c
 
-    new_state = []
-    for i,v in enumerate(h):
-        new_state.append((v + last_state[i]) % 2**32)
+        h0 = (h0 + a) & M
+        h1 = (h1 + b) & M
+        h2 = (h2 + c) & M
+        h3 = (h3 + d) & M
 
-    return Bytes(state_to_bytes(new_state))
+    return h0, h1, h2, h3
+
+
+
+def compression_func(message, state):
+    return Bytes(STATE_STRUCT.pack(*compress_blocks(STATE_STRUCT.unpack(state), message, 64)))
 
 
 @register_primitive()
@@ -69,6 +80,8 @@ class MD4(MerkleDamgardConstruction):
 
     OUTPUT_SIZE = SizeSpec(size_type=SizeType.SINGLE, sizes=128)
 
+    word_core = (STATE_STRUCT, compress_blocks)
+
     def __init__(self, initial_state: bytes=state_to_bytes(iv)):
         """
         Parameters:
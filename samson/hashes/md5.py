@@ -1,9 +1,9 @@
 from samson.constructions.merkle_damgard_construction import MerkleDamgardConstruction
-from samson.utilities.manipulation import left_rotate
 from samson.utilities.bytes import Bytes
 from samson.core.primitives import Primitive
 from samson.core.metadata import SizeSpec, SizeType, FrequencyType
 from samson.ace.decorators import register_primitive
+import struct
 import math
 
 # https://rosettacode.org/wiki/MD5/Implementation#Python
@@ -15,17 +15,16 @@ rotate_amounts = [7, 12, 17, 22, 7, 12, 17, 22, 7, 12, 17, 22, 7, 12, 17, 22,
 
 constants = [int(abs(math.sin(i+1)) * 2**32) & 0xFFFFFFFF for i in range(64)]
 
-functions = 16*[lambda b, c, d: (b & c) | (~b & d)] + \
-            16*[lambda b, c, d: (d & b) | (~d & c)] + \
-            16*[lambda b, c, d: b ^ c ^ d] + \
-            16*[lambda b, c, d: c ^ (b | ~d)]
-
 index_functions = 16*[lambda i: i] + \
                   16*[lambda i: (5*i + 1)%16] + \
                   16*[lambda i: (3*i + 5)%16] + \
                   16*[lambda i: (7*i)%16]
 
+# (constant, message word, rotation) for each of the four rounds
+ROUNDS = [[(constants[i], index_functions[i](i), rotate_amounts[i]) for i in range(r, r+16)] for r in range(0, 64, 16)]
 
+_BLOCK_STRUCT = struct.Struct('<16L')
+STATE_STRUCT  = struct.Struct('<4L')
 
 
 
@@ -39,25 +38,54 @@ def bytes_to_state(state_bytes):
 
 
 
-def compression_func(message, state):
-    new_state = bytes_to_state(state)
+def compress_blocks(state: tuple, data: bytes, end: int) -> tuple:
+    """
+    Word-oriented MD5 core. Compresses the 64-byte blocks of `data[:end]`.
+
+    Parameters:
+        state (tuple): Chaining value as four 32-bit integers.
+        data  (bytes): Bytes-like data.
+        end     (int): Number of bytes of `data` to process.
+
+    Returns:
+        tuple: New chaining value.
+    """
+    h0, h1, h2, h3 = state
+    unpack = _BLOCK_STRUCT.unpack_from
+    M = 0xFFFFFFFF
+    R0, R1, R2, R3 = ROUNDS
+
+    for offset in range(0, end, 64):
+        X = unpack(data, offset)
+        a, b, c, d = h0, h1, h2, h3
 
-    for chunk_ofst in range(0, len(message), 64):
-        a, b, c, d = new_state
-        chunk = message[chunk_ofst:chunk_ofst+64]
+        for k, g, s in R0:
+            t = (a + (d ^ (b & (c ^ d))) + k + X[g]) & M
+            a, b, c, d = d, (b + (t << s | t >> (32 - s))) & M, b, c
 
-        for i in range(64):
-            f = functions[i](b, c, d)
-            g = index_functions[i](i)
-            to_rotate = a + f + constants[i] + int.from_bytes(chunk[4*g:4*g+4], byteorder='little')
-            new_b = (b + left_rotate(to_rotate, rotate_amounts[i])) & 0xFFFFFFFF
-            a, b, c, d = d, new_b, b, c
+        for k, g, s in R1:
+            t = (a + (c ^ (d & (b ^ c))) + k + X[g]) & M
+            a, b, c, d = d, (b + (t << s | t >> (32 - s))) & M, b, c
 
-        for i, val in enumerate([a, b, c, d]):
-            new_state[i] += val
-            new_state[i] &= 0xFFFFFFFF
+        for k, g, s in R2:
+            t = (a + (b ^ c ^ d) + k + X[g]) & M
+            a, b, c, d = d, (b + (t << s | t >> (32 - s))) & M, b, c
 
-    return Bytes(state_to_bytes(new_state))
+        for k, g, s in R3:
+            t = (a + (c ^ (b | (~d & M))) + k + X[g]) & M
+            a, b, c, d = d, (b + (t << s | t >> (32 - s))) & M, b, c
+
+        h0 = (h0 + a) & M
+        h1 = (h1 + b) & M
+        h2 = (h2 + c) & M
+        h3 = (h3 + d) & M
+
+    return h0, h1, h2, h3
+
+
+
+def compression_func(message, state):
+    return Bytes(STATE_STRUCT.pack(*compress_blocks(STATE_STRUCT.unpack(state), message, len(message) - len(message) % 64)))
 
 
 @register_primitive()
@@ -69,6 +97,8 @@ class MD5(MerkleDamgardConstruction):
     OUTPUT_SIZE     = SizeSpec(size_type=SizeType.SINGLE, sizes=128)
     USAGE_FREQUENCY = FrequencyType.PROLIFIC
 
+    word_core = (STATE_STRUCT, compress_blocks)
+
     def __init__(self, initial_state: bytes=state_to_bytes([0x67452301, 0xefcdab89, 0x98badcfe, 0x10325476])):
         """
         Parameters:
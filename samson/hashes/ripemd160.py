@@ -1,9 +1,9 @@
 from samson.utilities.bytes import Bytes
-from samson.utilities.manipulation import left_rotate
 from samson.constructions.merkle_damgard_construction import MerkleDamgardConstruction
 from samson.core.primitives import Primitive
 from samson.core.metadata import SizeSpec, SizeType
 from samson.ace.decorators import register_primitive
+import struct
 
 # http://cacr.uwaterloo.ca/hac/about/chap9.pdf
 RL = [
@@ -40,15 +40,6 @@ SR = [
 ]
 
 
-F1 = lambda x, y, z: x ^ y ^ z
-F2 = lambda x, y, z: (x & y) | (~x & z)
-F3 = lambda x, y, z: (x | ~y) ^ z
-F4 = lambda x, y, z: (x & z) | (y & ~z)
-F5 = lambda x, y, z: x ^ (y | ~z)
-
-FL = [F1, F2, F3, F4, F5]
-FR = [F5, F4, F3, F2, F1]
-
 KL = [0x00000000, 0x5A827999, 0x6ED9EBA1, 0x8F1BBCDC, 0xA953FD4E]
 KR = [0x50A28BE6, 0x5C4DD124, 0x6D703EF3, 0x7A6D76E9, 0x00000000]
 
@@ -56,35 +47,70 @@ INIT_STATE = Bytes(int.to_bytes(0x0123456789ABCDEFFEDCBA9876543210F0E1D2C3, 20,
 
 
 
-def COMPRESS(message, state):
-    # The authors of RIPEMD160 couldn't decide on whether to use big or little endian, so they used both!
-    # RIPEMD160 takes in bytes as big endian but operates and outputs bytes of little endian. Man, was this 'fun.'
+# (message word, rotation) for each round of the left and right lines
+_LEFT  = [list(zip(RL[r], SL[r])) for r in range(5)]
+_RIGHT = [list(zip(RR[r], SR[r])) for r in range(5)]
+
+_BLOCK_STRUCT = struct.Struct('<16L')
+STATE_STRUCT  = struct.Struct('<5L')
 
-    h = [chunk.to_int() for chunk in state.chunk(4)]
-    msg_chunks = [chunk[::-1].to_int() for chunk in Bytes.wrap(message, byteorder='big').chunk(4)]
 
-    AL = AR = h[0]
-    BL = BR = h[1]
-    CL = CR = h[2]
-    DL = DR = h[3]
-    EL = ER = h[4]
+def _f(j: int, x: int, y: int, z: int) -> int:
+    if j == 0:
+        return x ^ y ^ z
+    elif j == 1:
+        return (x & y) | (~x & z)
+    elif j == 2:
+        return (x | ~y) ^ z
+    elif j == 3:
+        return (x & z) | (y & ~z)
+    else:
+        return x ^ (y | ~z)
 
-    for curr_round in range(5):
-        for w in range(16):
-            T = left_rotate(AL + FL[curr_round](BL, CL, DL) + msg_chunks[RL[curr_round][w]] + KL[curr_round], SL[curr_round][w]) + EL
-            AL = EL & 0xFFFFFFFF; EL = DL & 0xFFFFFFFF; DL = left_rotate(CL, 10); CL = BL & 0xFFFFFFFF; BL = T & 0xFFFFFFFF
 
-            T = left_rotate(AR + FR[curr_round](BR, CR, DR) + msg_chunks[RR[curr_round][w]] + KR[curr_round], SR[curr_round][w]) + ER
-            AR = ER & 0xFFFFFFFF; ER = DR & 0xFFFFFFFF; DR = left_rotate(CR, 10); CR = BR & 0xFFFFFFFF; BR = T & 0xFFFFFFFF
 
-    T = (h[1] + CL + DR) & 0xFFFFFFFF
-    h[1] = (h[2] + DL + ER) & 0xFFFFFFFF
-    h[2] = (h[3] + EL + AR) & 0xFFFFFFFF
-    h[3] = (h[4] + AL + BR) & 0xFFFFFFFF
-    h[4] = (h[0] + BL + CR) & 0xFFFFFFFF
-    h[0] = T
+def compress_blocks(state: tuple, data: bytes, end: int) -> tuple:
+    """
+    Word-oriented RIPEMD-160 core. Compresses the 64-byte blocks of `data[:end]`.
+
+    Parameters:
+        state (tuple): Chaining value as five 32-bit integers.
+        data  (bytes): Bytes-like data.
+        end     (int): Number of bytes of `data` to process.
+
+    Returns:
+        tuple: New chaining value.
+    """
+    h0, h1, h2, h3, h4 = state
+    unpack = _BLOCK_STRUCT.unpack_from
+    M = 0xFFFFFFFF
+
+    for offset in range(0, end, 64):
+        X = unpack(data, offset)
+        al, bl, cl, dl, el = h0, h1, h2, h3, h4
+        ar, br, cr, dr, er = h0, h1, h2, h3, h4
 
-    return sum([Bytes(state, 'little').zfill(4) for state in h])
+        for j in range(5):
+            kl, kr = KL[j], KR[j]
+            for (xl, sl), (xr, sr) in zip(_LEFT[j], _RIGHT[j]):
+                t = (al + _f(j, bl, cl, dl) + X[xl] + kl) & M
+                t = ((t << sl | t >> (32 - sl)) + el) & M
+                al, el, dl, cl, bl = el, dl, (cl << 10 | cl >> 22) & M, bl, t
+
+                t = (ar + _f(4 - j, br, cr, dr) + X[xr] + kr) & M
+                t = ((t << sr | t >> (32 - sr)) + er) & M
+                ar, er, dr, cr, br = er, dr, (cr << 10 | cr >> 22) & M, br, t
+
+        h0, h1, h2, h3, h4 = (h1 + cl + dr) & M, (h2 + dl + er) & M, (h3 + el + ar) & M, (h4 + al + br) & M, (h0 + bl + cr) & M
+
+    return h0, h1, h2, h3, h4
+
+
+
+def COMPRESS(message, state):
+    # The authors of RIPEMD160 couldn't decide on whether to use big or little endian, so they used both!
+    # RIPEMD160 takes in bytes as big endian but operates and outputs bytes of little endian. Man, was this 'fun.'
+    return Bytes(STATE_STRUCT.pack(*compress_blocks(STATE_STRUCT.unpack(state), message, 64)))
 
 
 @register_primitive()
@@ -96,6 +122,8 @@ class RIPEMD160(MerkleDamgardConstruction):
 
     OUTPUT_SIZE = SizeSpec(size_type=SizeType.SINGLE, sizes=160)
 
+    word_core = (STATE_STRUCT, compress_blocks)
+
     def __init__(self, initial_state: bytes=INIT_STATE):
         """
         Parameters:
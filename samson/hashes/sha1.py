@@ -1,6 +1,5 @@
 # Ref: https://github.com/ajalt/python-sha1/blob/master/sha1.py
 import struct
-from samson.utilities.manipulation import left_rotate
 from samson.utilities.bytes import Bytes
 from samson.constructions.merkle_damgard_construction import MerkleDamgardConstruction
 from samson.core.primitives import Primitive
@@ -8,57 +7,63 @@ from samson.core.metadata import SizeSpec, SizeType, FrequencyType
 from samson.ace.decorators import register_primitive
 
 
-def compression_func(chunk, state):
-    """Process a chunk of data and return the new digest variables."""
-    assert len(chunk) == 64
+_BLOCK_STRUCT = struct.Struct('>16L')
+STATE_STRUCT  = struct.Struct('>5L')
+
+
+def compress_blocks(state: tuple, data: bytes, end: int) -> tuple:
+    """
+    Word-oriented SHA-1 core. Compresses the 64-byte blocks of `data[:end]`.
+
+    Parameters:
+        state (tuple): Chaining value as five 32-bit integers.
+        data  (bytes): Bytes-like data.
+        end     (int): Number of bytes of `data` to process.
 
-    w = [0] * 80
+    Returns:
+        tuple: New chaining value.
+    """
+    h0, h1, h2, h3, h4 = state
+    unpack = _BLOCK_STRUCT.unpack_from
+    M = 0xFFFFFFFF
 
-    # Break chunk into sixteen 4-byte big-endian words w[i]
-    for i in range(16):
-        w[i] = struct.unpack(b'>I', chunk[i*4:i*4 + 4])[0]
+    for offset in range(0, end, 64):
+        # Break chunk into sixteen 4-byte big-endian words and extend them into eighty
+        w = list(unpack(data, offset))
+        for i in range(16, 80):
+            x = w[i-3] ^ w[i-8] ^ w[i-14] ^ w[i-16]
+            w.append((x << 1 | x >> 31) & M)
 
-    # Extend the sixteen 4-byte words into eighty 4-byte words
-    for i in range(16, 80):
-        w[i] = left_rotate(w[i-3] ^ w[i-8] ^ w[i-14] ^ w[i-16], 1)
+        a, b, c, d, e = h0, h1, h2, h3, h4
 
-    # Initialize hash value for this chunk
-    h0, h1, h2, h3, h4 = bytes_to_state(state)
+        # Use alternative 1 for f from FIPS PB 180-1 to avoid bitwise not
+        for i in range(0, 20):
+            a, b, c, d, e = ((a << 5 | a >> 27) & M) + (d ^ (b & (c ^ d))) + e + 0x5A827999 + w[i] & M, a, (b << 30 | b >> 2) & M, c, d
 
-    a = h0
-    b = h1
-    c = h2
-    d = h3
-    e = h4
+        for i in range(20, 40):
+            a, b, c, d, e = ((a << 5 | a >> 27) & M) + (b ^ c ^ d) + e + 0x6ED9EBA1 + w[i] & M, a, (b << 30 | b >> 2) & M, c, d
 
-    for i in range(80):
-        if 0 <= i <= 19:
-            # Use alternative 1 for f from FIPS PB 180-1 to avoid bitwise not
-            f = d ^ (b & (c ^ d))
-            k = 0x5A827999
-        elif 20 <= i <= 39:
-            f = b ^ c ^ d
-            k = 0x6ED9EBA1
-        elif 40 <= i <= 59:
-            f = (b & c) | (b & d) | (c & d)
-            k = 0x8F1BBCDC
-        elif 60 <= i <= 79:
-            f = b ^ c ^ d
-            k = 0xCA62C1D6
+        for i in range(40, 60):
+            a, b, c, d, e = ((a << 5 | a >> 27) & M) + ((b & c) | (d & (b | c))) + e + 0x8F1BBCDC + w[i] & M, a, (b << 30 | b >> 2) & M, c, d
 
-        a, b, c, d, e = ((left_rotate(a, 5) + f + e + k + w[i]) & 0xffffffff,
-                        a, left_rotate(b, 30), c, d)
+        for i in range(60, 80):
+            a, b, c, d, e = ((a << 5 | a >> 27) & M) + (b ^ c ^ d) + e + 0xCA62C1D6 + w[i] & M, a, (b << 30 | b >> 2) & M, c, d
 
-    # Add this chunk's hash to result so far
-    h0 = (h0 + a) & 0xffffffff
-    h1 = (h1 + b) & 0xffffffff
-    h2 = (h2 + c) & 0xffffffff
-    h3 = (h3 + d) & 0xffffffff
-    h4 = (h4 + e) & 0xffffffff
+        # Add this chunk's hash to result so far
+        h0 = (h0 + a) & M
+        h1 = (h1 + b) & M
+        h2 = (h2 + c) & M
+        h3 = (h3 + d) & M
+        h4 = (h4 + e) & M
 
-    state = [h0, h1, h2, h3, h4]
+    return h0, h1, h2, h3, h4
 
-    return Bytes(state_to_bytes(state))
+
+
+def compression_func(chunk, state):
+    """Process a chunk of data and return the new digest variables."""
+    assert len(chunk) == 64
+    return Bytes(STATE_STRUCT.pack(*compress_blocks(STATE_STRUCT.unpack(state), chunk, 64)))
 
 
 
@@ -80,6 +85,8 @@ class SHA1(MerkleDamgardConstruction):
     OUTPUT_SIZE     = SizeSpec(size_type=SizeType.SINGLE, sizes=160)
     USAGE_FREQUENCY = FrequencyType.PROLIFIC
 
+    word_core = (STATE_STRUCT, compress_blocks)
+
     def __init__(self, initial_state: bytes=state_to_bytes([0x67452301, 0xefcdab89, 0x98badcfe, 0x10325476, 0xC3D2E1F0])):
         """
         Parameters:
@@ -1,9 +1,11 @@
 from samson.constructions.merkle_damgard_construction import MerkleDamgardConstruction
 from samson.utilities.bytes import Bytes
-from samson.utilities.manipulation import right_rotate, get_blocks
 from samson.core.primitives import Primitive
 from samson.core.metadata import ConstructionType, SizeSpec, SizeType, FrequencyType
 from samson.ace.decorators import register_primitive
+from functools import lru_cache
+from types import FunctionType
+import struct
 import math
 
 # https://en.wikipedia.org/wiki/SHA-2
@@ -46,6 +48,60 @@ K_512 = [
 ]
 
 
+@lru_cache(maxsize=None)
+def _make_core(word_size: int, rounds: int, rot: tuple, k: tuple) -> (struct.Struct, FunctionType):
+    """
+    Builds a word-oriented SHA-2 core for the given parameters. The chaining value stays a tuple of ints across
+    blocks, each block is unpacked with a single `struct` call, and the rotations are inlined.
+
+    Parameters:
+        word_size (int): Word size in bits.
+        rounds    (int): Number of compression rounds.
+        rot     (tuple): Rotation constants.
+        k       (tuple): `k` constants.
+
+    Returns:
+        (Struct, func): Chaining value struct and `compress_blocks(state, data, end)`.
+    """
+    M      = (1 << word_size) - 1
+    w      = word_size
+    fmt    = 'L' if word_size == 32 else 'Q'
+    unpack = struct.Struct(f'>16{fmt}').unpack_from
+    step   = 2 * word_size
+    r0, r1, r2, r3, r4, r5, r6, r7, r8, r9, r10, r11 = rot
+
+    def compress_blocks(state: tuple, data: bytes, end: int) -> tuple:
+        h0, h1, h2, h3, h4, h5, h6, h7 = state
+
+        for offset in range(0, end, step):
+            W = list(unpack(data, offset))
+            for i in range(16, rounds):
+                x  = W[i-15]
+                y  = W[i-2]
+                s0 = ((x >> r0 | x << (w - r0)) ^ (x >> r1 | x << (w - r1)) ^ (x >> r2)) & M
+                s1 = ((y >> r3 | y << (w - r3)) ^ (y >> r4 | y << (w - r4)) ^ (y >> r5)) & M
+                W.append((W[i-16] + s0 + W[i-7] + s1) & M)
+
+            a, b, c, d, e, f, g, h = h0, h1, h2, h3, h4, h5, h6, h7
+            for k_i, w_i in zip(k, W):
+                t1 = h + (((e >> r6 | e << (w - r6)) ^ (e >> r7 | e << (w - r7)) ^ (e >> r8 | e << (w - r8))) & M) + (g ^ (e & (f ^ g))) + k_i + w_i
+                t2 = (((a >> r9 | a << (w - r9)) ^ (a >> r10 | a << (w - r10)) ^ (a >> r11 | a << (w - r11))) & M) + ((a & b) | (c & (a | b)))
+                h, g, f, e, d, c, b, a = g, f, e, (d + t1) & M, c, b, a, (t1 + t2) & M
+
+            h0 = (h0 + a) & M
+            h1 = (h1 + b) & M
+            h2 = (h2 + c) & M
+            h3 = (h3 + d) & M
+            h4 = (h4 + e) & M
+            h5 = (h5 + f) & M
+            h6 = (h6 + g) & M
+            h7 = (h7 + h) & M
+
+        return h0, h1, h2, h3, h4, h5, h6, h7
+
+    return struct.Struct(f'>8{fmt}'), compress_blocks
+
+
 class SHA2(MerkleDamgardConstruction):
     """
     SHA2 hash function base class.
@@ -78,6 +134,19 @@ class SHA2(MerkleDamgardConstruction):
         self.rounds = rounds
         self.rot = rot
         self.k = k
+        self.word_core = _make_core(state_size * 8, rounds, tuple(rot), tuple(k[:rounds]))
+
+
+    # The core is a closure over a `Struct`, so it's rebuilt instead of pickled (e.g. for process pools)
+    def __getstate__(self):
+        state = dict(self.__dict__)
+        del state['word_core']
+        return state
+
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self.word_core = _make_core(self.state_size * 8, self.rounds, tuple(self.rot), tuple(self.k[:self.rounds]))
 
 
 
@@ -99,6 +168,19 @@ class SHA2(MerkleDamgardConstruction):
         return ['initial_state', 'block_size', 'digest_size']
 
 
+    def output_func(self, state: Bytes) -> Bytes:
+        """
+        Truncates the final state to the digest size.
+
+        Parameters:
+            state (Bytes): Final chaining value.
+
+        Returns:
+            Bytes: Digest.
+        """
+        return state[:self.digest_size]
+
+
     def compression_func(self, block: bytes, state: bytes) -> Bytes:
         """
         SHA-2 compression function.
@@ -110,55 +192,8 @@ class SHA2(MerkleDamgardConstruction):
         Returns:
             Bytes: Hash output.
         """
-        bit_mask = 0xFFFFFFFF if self.state_size == 4 else 0xFFFFFFFFFFFFFFFF
-        bit_size = self.state_size * 8
-
-        state = [int.from_bytes(chunk, 'big') for chunk in state.chunk(self.state_size)]
-        w = [int.from_bytes(b, 'big') for b in get_blocks(block, self.state_size)] + ([None] * (self.rounds - 16))
-
-        for i in range(16, self.rounds):
-            s0 = right_rotate(w[i-15], self.rot[0], bit_size) ^ right_rotate(w[i-15], self.rot[1], bit_size) ^ (w[i-15] >> self.rot[2])
-            s1 = right_rotate(w[i-2], self.rot[3], bit_size) ^ right_rotate(w[i-2], self.rot[4], bit_size) ^ (w[i-2] >> self.rot[5])
-            w[i] = (w[i-16] + s0 + w[i-7] + s1) & bit_mask
-
-
-        a = state[0]
-        b = state[1]
-        c = state[2]
-        d = state[3]
-        e = state[4]
-        f = state[5]
-        g = state[6]
-        h = state[7]
-
-        for i in range(self.rounds):
-            S1 = right_rotate(e,  self.rot[6], bit_size) ^ right_rotate(e, self.rot[7], bit_size) ^ right_rotate(e, self.rot[8], bit_size)
-            ch = g ^ (e & (f ^ g))
-            temp1 = (h + S1 + ch + self.k[i] + w[i])
-            S0 = right_rotate(a, self.rot[9], bit_size) ^ right_rotate(a, self.rot[10], bit_size) ^ right_rotate(a, self.rot[11], bit_size)
-            maj = (a & b) ^ (a & c) ^ (b & c)
-            temp2 = (S0 + maj)
-
-            h = g
-            g = f
-            f = e
-            e = (d + temp1) & bit_mask
-            d = c
-            c = b
-            b = a
-            a = (temp1 + temp2) & bit_mask
-
-
-        state[0] += a
-        state[1] += b
-        state[2] += c
-        state[3] += d
-        state[4] += e
-        state[5] += f
-        state[6] += g
-        state[7] += h
-
-        return Bytes(b''.join([int.to_bytes(h_i & bit_mask, self.state_size, 'big') for h_i in state]))
+        state_struct, core = self.word_core
+        return Bytes(state_struct.pack(*core(state_struct.unpack(state), block, self.block_size)))
 
 
 @register_primitive()
@@ -266,3 +301,16 @@ class SHA512(SHA2):
         """
         final_state = super().hash(message)
         return final_state[:math.ceil((self.trunc or 512) / 8)]
+
+
+    def output_func(self, state: Bytes) -> Bytes:
+        """
+        Truncates the final state for SHA-512/t.
+
+        Parameters:
+            state (Bytes): Final chaining value.
+
+        Returns:
+            Bytes: Digest.
+        """
+        return state[:math.ceil((self.trunc or 512) / 8)]
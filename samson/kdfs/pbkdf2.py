@@ -9,7 +9,7 @@ class PBKDF2(KDF):
     def __init__(self, hash_fn: FunctionType, desired_len: int, num_iters: int):
         """
         Parameters:
-            hash_fn    (func): Function that takes in a key and input bytes and returns them hashed.
+            hash_fn    (func): Function that takes in a key and input bytes and returns them hashed (e.g. `HMAC.prf(SHA256())`).
             desired_len (int): Desired output length.
             num_iters   (int): Number of iterations to perform.
         """
@@ -40,13 +40,14 @@ class PBKDF2(KDF):
 
         output = Bytes(b'')
         for i in range(1, num_blocks + 1):
-            xor_sum = Bytes(b'').zfill(hash_len)
+            xor_sum = 0
             last    = salt + Bytes(i).zfill(4)
 
+            # Accumulate as an int to avoid building a `Bytes` per iteration
             for _ in range(self.num_iters):
                 last     = self.hash_fn(password, last)
-                xor_sum ^= last
+                xor_sum ^= int.from_bytes(last, 'big')
 
-            output += xor_sum
+            output += Bytes(xor_sum.to_bytes(hash_len, 'big'))
 
         return output[:self.desired_len]
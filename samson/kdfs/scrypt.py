@@ -2,49 +2,157 @@ from samson.utilities.bytes import Bytes
 from samson.kdfs.pbkdf2 import PBKDF2
 from samson.macs.hmac import HMAC
 from samson.hashes.sha2 import SHA256
-from samson.stream_ciphers.salsa import Salsa
 from samson.core.primitives import KDF, Primitive
 from samson.ace.decorators import register_primitive
 from types import FunctionType
+from array import array
+import struct
 
-NULL_SALSA = Salsa(key=Bytes(b'').zfill(8), nonce=Bytes(b'').zfill(8), rounds=8)
+# `V` is stored as 32-bit words
+_WORD = 'I' if array('I').itemsize == 4 else 'L'
 
-def BlockMix(B):
-    r = len(B) // 128
-    B_arr = B.chunk(64)
 
-    X = B_arr[-1]
-    Y = []
-    for i in range(2*r):
-        T = X ^ B_arr[i]
-        T.byteorder = 'little'
+def salsa20_8(B: list) -> list:
+    """
+    Salsa20/8 core on a list of sixteen 32-bit words.
+
+    Parameters:
+        B (list): Input words.
 
-        X = NULL_SALSA.full_round(0, state=[x.int() for x in T.chunk(4)])
-        Y.append(X)
+    Returns:
+        list: Output words.
+    """
+    x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12, x13, x14, x15 = B
+    M = 0xFFFFFFFF
 
+    for _ in range(4):
+        # Column round
+        t = (x0 + x12) & M;  x4  ^= (t << 7  | t >> 25) & M
+        t = (x4 + x0) & M;   x8  ^= (t << 9  | t >> 23) & M
+        t = (x8 + x4) & M;   x12 ^= (t << 13 | t >> 19) & M
+        t = (x12 + x8) & M;  x0  ^= (t << 18 | t >> 14) & M
 
-    Y_ret = b''.join([_ for _ in Y[::2]]) + b''.join([_ for _ in Y[1::2]])
-    return Bytes(Y_ret)
+        t = (x5 + x1) & M;   x9  ^= (t << 7  | t >> 25) & M
+        t = (x9 + x5) & M;   x13 ^= (t << 9  | t >> 23) & M
+        t = (x13 + x9) & M;  x1  ^= (t << 13 | t >> 19) & M
+        t = (x1 + x13) & M;  x5  ^= (t << 18 | t >> 14) & M
 
+        t = (x10 + x6) & M;  x14 ^= (t << 7  | t >> 25) & M
+        t = (x14 + x10) & M; x2  ^= (t << 9  | t >> 23) & M
+        t = (x2 + x14) & M;  x6  ^= (t << 13 | t >> 19) & M
+        t = (x6 + x2) & M;   x10 ^= (t << 18 | t >> 14) & M
+
+        t = (x15 + x11) & M; x3  ^= (t << 7  | t >> 25) & M
+        t = (x3 + x15) & M;  x7  ^= (t << 9  | t >> 23) & M
+        t = (x7 + x3) & M;   x11 ^= (t << 13 | t >> 19) & M
+        t = (x11 + x7) & M;  x15 ^= (t << 18 | t >> 14) & M
+
+        # Row round
+        t = (x0 + x3) & M;   x1  ^= (t << 7  | t >> 25) & M
+        t = (x1 + x0) & M;   x2  ^= (t << 9  | t >> 23) & M
+        t = (x2 + x1) & M;   x3  ^= (t << 13 | t >> 19) & M
+        t = (x3 + x2) & M;   x0  ^= (t << 18 | t >> 14) & M
+
+        t = (x5 + x4) & M;   x6  ^= (t << 7  | t >> 25) & M
+        t = (x6 + x5) & M;   x7  ^= (t << 9  | t >> 23) & M
+        t = (x7 + x6) & M;   x4  ^= (t << 13 | t >> 19) & M
+        t = (x4 + x7) & M;   x5  ^= (t << 18 | t >> 14) & M
+
+        t = (x10 + x9) & M;  x11 ^= (t << 7  | t >> 25) & M
+        t = (x11 + x10) & M; x8  ^= (t << 9  | t >> 23) & M
+        t = (x8 + x11) & M;  x9  ^= (t << 13 | t >> 19) & M
+        t = (x9 + x8) & M;   x10 ^= (t << 18 | t >> 14) & M
+
+        t = (x15 + x14) & M; x12 ^= (t << 7  | t >> 25) & M
+        t = (x12 + x15) & M; x13 ^= (t << 9  | t >> 23) & M
+        t = (x13 + x12) & M; x14 ^= (t << 13 | t >> 19) & M
+        t = (x14 + x13) & M; x15 ^= (t << 18 | t >> 14) & M
+
+    return [(a + b) & M for a, b in zip((x0, x1, x2, x3, x4, x5, x6, x7, x8, x9, x10, x11, x12, x13, x14, x15), B)]
 
 
-def ROMix(block, iterations):
-    X = block
-    V = []
-    for _ in range(iterations):
-        X.byteorder = 'little'
-        V.append(X)
-        X = BlockMix(X)
 
 
-    for _ in range(iterations):
-        X.byteorder = 'little'
-        j = X[-64:].int() % iterations
-        X = BlockMix(X ^ V[j])
+def block_mix_words(B: list, r: int) -> list:
+    """
+    BlockMix on a list of `32*r` little-endian 32-bit words.
+
+    Parameters:
+        B (list): Input words.
+        r  (int): Block size factor.
+
+    Returns:
+        list: Output words.
+    """
+    X    = B[-16:]
+    even = []
+    odd  = []
+
+    for i in range(0, 32*r, 32):
+        X = salsa20_8([x ^ b for x, b in zip(X, B[i:i+16])])
+        even += X
+
+        X = salsa20_8([x ^ b for x, b in zip(X, B[i+16:i+32])])
+        odd += X
+
+    return even + odd
+
+
+
+def romix_words(B: list, N: int, r: int) -> list:
+    """
+    ROMix on a list of `32*r` little-endian 32-bit words. `V` is kept in a single flat `array` of words instead
+    of `N` separate objects.
+
+    Parameters:
+        B (list): Input words.
+        N  (int): Cost.
+        r  (int): Block size factor.
+
+    Returns:
+        list: Output words.
+    """
+    width = 32*r
+    last  = width - 16
+    V     = array(_WORD, bytes(4*width*N))
+    X     = B
+
+    for i in range(0, width*N, width):
+        V[i:i+width] = array(_WORD, X)
+        X = block_mix_words(X, r)
+
+    for _ in range(N):
+        # Integerify. For the usual power-of-two costs only the low word(s) matter
+        if N & (N - 1):
+            j = int.from_bytes(struct.pack('<16L', *X[last:]), 'little') % N
+        else:
+            j = (X[last] | X[last+1] << 32) & (N - 1)
+
+        offset = j*width
+        X = block_mix_words([x ^ v for x, v in zip(X, V[offset:offset+width])], r)
 
     return X
 
 
+
+def _to_words(block: bytes) -> list:
+    return list(struct.unpack(f'<{len(block) // 4}L', block))
+
+
+def _from_words(words: list) -> Bytes:
+    return Bytes(struct.pack(f'<{len(words)}L', *words), 'little')
+
+
+
+def BlockMix(B):
+    return _from_words(block_mix_words(_to_words(B), len(B) // 128))
+
+
+
+def ROMix(block, iterations):
+    return _from_words(romix_words(_to_words(block), iterations, len(block) // 128))
+
+
 _sha256 = SHA256()
 
 @register_primitive()
@@ -55,14 +163,16 @@ class Scrypt(KDF):
     https://tools.ietf.org/html/rfc7914
     """
 
-    def __init__(self, desired_len: int, cost: int, parallelization_factor: int, block_size_factor: int=8, hash_fn: FunctionType=lambda passwd, msg: HMAC(passwd, _sha256).generate(msg)):
+    def __init__(self, desired_len: int, cost: int, parallelization_factor: int, block_size_factor: int=8, hash_fn: FunctionType=None):
         """
         Parameters:
             desired_len       (int): Desired output length.
             cost              (int): Cost (usually a power of two).
             block_size_factor (int): `r` from the RFC.
-            hash_fn          (func): Function that takes in bytes and returns them hashed.
+            hash_fn          (func): Function that takes in a key and input bytes and returns them hashed. Defaults to HMAC-SHA256.
         """
+        hash_fn = hash_fn or HMAC.prf(_sha256)
+
         self.block_size = block_size_factor * 128
         self.hash_fn = hash_fn
         self.pbkdf2 = PBKDF2(hash_fn,  self.block_size * parallelization_factor, 1)
@@ -89,10 +199,8 @@ class Scrypt(KDF):
         Returns:
             Bytes: Derived key.
         """
-        B = self.pbkdf2.derive(password, salt).chunk(self.block_size)
-
-        for i in range(self.parallelization_factor):
-            B[i] = ROMix(B[i], self.cost)
+        B = self.pbkdf2.derive(password, salt)
+        r = self.block_size_factor
 
-        expensive_salt = b''.join(B)
+        expensive_salt = b''.join([_from_words(romix_words(_to_words(B[i:i+self.block_size]), self.cost, r)) for i in range(0, len(B), self.block_size)])
         return PBKDF2(self.hash_fn, self.desired_len, 1).derive(password, expensive_salt)
@@ -1,8 +1,9 @@
 from .cbc_mac import CBCMAC
 from .cmac import CMAC
+from .ghash import GHASH
 from .hmac import HMAC
 from .pmac import PMAC
 from .poly1305 import Poly1305
 
 
-__all__ = ["CBCMAC", "CMAC", "HMAC", "PMAC", "Poly1305"]
+__all__ = ["CBCMAC", "CMAC", "GHASH", "HMAC", "PMAC", "Poly1305"]
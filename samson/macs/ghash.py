@@ -0,0 +1,247 @@
+from samson.utilities.bytes import Bytes
+from samson.core.primitives import MAC, Primitive
+from samson.core.metadata import SizeType, SizeSpec, FrequencyType
+from samson.ace.decorators import register_primitive
+
+GHASH_AGGREGATE = 8
+
+
+def gcm_shift(x: int) -> int:
+    """
+    Multiplies `x` by the field element `x` in GCM's bit-reflected representation.
+    """
+    high_bit_set = x & 1
+    x >>= 1
+
+    if high_bit_set:
+        x ^= 0xe1 << (128 - 8)
+
+    return x
+
+
+def _build_reduction_table() -> list:
+    table = []
+    for r in range(256):
+        for _ in range(8):
+            r = gcm_shift(r)
+
+        table.append(r)
+
+    return table
+
+
+# Key-independent reduction of the byte shifted out when multiplying by x^8 (Shoup's R table)
+GHASH_REDUCTION_TABLE = _build_reduction_table()
+
+
+def ghash_blocks(ad: bytes, ciphertext: bytes) -> list:
+    """
+    Lays out GCM's GHASH input (zero-padded `ad`, zero-padded `ciphertext`, bit lengths) as 128-bit integers.
+
+    Parameters:
+        ad         (bytes): Additional authenticated data.
+        ciphertext (bytes): Ciphertext.
+
+    Returns:
+        list: Blocks as integers.
+    """
+    ad, ciphertext = Bytes.wrap(ad), Bytes.wrap(ciphertext)
+    blocks = [chunk.int() for chunk in ad.pad_congruent_right(16).chunk(16)] if ad else []
+    blocks.extend([chunk.int() for chunk in ciphertext.pad_congruent_right(16).chunk(16)] if ciphertext else [])
+    blocks.append((len(ad) << (3 + 64)) | (len(ciphertext) << 3))
+
+    return blocks
+
+
+
+@register_primitive()
+class GHASH(MAC):
+    """
+    GCM's universal hash over GF(2^128). Uses per-key 8-bit Shoup tables for `H, H^2, ..., H^k` so `k` blocks
+    share a single reduction pass. This is the unkeyed-by-cipher core of GCM and GMAC, and is NOT a secure MAC on its own.
+    """
+
+    KEY_SIZE        = SizeSpec(size_type=SizeType.SINGLE, sizes=128)
+    BLOCK_SIZE      = SizeSpec(size_type=SizeType.SINGLE, sizes=128)
+    OUTPUT_SIZE     = SizeSpec(size_type=SizeType.SINGLE, sizes=128)
+    USAGE_FREQUENCY = FrequencyType.PROLIFIC
+
+    def __init__(self, H: bytes, aggregate: int=GHASH_AGGREGATE):
+        """
+        Parameters:
+            H         (bytes): Hash key (i.e. the encryption of the zero block). May also be an integer.
+            aggregate   (int): Number of blocks to fold into each reduction pass.
+        """
+        Primitive.__init__(self)
+        self.H         = H if type(H) is int else Bytes.wrap(H).int()
+        self.aggregate = aggregate
+
+        self.tables = [self._build_table(self.H)]
+        for _ in range(aggregate - 1):
+            self.tables.append(self._build_table(self._mul(self.tables[-1], self.H)))
+
+        # Highest power first to line up with the blocks it multiplies
+        self._rev_tables = self.tables[::-1]
+        self.reset()
+
+
+    def __reprdir__(self):
+        return ['H', 'aggregate']
+
+
+    @staticmethod
+    def _build_table(H: int) -> list:
+        # table[b] = (b placed in the lowest-degree byte) * H
+        table = [0]*256
+        value = H
+        bit   = 0x80
+        while bit:
+            table[bit] = value
+            value = gcm_shift(value)
+            bit >>= 1
+
+        for b in range(1, 256):
+            low = b & -b
+            if b != low:
+                table[b] = table[low] ^ table[b ^ low]
+
+        return table
+
+
+    @staticmethod
+    def _mul(table: list, x: int) -> int:
+        R = GHASH_REDUCTION_TABLE
+        z = 0
+        for b in x.to_bytes(16, 'big')[::-1]:
+            z = (z >> 8) ^ R[z & 255] ^ table[b]
+
+        return z
+
+
+    def mul(self, x: int) -> int:
+        """
+        Multiplies `x` by `H`.
+
+        Parameters:
+            x (int): Field element as an integer.
+
+        Returns:
+            int: Product.
+        """
+        return self._mul(self.tables[0], x)
+
+
+    def hash_blocks(self, y: int, data: bytes) -> int:
+        """
+        Absorbs `data` (zero-padding a partial final block) into the running value `y`.
+
+        Parameters:
+            y       (int): Running hash value.
+            data  (bytes): Bytes-like data.
+
+        Returns:
+            int: New running value.
+        """
+        data = bytes(data)
+        if len(data) % 16:
+            data += b'\x00' * (16 - len(data) % 16)
+
+        R      = GHASH_REDUCTION_TABLE
+        k      = self.aggregate
+        stride = 16*k
+        end    = len(data) - len(data) % stride
+
+        # Y' = (Y ^ X_1)*H^k ^ X_2*H^(k-1) ^ ... ^ X_k*H, reducing once per byte position for all k blocks
+        for i in range(0, end, stride):
+            first  = (y ^ int.from_bytes(data[i:i+16], 'big')).to_bytes(16, 'big')
+            blocks = list(zip(self._rev_tables, [first] + [data[j:j+16] for j in range(i+16, i+stride, 16)]))
+            z      = 0
+
+            for pos in range(15, -1, -1):
+                z = (z >> 8) ^ R[z & 255]
+                for table, block in blocks:
+                    z ^= table[block[pos]]
+
+            y = z
+
+
+        table = self.tables[0]
+        for i in range(end, len(data), 16):
+            z = 0
+            for b in (y ^ int.from_bytes(data[i:i+16], 'big')).to_bytes(16, 'big')[::-1]:
+                z = (z >> 8) ^ R[z & 255] ^ table[b]
+
+            y = z
+
+        return y
+
+
+    def reset(self):
+        """
+        Clears the running state.
+        """
+        self.y       = 0
+        self._buffer = b''
+
+
+    def update(self, data: bytes) -> 'GHASH':
+        """
+        Absorbs `data`. Data is buffered until a full block is available.
+
+        Parameters:
+            data (bytes): Bytes-like data.
+
+        Returns:
+            GHASH: Self, for chaining.
+        """
+        data  = self._buffer + bytes(data)
+        split = len(data) - len(data) % 16
+
+        self.y       = self.hash_blocks(self.y, data[:split])
+        self._buffer = data[split:]
+        return self
+
+
+    def pad(self) -> 'GHASH':
+        """
+        Zero-pads and absorbs any buffered partial block (e.g. between GCM's AD and ciphertext).
+
+        Returns:
+            GHASH: Self, for chaining.
+        """
+        if self._buffer:
+            self.y       = self.hash_blocks(self.y, self._buffer)
+            self._buffer = b''
+
+        return self
+
+
+    def digest(self) -> Bytes:
+        """
+        Returns the hash of the data absorbed so far without modifying the state.
+
+        Returns:
+            Bytes: Hash.
+        """
+        y = self.hash_blocks(self.y, self._buffer) if self._buffer else self.y
+        return Bytes(y.to_bytes(16, 'big'))
+
+
+    def generate(self, message: bytes) -> Bytes:
+        """
+        Hashes `message` (zero-padded) in one shot.
+
+        Parameters:
+            message (bytes): Message to hash.
+
+        Returns:
+            Bytes: Hash.
+
+        Examples:
+            >>> from samson.macs.ghash import GHASH
+            >>> ghash = GHASH(0x66e94bd4ef8a2c3b884cfa59ca342b2e)
+            >>> ghash.update(b'samson').update(b' ghash').digest() == ghash.generate(b'samson ghash')
+            True
+
+        """
+        return Bytes(self.hash_blocks(0, message).to_bytes(16, 'big'))
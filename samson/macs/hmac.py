@@ -2,6 +2,7 @@ from samson.utilities.bytes import Bytes
 from samson.core.primitives import MAC, Primitive
 from samson.core.metadata import FrequencyType
 from samson.ace.decorators import register_primitive
+from types import FunctionType
 
 # https://en.wikipedia.org/wiki/HMAC
 @register_primitive()
@@ -31,6 +32,12 @@ class HMAC(MAC):
         self.outer_key_pad = self.key_prime ^ Bytes(b'\x5c').stretch(self.hash_obj.block_size)
         self.inner_key_pad = self.key_prime ^ Bytes(b'\x36').stretch(self.hash_obj.block_size)
 
+        # Hashes with an incremental interface absorb the key pads once; `generate` resumes from these midstates
+        self._inner = self._outer = None
+        if hasattr(self.hash_obj, 'update'):
+            self._inner = self.hash_obj.copy().reset().update(self.inner_key_pad)
+            self._outer = self.hash_obj.copy().reset().update(self.outer_key_pad)
+
 
     def __reprdir__(self):
         return ['key', 'key_prime', 'outer_key_pad', 'inner_key_pad']
@@ -46,4 +53,43 @@ class HMAC(MAC):
         Returns:
             Bytes: The MAC.
         """
+        if self._inner:
+            inner = self._inner.copy().update(message).digest()
+            return self._outer.copy().update(inner).digest()
+
         return self.hash_obj.hash(self.outer_key_pad + self.hash_obj.hash(self.inner_key_pad + Bytes.wrap(message)))
+
+
+    @staticmethod
+    def prf(hash_obj: 'Hash') -> FunctionType:
+        """
+        Builds a `(key, message) -> MAC` function for KDFs like `PBKDF2` and `Scrypt`. The HMAC of the most recent key
+        is kept, so repeated calls with the same key only compress the message blocks.
+
+        Parameters:
+            hash_obj (Hash): Instantiated object with compatible hash interface.
+
+        Returns:
+            func: HMAC as a function of key and message.
+
+        Examples:
+            >>> from samson.macs.hmac import HMAC
+            >>> from samson.hashes.sha2 import SHA256
+            >>> prf = HMAC.prf(SHA256())
+            >>> prf(b'key', b'message') == HMAC(b'key', SHA256()).generate(b'message')
+            True
+
+        """
+        last = [(None, None)]
+
+        def hmac_prf(key: bytes, message: bytes) -> Bytes:
+            last_key, mac = last[0]
+            key = bytes(key)
+
+            if key != last_key:
+                mac     = HMAC(key, hash_obj)
+                last[0] = (key, mac)
+
+            return mac.generate(message)
+
+        return hmac_prf
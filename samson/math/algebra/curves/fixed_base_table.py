@@ -0,0 +1,522 @@
+from samson.math.algebra.curves.weierstrass_curve import WeierstrassCurve, WeierstrassPoint, _jacobian_add, _jacobian_add_affine, _jacobian_double, _JACOBIAN_INFINITY
+from samson.math.algebra.curves.twisted_edwards_curve import TwistedEdwardsCurve, TwistedEdwardsPoint
+from samson.math.algebra.curves.montgomery_curve import MontgomeryCurve
+from samson.utilities.bytes import Bytes
+from samson.utilities.runtime import RUNTIME
+from collections import OrderedDict
+import os
+
+
+# Extended twisted Edwards coordinates (X, Y, Z, T) with x = X/Z, y = Y/Z and x*y = T/Z.
+# The unified addition law (add-2008-hwcd) is complete on the named curves, so the identity needs no special casing.
+def _edwards_add(P: tuple, Q: tuple, a: int, d: int, p: int) -> tuple:
+    X1, Y1, Z1, T1 = P
+    X2, Y2, Z2, T2 = Q
+
+    A = X1*X2 % p
+    B = Y1*Y2 % p
+    C = T1*d*T2 % p
+    D = Z1*Z2 % p
+    E = ((X1+Y1)*(X2+Y2) - A - B) % p
+    F = (D - C) % p
+    G = (D + C) % p
+    H = (B - a*A) % p
+
+    return E*F % p, G*H % p, F*G % p, E*H % p
+
+
+def _edwards_add_affine(P: tuple, Q: tuple, a: int, p: int) -> tuple:
+    """
+    Mixed addition where `Q` is a precomputed affine entry (x, y, d*x*y).
+    """
+    X1, Y1, Z1, T1 = P
+    x2, y2, dt2    = Q
+
+    A = X1*x2 % p
+    B = Y1*y2 % p
+    C = T1*dt2 % p
+    E = ((X1+Y1)*(x2+y2) - A - B) % p
+    F = (Z1 - C) % p
+    G = (Z1 + C) % p
+    H = (B - a*A) % p
+
+    return E*F % p, G*H % p, F*G % p, E*H % p
+
+
+
+class FixedBaseTable(object):
+    """
+    Signed fixed-base window table for the generator of a `WeierstrassCurve` or `TwistedEdwardsCurve`.
+
+    Stores `d * 2^(width*j) * G` for every window `j` and digit `d` in [1, 2^(width-1)] as affine ints.
+    Multiplication by a scalar then costs one mixed addition per window and no doublings.
+
+    Examples:
+        >>> from samson.math.algebra.curves.named import P256
+        >>> from samson.math.algebra.curves.fixed_base_table import FixedBaseTable
+        >>> table = FixedBaseTable(P256.G, width=4)
+        >>> table * 1234 == P256.G._jacobian_mul(1234, P256.p)
+        True
+
+    """
+
+    def __init__(self, G: 'RingElement', width: int=5, table: list=None):
+        """
+        Parameters:
+            G     (RingElement): Base point. Either a `WeierstrassPoint` or `TwistedEdwardsPoint` over ZZ/ZZ(p).
+            width         (int): Window width in bits.
+            table        (list): Precomputed table (used by `deserialize`).
+        """
+        self.G     = G
+        self.curve = G.curve
+        self.width = width
+
+        if type(G) is WeierstrassPoint:
+            self.order = self.curve.q
+        elif type(G) is TwistedEdwardsPoint:
+            self.order = self.curve.l
+        else:
+            raise TypeError(f"FixedBaseTable not defined for {type(G)}")
+
+        self.p       = int(self.curve.ring.quotient)
+        self.windows = (self.order.bit_length() + width) // width
+        self.table   = table or self.build()
+
+
+    def __repr__(self):
+        return f'<FixedBaseTable: G={self.G}, width={self.width}, windows={self.windows}>'
+
+    def __str__(self):
+        return self.__repr__()
+
+
+    def __mul__(self, other: int) -> 'RingElement':
+        return self.calculate(other)
+
+    def __rmul__(self, other: int) -> 'RingElement':
+        return self.calculate(other)
+
+
+    @property
+    def is_edwards(self) -> bool:
+        return type(self.G) is TwistedEdwardsPoint
+
+
+    def _batch_invert(self, values: list) -> list:
+        """
+        Inverts `values` with a single ring inversion (Montgomery's trick).
+        """
+        p     = self.p
+        prods = [values[0]]
+        for val in values[1:]:
+            prods.append(prods[-1] * val % p)
+
+        inv = int(~self.curve.ring(prods[-1]))
+
+        inverses = [None] * len(values)
+        for idx in reversed(range(len(values))):
+            inverses[idx] = inv * prods[idx-1] % p if idx else inv
+            inv = inv * values[idx] % p
+
+        return inverses
+
+
+    def build(self) -> list:
+        """
+        Builds the window table.
+
+        Returns:
+            list: List of `windows` lists of `2^(width-1)` affine entries.
+        """
+        p, half = self.p, 2**(self.width-1)
+        x, y    = int(self.G.x), int(self.G.y)
+        entries = []
+
+        if self.is_edwards:
+            a, d = int(self.curve.a) % p, int(self.curve.d) % p
+            base = (x, y, 1, x*y % p)
+
+            for _ in range(self.windows):
+                P = base
+                entries.append(P)
+                for _ in range(half-1):
+                    P = _edwards_add(P, base, a, d, p)
+                    entries.append(P)
+
+                base = _edwards_add(P, P, a, d, p)
+
+            inverses = self._batch_invert([Z for _, _, Z, _ in entries])
+            affine   = []
+            for (X, Y, _, _), Z_inv in zip(entries, inverses):
+                x, y = X*Z_inv % p, Y*Z_inv % p
+                affine.append((x, y, d*x*y % p))
+
+        else:
+            a    = int(self.curve.a) % p
+            base = (x, y, 1)
+
+            for _ in range(self.windows):
+                P = base
+                entries.append(P)
+                for _ in range(half-1):
+                    P = _jacobian_add(P, base, a, p)
+                    entries.append(P)
+
+                base = _jacobian_double(P, a, p)
+
+            affine = self.G._normalize_jacobian(entries, p)
+
+        return [affine[i:i+half] for i in range(0, len(affine), half)]
+
+
+    def recode(self, k: int) -> list:
+        """
+        Recodes `k` into signed base-2^`width` digits in [-2^(width-1), 2^(width-1)].
+
+        Parameters:
+            k (int): Non-negative scalar less than the order.
+
+        Returns:
+            list: Digits, least significant first.
+        """
+        width  = self.width
+        mask   = 2**width - 1
+        half   = 2**(width-1)
+        digits = []
+
+        for _ in range(self.windows):
+            digit = k & mask
+            if digit > half:
+                digit -= 2**width
+
+            digits.append(digit)
+            k = (k - digit) >> width
+
+        return digits
+
+
+    def calculate_affine(self, k: int) -> tuple:
+        """
+        Calculates `k*G` as affine ints.
+
+        Parameters:
+            k (int): Scalar.
+
+        Returns:
+            tuple: (x, y) or None for the point at infinity of a Weierstrass curve.
+        """
+        p = self.p
+
+        if self.is_edwards:
+            a = int(self.curve.a) % p
+            Q = (0, 1, 1, 0)
+
+            for window, digit in zip(self.table, self.recode(k % self.order)):
+                if digit > 0:
+                    Q = _edwards_add_affine(Q, window[digit-1], a, p)
+
+                elif digit < 0:
+                    x, y, dt = window[-digit-1]
+                    Q = _edwards_add_affine(Q, (-x % p, y, -dt % p), a, p)
+
+            X, Y, Z, _ = Q
+            Z_inv = int(~self.curve.ring(Z))
+            return X*Z_inv % p, Y*Z_inv % p
+
+        else:
+            a = int(self.curve.a) % p
+            Q = _JACOBIAN_INFINITY
+
+            for window, digit in zip(self.table, self.recode(k % self.order)):
+                if digit > 0:
+                    Q = _jacobian_add_affine(Q, window[digit-1], a, p)
+
+                elif digit < 0:
+                    x, y, z = window[-digit-1]
+                    Q = _jacobian_add_affine(Q, (x, -y % p, z), a, p)
+
+            if not Q[2]:
+                return None
+
+            x, y, _ = self.G._normalize_jacobian([Q], p)[0]
+            return x, y
+
+
+    def calculate(self, k: int) -> 'RingElement':
+        """
+        Calculates `k*G` using the table.
+
+        Parameters:
+            k (int): Scalar.
+
+        Returns:
+            RingElement: Resulting point.
+        """
+        affine = self.calculate_affine(k)
+
+        if self.is_edwards:
+            return TwistedEdwardsPoint(*affine, self.curve, validate=False)
+
+        if affine is None:
+            return self.curve.POINT_AT_INFINITY
+
+        return WeierstrassPoint(*affine, self.curve)
+
+
+    def serialize(self) -> Bytes:
+        """
+        Serializes the table.
+
+        Returns:
+            Bytes: Serialized table.
+        """
+        size   = (self.p.bit_length() + 7) // 8
+        header = bytes([self.width]) + size.to_bytes(2, 'big') + self.windows.to_bytes(2, 'big')
+        body   = b''.join(entry[0].to_bytes(size, 'big') + entry[1].to_bytes(size, 'big') + bytes([self.is_edwards or entry[2]]) for window in self.table for entry in window)
+        return Bytes(header + body)
+
+
+    @staticmethod
+    def deserialize(G: 'RingElement', data: bytes) -> 'FixedBaseTable':
+        """
+        Deserializes a table built for `G`.
+
+        Parameters:
+            G (RingElement): Base point the table was built for.
+            data   (bytes): Serialized table.
+
+        Returns:
+            FixedBaseTable: Deserialized table.
+        """
+        data    = bytes(data)
+        width   = data[0]
+        size    = int.from_bytes(data[1:3], 'big')
+        windows = int.from_bytes(data[3:5], 'big')
+        half    = 2**(width-1)
+        stride  = 2*size + 1
+
+        if len(data) != 5 + windows*half*stride:
+            raise ValueError("Serialized table is truncated or malformed")
+
+        is_edwards = type(G) is TwistedEdwardsPoint
+        p = int(G.curve.ring.quotient)
+        d = int(G.curve.d) % p if is_edwards else None
+
+        entries = []
+        for idx in range(5, len(data), stride):
+            x = int.from_bytes(data[idx:idx+size], 'big')
+            y = int.from_bytes(data[idx+size:idx+2*size], 'big')
+
+            if is_edwards:
+                entries.append((x, y, d*x*y % p))
+            elif data[idx+2*size]:
+                entries.append((x, y, 1))
+            else:
+                entries.append(_JACOBIAN_INFINITY)
+
+
+        if entries[0][:2] != (int(G.x), int(G.y)):
+            raise ValueError("Serialized table was not built for this base point")
+
+        table = FixedBaseTable(G, width=width, table=[entries[i:i+half] for i in range(0, len(entries), half)])
+
+        if table.windows != windows:
+            raise ValueError("Serialized table does not cover the base point's order")
+
+        return table
+
+
+
+class MontgomeryFixedBaseTable(object):
+    """
+    Fixed-base table for the base u-coordinate of a `MontgomeryCurve`.
+
+    The table is built over an equivalent `TwistedEdwardsCurve` and results are mapped back to u-coordinates.
+    Curve25519 is birationally equivalent to Edwards25519 (u = (1+y)/(1-y)), while Curve448 is 4-isogenous to Edwards448 (u = y^2/x^2).
+    """
+
+    def __init__(self, curve: MontgomeryCurve, table: FixedBaseTable, isogenous: bool=False):
+        """
+        Parameters:
+            curve (MontgomeryCurve): Montgomery curve.
+            table  (FixedBaseTable): Table for the equivalent Edwards base point.
+            isogenous        (bool): Whether the map is the 4-isogeny rather than the birational map.
+        """
+        self.curve     = curve
+        self.table     = table
+        self.isogenous = isogenous
+
+
+    def __repr__(self):
+        return f'<MontgomeryFixedBaseTable: curve={self.curve}, table={self.table}>'
+
+    def __str__(self):
+        return self.__repr__()
+
+
+    def __mul__(self, other: int) -> int:
+        return self.calculate(other)
+
+    def __rmul__(self, other: int) -> int:
+        return self.calculate(other)
+
+
+    def calculate(self, k: int) -> int:
+        """
+        Calculates the u-coordinate of `k*U`.
+
+        Parameters:
+            k (int): Scalar.
+
+        Returns:
+            int: u-coordinate (zero for the point at infinity).
+        """
+        p    = self.table.p
+        x, y = self.table.calculate_affine(k)
+
+        if self.isogenous:
+            num, den = y*y, x*x
+        else:
+            num, den = 1 + y, 1 - y
+
+        den %= p
+        if not den:
+            return 0
+
+        return num * int(~self.curve.ring(den)) % p
+
+
+    def serialize(self) -> Bytes:
+        return self.table.serialize()
+
+
+
+class FixedBaseTableCache(object):
+    """
+    LRU cache of fixed-base tables keyed by curve. Tables are built lazily on first use.
+
+    If `directory` is set, tables are serialized there and loaded by later processes instead of being rebuilt.
+    """
+
+    def __init__(self, max_tables: int=None, directory: str=None, width: int=5):
+        """
+        Parameters:
+            max_tables (int): Maximum number of tables kept in memory. Defaults to `RUNTIME.fixed_base_table_limit`.
+            directory  (str): Directory to persist tables in. Defaults to `RUNTIME.fixed_base_table_dir`.
+            width      (int): Window width of built tables.
+        """
+        self._max_tables = max_tables
+        self._directory  = directory
+        self.width       = width
+        self.tables      = OrderedDict()
+        self.montgomery_equivalents = {}
+
+
+    def __repr__(self):
+        return f'<FixedBaseTableCache: max_tables={self.max_tables}, directory={self.directory}, cached={len(self.tables)}>'
+
+    def __str__(self):
+        return self.__repr__()
+
+
+    @property
+    def max_tables(self) -> int:
+        return self._max_tables or RUNTIME.fixed_base_table_limit
+
+
+    @property
+    def directory(self) -> str:
+        return self._directory or RUNTIME.fixed_base_table_dir
+
+
+    def __contains__(self, curve: 'Ring') -> bool:
+        return curve in self.tables
+
+
+    def __getitem__(self, curve: 'Ring') -> FixedBaseTable:
+        if curve in self.tables:
+            self.tables.move_to_end(curve)
+            return self.tables[curve]
+
+        table = self.load(curve)
+        self.tables[curve] = table
+
+        while len(self.tables) > self.max_tables:
+            self.tables.popitem(last=False)
+
+        return table
+
+
+    def clear(self):
+        """
+        Empties the in-memory cache.
+        """
+        self.tables.clear()
+
+
+    def register_montgomery(self, curve: MontgomeryCurve, edwards: TwistedEdwardsCurve, isogenous: bool=False):
+        """
+        Registers the Edwards curve whose base point maps to the base u-coordinate of `curve`.
+
+        Parameters:
+            curve   (MontgomeryCurve): Montgomery curve.
+            edwards (TwistedEdwardsCurve): Equivalent Edwards curve.
+            isogenous          (bool): Whether the map is the 4-isogeny rather than the birational map.
+        """
+        self.montgomery_equivalents[curve] = (edwards, isogenous)
+
+
+    def _base_point(self, curve: 'Ring') -> 'RingElement':
+        if type(curve) is WeierstrassCurve:
+            return curve.G
+
+        elif type(curve) is TwistedEdwardsCurve:
+            return curve.B
+
+        raise TypeError(f"No fixed-base table available for {curve}")
+
+
+    def _table_path(self, curve: 'Ring') -> str:
+        name = getattr(curve, 'name', None) or curve.oid
+        if type(name) is bytes:
+            name = name.hex()
+
+        return os.path.join(self.directory, f'{name}_w{self.width}.fbt')
+
+
+    def load(self, curve: 'Ring') -> FixedBaseTable:
+        """
+        Loads the table for `curve` from `directory` or builds it.
+
+        Parameters:
+            curve (Ring): Curve whose generator to use.
+
+        Returns:
+            FixedBaseTable: Table for the generator.
+        """
+        if isinstance(curve, MontgomeryCurve):
+            edwards, isogenous = self.montgomery_equivalents[curve]
+            return MontgomeryFixedBaseTable(curve, self[edwards], isogenous)
+
+
+        G = self._base_point(curve)
+
+        if not self.directory:
+            return FixedBaseTable(G, width=self.width)
+
+        path = self._table_path(curve)
+
+        if os.path.exists(path):
+            with open(path, 'rb') as f:
+                try:
+                    return FixedBaseTable.deserialize(G, f.read())
+                except ValueError:
+                    pass
+
+        table = FixedBaseTable(G, width=self.width)
+
+        os.makedirs(self.directory, exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(bytes(table.serialize()))
+
+        return table
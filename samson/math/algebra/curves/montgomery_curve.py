@@ -50,6 +50,8 @@ class MontgomeryCurve(Ring):
         self.zero = MontgomeryPoint(0, self)
         self.one  = self.G
 
+        self.fixed_base_tables = None
+
 
     def __repr__(self):
         return f"<MontgomeryCurve: p={self.p}, A={self.A}, U={self.U}, V={self.V}>"
@@ -149,6 +151,10 @@ class MontgomeryPoint(RingElement):
 
     # https://tools.ietf.org/html/rfc7748#section-5
     def __mul__(self, other: int) -> int:
+        tables = self.curve.fixed_base_tables
+        if tables and other == self.curve.U:
+            return tables[self.curve] * int(self.x)
+
         A   = self.curve.A
         x_1 = self.curve.ring.coerce(other)
         x_2 = self.curve.ring(1)
@@ -0,0 +1,398 @@
+"""
+Simultaneous multi-scalar multiplication: computes sum(k_i*P_i) in a single pass instead of one scalar multiplication
+per term followed by additions.
+
+Straus (Shamir's trick for two terms) interleaves the windows of all scalars so the terms share their doublings. This
+suits a handful of terms. Pippenger sorts each window's digits into buckets, sums the buckets with running sums, and
+needs no per-point tables, so it's faster with many terms.
+
+Points on Weierstrass curves over ZZ/ZZ(p) work in Jacobian coordinates and points on twisted Edwards curves in
+extended coordinates, both on plain ints. Elements of `MultiplicativeGroup`s of ZZ/ZZ(n) (where `+` multiplies and `*`
+exponentiates) work on their residues. Anything else goes through the group operations of its ring.
+
+References:
+    "Guide to Elliptic Curve Cryptography" (Hankerson, Menezes, Vanstone), Ch. 3.3.3.
+    https://doi.org/10.1137/0209022 (Pippenger, "On the evaluation of powers and monomials")
+"""
+from samson.math.algebra.curves.weierstrass_curve import WeierstrassPoint, _jacobian_add, _jacobian_add_affine, _jacobian_double, _JACOBIAN_INFINITY
+from samson.math.algebra.curves.twisted_edwards_curve import TwistedEdwardsPoint
+from samson.math.algebra.rings.multiplicative_group import MultiplicativeGroupElement
+
+# At this many terms and above, `multi_scalar_mul` uses Pippenger instead of Straus (measured on P-256)
+PIPPENGER_THRESHOLD = 128
+
+
+class _GroupBackend(object):
+    """
+    Arithmetic through the ring's group operations.
+    """
+
+    def __init__(self, elem: 'RingElement'):
+        self.ring = elem.ring
+        self.zero = self.ring.zero
+
+    def lift(self, P: 'RingElement') -> object:
+        return P
+
+    def lower(self, points: list) -> list:
+        return points
+
+    def normalize(self, points: list) -> list:
+        return points
+
+    def add(self, P: object, Q: object) -> object:
+        return P + Q
+
+    def mixed_add(self, P: object, Q: object) -> object:
+        return self.add(P, Q)
+
+    def double(self, P: object) -> object:
+        return self.add(P, P)
+
+    def neg(self, P: object) -> object:
+        return -P
+
+
+
+class _JacobianBackend(_GroupBackend):
+    """
+    Jacobian coordinates on Weierstrass curves over ZZ/ZZ(p). Tables are normalized to affine for mixed additions.
+    """
+
+    def __init__(self, elem: WeierstrassPoint):
+        self.curve = elem.curve
+        self.p     = self.curve.jacobian_modulus
+        self.a     = int(self.curve.a) % self.p
+        self.zero  = _JACOBIAN_INFINITY
+        self._point = elem
+
+    def lift(self, P: WeierstrassPoint) -> tuple:
+        if P == self.curve.POINT_AT_INFINITY:
+            return _JACOBIAN_INFINITY
+
+        return (int(P.x), int(P.y), 1)
+
+    def lower(self, points: list) -> list:
+        return [WeierstrassPoint(x, y, self.curve) if z else self.curve.POINT_AT_INFINITY for x, y, z in self.normalize(points)]
+
+    def normalize(self, points: list) -> list:
+        return self._point._normalize_jacobian(points, self.p)
+
+    def add(self, P: tuple, Q: tuple) -> tuple:
+        return _jacobian_add(P, Q, self.a, self.p)
+
+    def mixed_add(self, P: tuple, Q: tuple) -> tuple:
+        return _jacobian_add_affine(P, Q, self.a, self.p)
+
+    def double(self, P: tuple) -> tuple:
+        return _jacobian_double(P, self.a, self.p)
+
+    def neg(self, P: tuple) -> tuple:
+        return (P[0], -P[1] % self.p, P[2])
+
+
+
+class _EdwardsBackend(_GroupBackend):
+    """
+    Extended coordinates (X, Y, Z, T) with x = X/Z, y = Y/Z and T = XY/Z on twisted Edwards curves over ZZ/ZZ(q). The
+    addition law is unified, so it also doubles.
+    """
+
+    def __init__(self, elem: TwistedEdwardsPoint):
+        self.curve = elem.curve
+        self.p     = self.curve.q
+        self.a     = int(self.curve.a) % self.p
+        self.d     = int(self.curve.d) % self.p
+        self.zero  = (0, 1, 1, 0)
+
+    def lift(self, P: TwistedEdwardsPoint) -> tuple:
+        x, y = int(P.x), int(P.y)
+        return (x, y, 1, x*y % self.p)
+
+    def lower(self, points: list) -> list:
+        p = self.p
+        return [TwistedEdwardsPoint(X*pow(Z, -1, p) % p, Y*pow(Z, -1, p) % p, self.curve, validate=False) for X, Y, Z, _ in points]
+
+    def add(self, P: tuple, Q: tuple) -> tuple:
+        p = self.p
+        X1, Y1, Z1, T1 = P
+        X2, Y2, Z2, T2 = Q
+
+        A = X1*X2 % p
+        B = Y1*Y2 % p
+        C = T1*self.d*T2 % p
+        D = Z1*Z2 % p
+        E = ((X1 + Y1)*(X2 + Y2) - A - B) % p
+        F = D - C
+        G = D + C
+        H = B - self.a*A
+
+        return (E*F % p, G*H % p, F*G % p, E*H % p)
+
+    def neg(self, P: tuple) -> tuple:
+        X, Y, Z, T = P
+        return (-X % self.p, Y, Z, -T % self.p)
+
+
+
+class _ModularBackend(_GroupBackend):
+    """
+    Residues modulo `n`, optionally of a `MultiplicativeGroup` of ZZ/ZZ(n).
+    """
+
+    def __init__(self, n: int, group: 'MultiplicativeGroup'=None):
+        self.group = group
+        self.n     = n
+        self.zero  = 1
+
+    def lift(self, P: MultiplicativeGroupElement) -> int:
+        return int(P.val)
+
+    def lower(self, points: list) -> list:
+        return [MultiplicativeGroupElement(self.group.ring(v), self.group) for v in points]
+
+    def add(self, P: int, Q: int) -> int:
+        return P*Q % self.n
+
+    def double(self, P: int) -> int:
+        return P*P % self.n
+
+    def neg(self, P: int) -> int:
+        return pow(P, -1, self.n)
+
+
+
+def _backend(elem: 'RingElement') -> _GroupBackend:
+    if type(elem) is WeierstrassPoint and elem.curve.jacobian_modulus:
+        return _JacobianBackend(elem)
+
+    elif type(elem) is TwistedEdwardsPoint and getattr(elem.curve.ring, 'int_quotient', None):
+        return _EdwardsBackend(elem)
+
+    elif type(elem) is MultiplicativeGroupElement and getattr(elem.ring.ring, 'int_quotient', None):
+        return _ModularBackend(elem.ring.ring.int_quotient, elem.ring)
+
+    return _GroupBackend(elem)
+
+
+
+def _straus_width(bits: int) -> int:
+    if bits < 32:
+        return 2
+    elif bits < 128:
+        return 3
+    elif bits < 512:
+        return 4
+    else:
+        return 5
+
+
+
+def _straus_tables(backend: _GroupBackend, points: list, width: int) -> list:
+    # Table `i` holds P_i, 2P_i, ..., (2^width - 1)P_i
+    tables = []
+    for P in points:
+        table = [P]
+        for _ in range((1 << width) - 2):
+            table.append(backend.add(table[-1], P))
+
+        tables.append(table)
+
+    # Normalize every table with one inversion
+    flat = backend.normalize([P for table in tables for P in table])
+    size = (1 << width) - 1
+    return [flat[i*size:(i+1)*size] for i in range(len(points))]
+
+
+
+def _straus(backend: _GroupBackend, tables: list, scalars: list, width: int) -> object:
+    mask    = (1 << width) - 1
+    windows = (max(k.bit_length() for k in scalars) + width - 1) // width
+    Q       = backend.zero
+
+    for w in reversed(range(windows)):
+        for _ in range(width):
+            Q = backend.double(Q)
+
+        shift = w*width
+        for table, k in zip(tables, scalars):
+            digit = (k >> shift) & mask
+            if digit:
+                Q = backend.mixed_add(Q, table[digit-1])
+
+    return Q
+
+
+
+def _pippenger(backend: _GroupBackend, points: list, scalars: list) -> object:
+    c       = max(2, len(points).bit_length() - 3)
+    mask    = (1 << c) - 1
+    windows = (max(k.bit_length() for k in scalars) + c - 1) // c
+    Q       = backend.zero
+
+    for w in reversed(range(windows)):
+        for _ in range(c):
+            Q = backend.double(Q)
+
+        shift   = w*c
+        buckets = [None]*(mask + 1)
+
+        for P, k in zip(points, scalars):
+            digit = (k >> shift) & mask
+            if digit:
+                B = buckets[digit]
+                buckets[digit] = P if B is None else backend.mixed_add(B, P)
+
+
+        # sum(j*B_j) = B_top + (B_top + B_top-1) + ...
+        running = total = backend.zero
+        for B in reversed(buckets[1:]):
+            if B is not None:
+                running = backend.add(running, B)
+
+            total = backend.add(total, running)
+
+        Q = backend.add(Q, total)
+
+    return Q
+
+
+
+def _prepare(backend: _GroupBackend, points: list, scalars: list) -> (list, list):
+    lifted, ks = [], []
+    for P, k in zip(points, scalars):
+        k = int(k)
+        if not k:
+            continue
+
+        P = backend.lift(P)
+        if k < 0:
+            P, k = backend.neg(P), -k
+
+        lifted.append(P)
+        ks.append(k)
+
+    return lifted, ks
+
+
+
+def multi_scalar_mul(points: list, scalars: list) -> 'RingElement':
+    """
+    Computes sum(k*P) over `points` and `scalars` using Straus for a few terms and Pippenger for many.
+
+    Parameters:
+        points  (list): Elements of the same group.
+        scalars (list): Integer scalars (exponents for `MultiplicativeGroup` elements).
+
+    Returns:
+        RingElement: Linear combination.
+
+    Examples:
+        >>> from samson.math.algebra.curves.multi_scalar_mul import multi_scalar_mul
+        >>> from samson.math.algebra.curves.named import P256
+        >>> G = P256.G
+        >>> multi_scalar_mul([G, G*2], [3, -5]) == G*-7
+        True
+
+        >>> from samson.math.algebra.rings.integer_ring import ZZ
+        >>> R = (ZZ/ZZ(101)).mul_group()
+        >>> multi_scalar_mul([R(2), R(3)], [10, 20]) == R(2)*10 + R(3)*20
+        True
+
+    """
+    if not points:
+        raise ValueError("`points` must be nonempty")
+
+    backend = _backend(points[0])
+    lifted, ks = _prepare(backend, points, scalars)
+
+    if not lifted:
+        Q = backend.zero
+
+    elif len(lifted) >= PIPPENGER_THRESHOLD:
+        Q = _pippenger(backend, lifted, ks)
+
+    else:
+        width = _straus_width(max(k.bit_length() for k in ks))
+        Q     = _straus(backend, _straus_tables(backend, lifted, width), ks, width)
+
+    return backend.lower([Q])[0]
+
+
+
+def batch_multi_scalar_mul(points: list, scalar_rows: list) -> list:
+    """
+    Computes `multi_scalar_mul(points, row)` for each row of `scalar_rows`. The Straus tables of `points` are built
+    once and all results share a single normalization.
+
+    Parameters:
+        points      (list): Elements of the same group.
+        scalar_rows (list): Lists of integer scalars, one per result.
+
+    Returns:
+        list: Linear combinations.
+
+    Examples:
+        >>> from samson.math.algebra.curves.multi_scalar_mul import batch_multi_scalar_mul
+        >>> from samson.math.algebra.curves.named import P256
+        >>> G = P256.G
+        >>> batch_multi_scalar_mul([G, G*2], [[1, 1], [2, 3]]) == [G*3, G*8]
+        True
+
+    """
+    if not points:
+        raise ValueError("`points` must be nonempty")
+
+    backend = _backend(points[0])
+    lifted  = [backend.lift(P) for P in points]
+    negated = [backend.neg(P) for P in lifted]
+    bits    = max([abs(int(k)).bit_length() for row in scalar_rows for k in row] + [1])
+    width   = _straus_width(bits)
+    tables  = _straus_tables(backend, lifted + negated, width)
+    size    = len(points)
+
+    results = []
+    for row in scalar_rows:
+        used, ks = [], []
+        for i, k in enumerate(row):
+            k = int(k)
+            if k:
+                used.append(tables[i] if k > 0 else tables[size + i])
+                ks.append(abs(k))
+
+        results.append(_straus(backend, used, ks, width) if ks else backend.zero)
+
+    return backend.lower(results)
+
+
+
+def multi_exponentiation(bases: list, exponents: list, modulus: int) -> int:
+    """
+    Computes prod(pow(b, e, `modulus`)) with Straus's method on plain ints.
+
+    Parameters:
+        bases     (list): Integer bases.
+        exponents (list): Integer exponents.
+        modulus    (int): Modulus.
+
+    Returns:
+        int: Product of the powers.
+
+    Examples:
+        >>> from samson.math.algebra.curves.multi_scalar_mul import multi_exponentiation
+        >>> multi_exponentiation([2, 3], [10, 20], 101) == pow(2, 10, 101)*pow(3, 20, 101) % 101
+        True
+
+    """
+    backend = _ModularBackend(modulus)
+    lifted, ks = [], []
+    for b, e in zip(bases, exponents):
+        if e:
+            lifted.append(b % modulus if e > 0 else pow(b, -1, modulus))
+            ks.append(abs(e))
+
+    if not ks:
+        return 1 % modulus
+
+    width = _straus_width(max(k.bit_length() for k in ks))
+    return _straus(backend, _straus_tables(backend, lifted, width), ks, width)
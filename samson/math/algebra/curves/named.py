@@ -149,6 +149,7 @@ from samson.math.algebra.rings.integer_ring import ZZ
 from samson.math.algebra.curves.weierstrass_curve import WeierstrassCurve
 from samson.math.algebra.curves.twisted_edwards_curve import TwistedEdwardsCurve
 from samson.math.algebra.curves.montgomery_curve import Curve25519Crv, Curve448Crv
+from samson.math.algebra.curves.fixed_base_table import FixedBaseTableCache
 
 all_curves = {}
 for name, params in _curve_params.items():
@@ -210,6 +211,15 @@ EDCURVE_OID_LOOKUP = {
 }
 
 
+# Generator tables are built on first use and evicted LRU (see `RUNTIME.fixed_base_table_limit`)
+FIXED_BASE_TABLES = FixedBaseTableCache()
+FIXED_BASE_TABLES.register_montgomery(Curve25519, EdwardsCurve25519)
+FIXED_BASE_TABLES.register_montgomery(Curve448, EdwardsCurve448, isogenous=True)
+
+for curve in [*all_curves.values(), *EDCURVE_OID_LOOKUP.values()]:
+    curve.fixed_base_tables = FIXED_BASE_TABLES
+
+
 
 _PRECOMPUTED_ICA_PLANS = {
     P192: [(0, 2, 64),
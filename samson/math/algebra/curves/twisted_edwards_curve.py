@@ -45,6 +45,8 @@ class TwistedEdwardsCurve(Ring):
         self.zero = TwistedEdwardsPoint(0, 1, self)
         self.one  = self.B
 
+        self.fixed_base_tables = None
+
 
     def __repr__(self):
         return f"<TwistedEdwardsCurve: b={self.b}, q={self.q}, l={self.l}>"
@@ -227,6 +229,14 @@ class TwistedEdwardsPoint(RingElement):
         return TwistedEdwardsPoint(x3, y3, self.curve)
 
 
+    def __mul__(self, other: int) -> 'TwistedEdwardsPoint':
+        tables = self.curve.fixed_base_tables
+        if tables and type(other) is int and self == self.curve.B:
+            return tables[self.curve] * other
+
+        return super().__mul__(other)
+
+
     def __sub__(self, other: 'TwistedEdwardsPoint') -> 'TwistedEdwardsPoint':
         if type(other) != TwistedEdwardsPoint:
             raise TypeError("TwistedEdwardsPoint subtraction only defined between points.")
@@ -1,7 +1,108 @@
 from samson.math.algebra.rings.ring import Ring, RingElement
 from samson.math.polynomial import Polynomial
 from samson.math.algebra.curves.util import EllipticCurveCardAlg
-from samson.math.general import random_int_between, tonelli, pohlig_hellman, mod_inv, schoofs_algorithm, gcd
+from samson.math.general import random_int_between, tonelli, pohlig_hellman, mod_inv, schoofs_algorithm, gcd, fast_mul
+from samson.auxiliary.lazy_loader import LazyLoader
+
+_encoding = LazyLoader('_encoding', globals(), 'samson.encoding.general')
+
+
+# Jacobian coordinates over ZZ/ZZ(p): (X, Y, Z) represents the affine point (X/Z^2, Y/Z^3).
+# These work on plain ints and never invert, so scalar multiplication only pays for one inversion.
+_JACOBIAN_INFINITY = (1, 1, 0)
+
+def _jacobian_double(P: tuple, a: int, p: int) -> tuple:
+    X, Y, Z = P
+    if not Z or not Y:
+        return _JACOBIAN_INFINITY
+
+    XX   = X*X % p
+    YY   = Y*Y % p
+    YYYY = YY*YY % p
+    ZZ   = Z*Z % p
+
+    S  = 4*X*YY % p
+    M  = (3*XX + a*ZZ*ZZ) % p
+    X3 = (M*M - 2*S) % p
+    Y3 = (M*(S - X3) - 8*YYYY) % p
+    Z3 = 2*Y*Z % p
+
+    return X3, Y3, Z3
+
+
+def _jacobian_add(P: tuple, Q: tuple, a: int, p: int) -> tuple:
+    X1, Y1, Z1 = P
+    X2, Y2, Z2 = Q
+
+    if not Z1:
+        return Q
+
+    if not Z2:
+        return P
+
+    Z1Z1 = Z1*Z1 % p
+    Z2Z2 = Z2*Z2 % p
+    U1   = X1*Z2Z2 % p
+    U2   = X2*Z1Z1 % p
+    S1   = Y1*Z2*Z2Z2 % p
+    S2   = Y2*Z1*Z1Z1 % p
+
+    H = (U2 - U1) % p
+    r = (S2 - S1) % p
+
+    if not H:
+        if not r:
+            return _jacobian_double(P, a, p)
+
+        return _JACOBIAN_INFINITY
+
+    HH  = H*H % p
+    HHH = H*HH % p
+    V   = U1*HH % p
+
+    X3 = (r*r - HHH - 2*V) % p
+    Y3 = (r*(V - X3) - S1*HHH) % p
+    Z3 = Z1*Z2*H % p
+
+    return X3, Y3, Z3
+
+
+def _jacobian_add_affine(P: tuple, Q: tuple, a: int, p: int) -> tuple:
+    """
+    Mixed addition where `Q` is either affine (Z=1) or the point at infinity.
+    """
+    X1, Y1, Z1 = P
+    x2, y2, z2 = Q
+
+    if not z2:
+        return P
+
+    if not Z1:
+        return Q
+
+    Z1Z1 = Z1*Z1 % p
+    U2   = x2*Z1Z1 % p
+    S2   = y2*Z1*Z1Z1 % p
+
+    H = (U2 - X1) % p
+    r = (S2 - Y1) % p
+
+    if not H:
+        if not r:
+            return _jacobian_double(P, a, p)
+
+        return _JACOBIAN_INFINITY
+
+    HH  = H*H % p
+    HHH = H*HH % p
+    V   = X1*HH % p
+
+    X3 = (r*r - HHH - 2*V) % p
+    Y3 = (r*(V - X3) - Y1*HHH) % p
+    Z3 = Z1*H % p
+
+    return X3, Y3, Z3
+
 
 
 class WeierstrassPoint(RingElement):
@@ -99,6 +200,104 @@ class WeierstrassPoint(RingElement):
         return WeierstrassPoint(x, y, self.curve)
 
 
+    def __mul__(self, other: int) -> 'WeierstrassPoint':
+        p = self.curve.jacobian_modulus
+
+        if type(other) is int and p:
+            tables = self.curve.fixed_base_tables
+            if tables and self == self.curve.G_cache:
+                return tables[self.curve] * other
+
+            return self._jacobian_mul(other, p)
+
+        return fast_mul(self, other)
+
+
+    def _normalize_jacobian(self, points: list, p: int) -> list:
+        """
+        Converts Jacobian points to affine (Z=1) Jacobian points using a single inversion (Montgomery's trick).
+        """
+        R      = self.curve.ring
+        finite = [P for P in points if P[2]]
+
+        if not finite:
+            return points
+
+        # Prefix products of the Z's
+        prods = [finite[0][2]]
+        for X, Y, Z in finite[1:]:
+            prods.append(prods[-1] * Z % p)
+
+        # Inverting through the ring surfaces `NotInvertibleException` (which ECM relies on)
+        inv = int(~R(prods[-1]))
+
+        affine = []
+        for idx in reversed(range(len(finite))):
+            X, Y, Z = finite[idx]
+            Z_inv   = inv * prods[idx-1] % p if idx else inv
+            inv     = inv * Z % p
+
+            Z_inv2 = Z_inv * Z_inv % p
+            affine.append((X * Z_inv2 % p, Y * Z_inv2 * Z_inv % p, 1))
+
+        affine = iter(affine[::-1])
+        return [next(affine) if P[2] else _JACOBIAN_INFINITY for P in points]
+
+
+    def _jacobian_mul(self, k: int, p: int) -> 'WeierstrassPoint':
+        """
+        Windowed-NAF scalar multiplication in Jacobian coordinates.
+        """
+        curve = self.curve
+
+        if k < 0:
+            return (-self)._jacobian_mul(-k, p)
+
+        if not k or self == curve.POINT_AT_INFINITY:
+            return curve.POINT_AT_INFINITY
+
+        bits = k.bit_length()
+        if bits < 24:
+            width = 2
+        elif bits < 80:
+            width = 3
+        elif bits < 320:
+            width = 4
+        else:
+            width = 5
+
+        a = int(curve.a) % p
+        P = (int(self.x), int(self.y), 1)
+
+        # Precompute odd multiples `P`, `3P`, ..., `(2^(width-1) - 1)P`
+        table = [P]
+        if width > 2:
+            P2 = _jacobian_double(P, a, p)
+            for _ in range(2**(width-2) - 1):
+                table.append(_jacobian_add(table[-1], P2, a, p))
+
+            table = self._normalize_jacobian(table, p)
+
+
+        Q = _JACOBIAN_INFINITY
+        for digit in _encoding.to_NAF(k, width):
+            Q = _jacobian_double(Q, a, p)
+
+            if digit > 0:
+                Q = _jacobian_add_affine(Q, table[digit >> 1], a, p)
+
+            elif digit < 0:
+                x, y, z = table[-digit >> 1]
+                Q = _jacobian_add_affine(Q, (x, -y % p, z), a, p)
+
+
+        if not Q[2]:
+            return curve.POINT_AT_INFINITY
+
+        x, y, _ = self._normalize_jacobian([Q], p)[0]
+        return WeierstrassPoint(x, y, curve)
+
+
     def __radd__(self, P2: 'WeierstrassPoint') -> 'WeierstrassPoint':
         return self.__add__(P2)
 
@@ -142,7 +341,7 @@ class WeierstrassCurve(Ring):
         self.ring = ring or self.a.ring
 
         if check_singularity:
-            if (4 * a**3 - 27 * b**2) == self.ring.zero:
+            if (4 * a**3 + 27 * b**2) == self.ring.zero:
                 raise ValueError("Elliptic curve can't be singular")
 
         if base_tuple:
@@ -151,6 +350,8 @@ class WeierstrassCurve(Ring):
         self.G_cache     = base_tuple
         self.PAF_cache   = None
         self.dpoly_cache = {}
+        self.jacobian_cache = None
+        self.fixed_base_tables = None
 
         self.cardinality_cache = cardinality
         self.curve_poly_ring   = self[Symbol('x'), Symbol('y')]
@@ -209,6 +410,23 @@ class WeierstrassCurve(Ring):
         return int(self.ring.quotient)
 
 
+    @property
+    def jacobian_modulus(self) -> int:
+        """
+        The integer modulus used for Jacobian arithmetic if the curve is over `ZZ/ZZ(n)`, otherwise None.
+        """
+        if self.jacobian_cache is None:
+            from samson.math.algebra.rings.quotient_ring import QuotientRing
+            from samson.math.algebra.rings.integer_ring import ZZ
+
+            if type(self.ring) is QuotientRing and self.ring.ring == ZZ:
+                self.jacobian_cache = int(self.ring.quotient)
+            else:
+                self.jacobian_cache = 0
+
+        return self.jacobian_cache
+
+
     @staticmethod
     def random_curve(n: RingElement) -> 'WeierstrassCurve':
         R = n.ring
@@ -220,7 +438,7 @@ class WeierstrassCurve(Ring):
             a = R.random(n)
             b = (y**2 - x**3 - (a * x))
 
-            g = gcd(int(4 * a**3 - 27 * b**2), n)
+            g = gcd(int(4 * a**3 + 27 * b**2), n)
             if g != n:
                 break
 
@@ -228,12 +446,13 @@ class WeierstrassCurve(Ring):
         return curve, g
 
 
-    def cardinality(self, algorithm: EllipticCurveCardAlg=EllipticCurveCardAlg.AUTO) -> int:
+    def cardinality(self, algorithm: EllipticCurveCardAlg=EllipticCurveCardAlg.AUTO, workers: int=1) -> int:
         """
         Calculates the cardinality (number of points) of the curve and caches the result.
 
         Parameters:
             algorithm (EllipticCurveCardAlg): Algorithm to use.
+            workers                    (int): Number of processes Schoof's algorithm may use.
         
         Returns:
             int: Cardinality of the curve.
@@ -244,13 +463,13 @@ class WeierstrassCurve(Ring):
                 if curve_size <= 96:
                     self.cardinality_cache = self.G.order
                 else:
-                    self.cardinality_cache = schoofs_algorithm(self)
+                    self.cardinality_cache = schoofs_algorithm(self, workers=workers)
 
             elif algorithm == EllipticCurveCardAlg.BSGS:
                 self.cardinality_cache = self.G.order
 
             elif algorithm == EllipticCurveCardAlg.SCHOOFS:
-                self.cardinality_cache = schoofs_algorithm(self)
+                self.cardinality_cache = schoofs_algorithm(self, workers=workers)
 
             else:
                 raise Exception(f"Unkown EllipticCurveCardAlg '{algorithm}'")
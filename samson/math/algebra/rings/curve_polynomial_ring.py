@@ -191,6 +191,9 @@ class CurvePolynomialRing(Ring):
             elif type(poly) is int:
                 coerced.append(Polynomial([poly], self.poly_ring.ring))
 
+            elif getattr(poly, 'ring', None) == self.poly_ring.ring:
+                coerced.append(self.poly_ring(poly))
+
             else:
                 raise CoercionException(self, other)
 
@@ -69,6 +69,7 @@ class PolynomialRing(Ring):
             Polynomial: Coerced element.
         """
         from samson.math.sparse_vector import SparseVector
+        from samson.math.dense_mod_vector import DenseModVector
 
         # Handle grounds
         type_o = type(other)
@@ -76,7 +77,7 @@ class PolynomialRing(Ring):
             other  = [other]
             type_o = type(other)
 
-        if type_o is list or type_o is dict or type_o is SparseVector:
+        if type_o is list or type_o is dict or type_o is SparseVector or type_o is DenseModVector:
             return Polynomial(other, coeff_ring=self.ring, ring=self, symbol=self.symbol)
 
         elif type_o is Polynomial:
@@ -6,6 +6,13 @@ class QuotientElement(RingElement):
     Element of a `QuotientRing`.
     """
 
+    def __new__(cls, val: RingElement=None, ring: Ring=None):
+        # Integer quotients get the specialized element type
+        if cls is QuotientElement and ring is not None and ring.int_quotient:
+            return PrimeFieldElement(val, ring)
+
+        return object.__new__(cls)
+
     def __init__(self, val: RingElement, ring: Ring):
         """
         Parameters:
@@ -109,6 +116,204 @@ class QuotientElement(RingElement):
         return gcd(self.val, self.ring.quotient) == self.ring.ring.one
 
 
+
+_new_object = object.__new__
+
+def _prime_elem(ring: Ring, val: int) -> 'PrimeFieldElement':
+    # `val` must already be reduced
+    elem = _new_object(PrimeFieldElement)
+    elem.ring    = ring
+    elem.int_val = val
+    return elem
+
+
+class PrimeFieldElement(RingElement):
+    """
+    Element of a `QuotientRing` over an integer modulus (e.g. `ZZ/ZZ(p)`). Stores its value as a reduced Python int
+    in `__slots__` instead of wrapping an `IntegerElement`, and handles operands from the same ring and ints without
+    coercion. Everything else falls back to `QuotientElement`'s implementation.
+
+    `QuotientElement(val, ring)` returns this type automatically when `ring` has an integer quotient.
+
+    Examples:
+        >>> from samson.math.all import ZZ
+        >>> R = ZZ/ZZ(53)
+        >>> R(5) * ~R(4)
+        <PrimeFieldElement: val=41, ring=ZZ/ZZ(53)>
+
+        >>> (R(5) * 7 + 3) / R(2)
+        <PrimeFieldElement: val=19, ring=ZZ/ZZ(53)>
+
+    """
+    __slots__ = ('ring', 'int_val')
+
+    def __init__(self, val: RingElement, ring: Ring):
+        """
+        Parameters:
+            val (RingElement): Value of the element. May also be an int.
+            ring       (Ring): Parent ring.
+        """
+        self.ring    = ring
+        self.int_val = int(val) % ring.int_quotient
+
+
+    def __repr__(self):
+        return f"<PrimeFieldElement: val={self.int_val}, ring={self.ring}>"
+
+
+    def __reduce__(self):
+        return (_prime_elem, (self.ring, self.int_val))
+
+
+    @property
+    def val(self) -> RingElement:
+        return self.ring.ring(self.int_val)
+
+
+    shorthand    = QuotientElement.shorthand
+    __call__     = QuotientElement.__call__
+    __mod__      = QuotientElement.__mod__
+    __floordiv__ = QuotientElement.__floordiv__
+    __divmod__   = QuotientElement.__divmod__
+
+
+    def ordinality(self) -> int:
+        """
+        The ordinality of this element within the set.
+
+        Returns:
+            int: Ordinality.
+        """
+        return self.int_val
+
+
+    def __int__(self) -> int:
+        return self.int_val
+
+
+    def __add__(self, other: 'PrimeFieldElement') -> 'PrimeFieldElement':
+        type_o = type(other)
+        if type_o is PrimeFieldElement and other.ring.int_quotient == self.ring.int_quotient:
+            other = other.int_val
+
+        elif type_o is not int:
+            return QuotientElement.__add__(self, other)
+
+        p = self.ring.int_quotient
+        v = self.int_val + other
+
+        if 0 <= v < p:
+            return _prime_elem(self.ring, v)
+
+        return _prime_elem(self.ring, v - p if p <= v < 2*p else v % p)
+
+
+    def __radd__(self, other: int) -> 'PrimeFieldElement':
+        if type(other) is int:
+            return self + other
+
+        return RingElement.__radd__(self, other)
+
+
+    def __sub__(self, other: 'PrimeFieldElement') -> 'PrimeFieldElement':
+        type_o = type(other)
+        if type_o is PrimeFieldElement and other.ring.int_quotient == self.ring.int_quotient:
+            other = other.int_val
+
+        elif type_o is not int:
+            return QuotientElement.__sub__(self, other)
+
+        v = self.int_val - other
+        return _prime_elem(self.ring, v if v >= 0 else v % self.ring.int_quotient)
+
+
+    def __rsub__(self, other: int) -> 'PrimeFieldElement':
+        if type(other) is int:
+            return _prime_elem(self.ring, (other - self.int_val) % self.ring.int_quotient)
+
+        return RingElement.__rsub__(self, other)
+
+
+    def __mul__(self, other: 'PrimeFieldElement') -> 'PrimeFieldElement':
+        type_o = type(other)
+        if type_o is PrimeFieldElement and other.ring.int_quotient == self.ring.int_quotient:
+            other = other.int_val
+
+        elif type_o is not int:
+            return QuotientElement.__mul__(self, other)
+
+        return _prime_elem(self.ring, self.int_val * other % self.ring.int_quotient)
+
+
+    def __rmul__(self, other: int) -> 'PrimeFieldElement':
+        if type(other) is int:
+            return self * other
+
+        return RingElement.__rmul__(self, other)
+
+
+    def __pow__(self, exponent: int) -> 'PrimeFieldElement':
+        if type(exponent) is not int:
+            return RingElement.__pow__(self, exponent)
+
+        base = self
+        if exponent < 0:
+            base     = ~self
+            exponent = -exponent
+
+        return _prime_elem(self.ring, pow(base.int_val, exponent, self.ring.int_quotient))
+
+
+    def __invert__(self) -> 'PrimeFieldElement':
+        try:
+            return _prime_elem(self.ring, pow(self.int_val, -1, self.ring.int_quotient))
+        except ValueError:
+            # Raises the usual `NotInvertibleException`
+            return QuotientElement.__invert__(self)
+
+
+    def __truediv__(self, other: 'PrimeFieldElement') -> 'PrimeFieldElement':
+        type_o = type(other)
+        if type_o is PrimeFieldElement and other.ring.int_quotient == self.ring.int_quotient:
+            return self * ~other
+
+        elif type_o is int:
+            return self * ~_prime_elem(self.ring, other % self.ring.int_quotient)
+
+        return QuotientElement.__truediv__(self, other)
+
+
+    def __neg__(self) -> 'PrimeFieldElement':
+        return _prime_elem(self.ring, -self.int_val % self.ring.int_quotient)
+
+
+    def __eq__(self, other: 'PrimeFieldElement') -> bool:
+        if type(other) is int:
+            return self.int_val == other
+
+        return type(other) is PrimeFieldElement and self.int_val == other.int_val and (self.ring is other.ring or self.ring == other.ring)
+
+
+    def __hash__(self) -> int:
+        return hash((self.ring.ring, self.int_val)) + hash(self.ring)
+
+
+    def __bool__(self) -> bool:
+        return self.int_val != 0
+
+
+    def is_invertible(self) -> bool:
+        """
+        Determines if the element is invertible.
+
+        Returns:
+            bool: Whether the element is invertible.
+        """
+        from math import gcd
+        return gcd(self.int_val, self.ring.int_quotient) == 1
+
+
+
 class QuotientRing(Ring):
     """
     Ring built from an underlying ring and quotient.
@@ -117,7 +322,7 @@ class QuotientRing(Ring):
         >>> from samson.math.all import *
         >>> quot_ring = ZZ/ZZ(53)
         >>> quot_ring(5) * ~quot_ring(4)
-        <QuotientElement: val=41, ring=ZZ/ZZ(53)>
+        <PrimeFieldElement: val=41, ring=ZZ/ZZ(53)>
 
     """
 
@@ -127,10 +332,15 @@ class QuotientRing(Ring):
             quotient (RingElement): Element from the underlying ring.
             ring            (Ring): Underlying ring.
         """
+        from samson.math.algebra.rings.integer_ring import IntegerElement
+
         assert(quotient.ring == ring)
         self.ring     = ring
         self.quotient = quotient
 
+        # Plain int modulus for `PrimeFieldElement`; None for non-integer quotients
+        self.int_quotient = int(quotient) if type(quotient) is IntegerElement else None
+
         self.zero = QuotientElement(self.ring.zero, self)
         self.one  = QuotientElement(self.ring.one, self)
 
@@ -228,7 +438,11 @@ class QuotientRing(Ring):
 
 
     def is_field(self) -> bool:
-        return self.quotient.is_irreducible()
+        # Primality testing large moduli is expensive and polynomial division asks every time
+        if not hasattr(self, '_is_field_cache'):
+            self._is_field_cache = self.quotient.is_irreducible()
+
+        return self._is_field_cache
 
 
     def random(self, size: object=None) -> object:
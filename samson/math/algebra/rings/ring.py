@@ -116,7 +116,7 @@ class Ring(BaseObject):
             RingElement: Coerced element.
         """
         t_o = type(other)
-        if t_o is _quot.QuotientElement and other.ring.ring == self:
+        if (t_o is _quot.QuotientElement or t_o is _quot.PrimeFieldElement) and other.ring.ring == self:
             return other.val
 
         elif t_o is _frac.FractionFieldElement and other.ring.ring == self:
@@ -214,6 +214,8 @@ class Ring(BaseObject):
 
 
 class RingElement(BaseObject):
+    __slots__ = ()
+
     def __init__(self, ring: Ring):
         self.ring = ring
 
@@ -6,5 +6,6 @@ from .factorization.all import *
 from .matrix import Matrix
 from .polynomial import Polynomial
 from .prime_gen import PrimeEngine
+from .sparse_gf2 import SparseGF2Matrix
 from .sparse_vector import SparseVector
 from .symbols import oo, Symbol
\ No newline at end of file
@@ -0,0 +1,253 @@
+from samson.math.sparse_vector import SparseVector
+from samson.auxiliary.lazy_loader import LazyLoader
+from array import array
+
+_quot = LazyLoader('_quot', globals(), 'samson.math.algebra.rings.quotient_ring')
+
+# Residues of moduli up to this bound fit in a signed 64-bit `array`; larger ones are kept as a list of ints
+ARRAY_MODULUS_LIMIT = 2**63
+
+
+class DenseModValues(object):
+    """
+    Read-only view of the nonzero entries of a `DenseModVector` exposing the parts of the `SortedDict` interface
+    that `SparseVector.values` consumers use. `keys`, `values`, and `items` return (indexable) lists.
+    """
+
+    def __init__(self, vec: 'DenseModVector'):
+        self.vec = vec
+
+
+    def __repr__(self):
+        return f'<DenseModValues: {dict(self.items())}>'
+
+
+    def keys(self) -> list:
+        return [idx for idx, c in enumerate(self.vec.ints) if c]
+
+
+    def values(self) -> list:
+        make = self.vec._make
+        return [make(c) for c in self.vec.ints if c]
+
+
+    def items(self) -> list:
+        make = self.vec._make
+        return [(idx, make(c)) for idx, c in enumerate(self.vec.ints) if c]
+
+
+    def __iter__(self):
+        return iter(self.keys())
+
+
+    def __len__(self) -> int:
+        return self.vec.sparsity
+
+
+    def __contains__(self, idx: int) -> bool:
+        ints = self.vec.ints
+        return type(idx) is int and 0 <= idx < len(ints) and ints[idx] != 0
+
+
+    def __getitem__(self, idx: int) -> object:
+        if idx not in self:
+            raise KeyError(idx)
+
+        return self.vec._make(self.vec.ints[idx])
+
+
+    def __eq__(self, other: object) -> bool:
+        return hasattr(other, 'items') and dict(self.items()) == dict(other.items())
+
+
+    __hash__ = None
+
+
+
+class DenseModVector(object):
+    """
+    Dense stand-in for `SparseVector` over ZZ/ZZ(n). Entries are stored as plain residues in an `array('q')` (or a
+    list of ints for large moduli), and ring elements are only built when an entry is read.
+    """
+
+    def __init__(self, ints: list, ring: 'QuotientRing', reduce: bool=False):
+        """
+        Parameters:
+            ints        (list): Residues, lowest index first.
+            ring (QuotientRing): Ring with an integer quotient (i.e. `ring.int_quotient` is set).
+            reduce      (bool): Whether to reduce `ints` modulo the quotient first.
+        """
+        self.quotient_ring = ring
+        self.modulus       = ring.int_quotient
+        self.zero          = ring.zero
+        self.allow_virtual_len = True
+
+        if reduce:
+            ints = [c % self.modulus for c in ints]
+
+        self.ints = self._store(ints)
+
+
+    def __repr__(self):
+        return f'<DenseModVector: ints={list(self.ints)}, modulus={self.modulus}>'
+
+    def __str__(self):
+        return self.__repr__()
+
+
+    def __hash__(self) -> int:
+        # Matches `SparseVector` so equal vectors hash equally regardless of representation
+        return hash(tuple(self.values.items()))
+
+
+    def _store(self, ints: list) -> list:
+        if self.modulus < ARRAY_MODULUS_LIMIT:
+            return ints if type(ints) is array else array('q', ints)
+        else:
+            return ints if type(ints) is list else list(ints)
+
+
+    def _make(self, c: int) -> 'PrimeFieldElement':
+        return _quot._prime_elem(self.quotient_ring, c)
+
+
+    @staticmethod
+    def from_sparse(vec: SparseVector, ring: 'QuotientRing') -> 'DenseModVector':
+        """
+        Converts a `SparseVector` of elements of `ring` to a `DenseModVector`.
+
+        Parameters:
+            vec (SparseVector): Vector to convert.
+            ring (QuotientRing): Ring of the entries.
+
+        Returns:
+            DenseModVector: Dense vector.
+        """
+        ints = [0]*vec.len()
+        for idx, c in vec:
+            ints[idx] = int(c)
+
+        return DenseModVector(ints, ring)
+
+
+    def to_sparse(self) -> SparseVector:
+        """
+        Converts to a `SparseVector`.
+
+        Returns:
+            SparseVector: Sparse vector.
+        """
+        vec = SparseVector(self.values.items(), self.zero, allow_virtual_len=True)
+        vec.virtual_len = len(self.ints)
+        return vec
+
+
+    @property
+    def values(self) -> DenseModValues:
+        return DenseModValues(self)
+
+
+    @property
+    def virtual_len(self) -> int:
+        return len(self.ints)
+
+
+    @virtual_len.setter
+    def virtual_len(self, length: int):
+        diff = length - len(self.ints)
+        if diff > 0:
+            self.ints.extend([0]*diff)
+        elif diff < 0:
+            del self.ints[length:]
+
+
+    @property
+    def sparsity(self) -> int:
+        return len(self.ints) - self.ints.count(0)
+
+
+    def list(self) -> list:
+        return [self[i] for i in range(len(self))]
+
+
+    def _end(self) -> int:
+        ints = self.ints
+        end  = len(ints)
+        while end and not ints[end-1]:
+            end -= 1
+
+        return end
+
+
+    def trim(self):
+        del self.ints[self._end():]
+
+
+    def last(self) -> int:
+        """
+        Returns the index of the last element.
+
+        Returns:
+            int: Index of last element.
+        """
+        return max(self._end()-1, 0)
+
+
+    def __iter__(self):
+        make = self._make
+        for idx, c in enumerate(self.ints):
+            if c:
+                yield idx, make(c)
+
+
+    def map(self, func) -> SparseVector:
+        vec = SparseVector([func(idx, val) for idx, val in self], zero=self.zero, allow_virtual_len=True)
+        vec.virtual_len = max(len(self.ints), vec.last()+1)
+        return vec
+
+
+    def __getitem__(self, idx: int) -> object:
+        if type(idx) is slice:
+            return DenseModVector(self.ints[idx], self.quotient_ring)
+
+        if idx < 0:
+            idx += len(self.ints)
+
+        if 0 <= idx < len(self.ints) and self.ints[idx]:
+            return self._make(self.ints[idx])
+
+        return self.zero
+
+
+    def __setitem__(self, idx: int, obj: object):
+        if not type(idx) is int:
+            raise ValueError('idx must be an integer')
+
+        if idx >= len(self.ints):
+            self.virtual_len = idx+1
+
+        self.ints[idx] = int(obj) % self.modulus
+
+
+    def __contains__(self, idx: int) -> bool:
+        return idx in self.values
+
+
+    def __eq__(self, other: object) -> bool:
+        if type(other) is DenseModVector:
+            return self.modulus == other.modulus and self.ints[:self._end()] == other.ints[:other._end()]
+
+        # Comparing sparsity first avoids building elements for the common comparison against zero
+        return self.sparsity == other.sparsity and self.values == other.values
+
+
+    def __len__(self) -> int:
+        return self.len()
+
+
+    def len(self) -> int:
+        return len(self.ints)
+
+
+    def append(self, item: object):
+        self[len(self.ints)] = item
@@ -105,6 +105,10 @@ class Factors(object):
         try:
             attr = object.__getattribute__(self, name)
         except AttributeError:
+            # `factors` is missing while unpickling, so don't recurse looking for it
+            if name == 'factors':
+                raise
+
             attr = getattr(self.factors, name)
 
         return attr
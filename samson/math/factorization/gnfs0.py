@@ -1,4 +1,4 @@
-from samson.math.factorization.siqs import BMatrix, ge_f2_nullspace, solve_row
+from samson.math.sparse_gf2 import SparseGF2Matrix
 from samson.utilities.exceptions import NoSolutionException
 from samson.math.all import *
 import math
@@ -288,8 +288,7 @@ def build_matrix(facs, R, A, num_cols):
         exp_vecs.append(exp_vec)
 
 
-    exp_ints = [int(''.join([str(int(exp_vec[b])) for b in range(len(exp_vec))])[::-1], 2) for exp_vec in exp_vecs]
-    return BMatrix(exp_ints, num_cols=num_cols).T
+    return SparseGF2Matrix([[c for c, bit in enumerate(exp_vec) if int(bit)] for exp_vec in exp_vecs], num_cols=num_cols)
 
 
 
@@ -320,7 +319,7 @@ def gnfs(n, d, R_size=30, A_size=90, Q_size=108):
 
 
     # FIND SOLUTIONS
-    solutions, marks, M = ge_f2_nullspace(M=bexp_mat, visual=True)
+    solutions = bexp_mat.left_nullspace()
 
     if not solutions:
         raise NoSolutionException
@@ -328,8 +327,7 @@ def gnfs(n, d, R_size=30, A_size=90, Q_size=108):
 
     found = False
     while not found:
-        for solution in solutions:
-            sol_vec = solve_row(solution, M, marks)
+        for sol_vec in solutions:
             rat_sol = 1
 
             for idx in sol_vec:
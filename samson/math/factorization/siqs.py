@@ -1,11 +1,12 @@
-from samson.math.general import sieve_of_eratosthenes, legendre, ResidueSymbol, kth_root, tonelli, gcd, is_prime, batch_gcd, random_int_between, mod_inv
+from samson.math.general import sieve_of_eratosthenes, legendre, ResidueSymbol, kth_root, tonelli, gcd, is_prime, batch_gcd, random_int_between, mod_inv, product
 from samson.math.polynomial import Polynomial
-from samson.math.matrix import Matrix
+from samson.math.sparse_gf2 import SparseGF2Matrix
 from samson.math.symbols import Symbol
 from samson.math.algebra.rings.integer_ring import ZZ
 from samson.math.factorization.factors import Factors
-from samson.math.factorization.general import trial_division
-from samson.math.sparse_vector import SparseVector
+from samson.math.factorization.general import trial_division, pollards_rho
+from samson.utilities.executors import ProcessExecutor
+from samson.utilities.runtime import RUNTIME
 from tqdm import tqdm
 import math
 
@@ -32,9 +33,13 @@ _P = ZZ[_x]
 _one  = _R.one
 _zero = _R.zero
 
-SIQS_TRIAL_DIVISION_EPS   = 25
+SIQS_TRIAL_DIVISION_EPS   = 30
 SIQS_MIN_PRIME_POLYNOMIAL = 400
 SIQS_MAX_PRIME_POLYNOMIAL = 4000
+SIQS_MIN_SIEVE_PRIME      = 50
+SIQS_SIEVE_BLOCK_SIZE     = 2**16
+SIQS_LARGE_PRIME_FACTOR   = 64
+SIQS_POLYS_PER_TASK       = 8
 
 
 ###########
@@ -56,38 +61,6 @@ class PrimeBase(object):
 
 
 
-class BMatrix(object):
-    def __init__(self, rows, num_cols):
-        self.rows = rows
-        self.num_cols = num_cols
-
-
-    @property
-    def T(self):
-        T = [[b for b in bin(row)[2:].zfill(self.num_cols)[::-1]] for row in self.rows]
-        return BMatrix([int(''.join([T[r][c] for r in range(len(self.rows))][::-1]), 2) for c in range(self.num_cols)], num_cols=len(self.rows))
-
-
-    def add_pivot(self, idx, row):
-        self.rows[idx] ^= row
-
-
-    def find_pivot(self, idx):
-        row = self.rows[idx]
-        return lowest_set_bit(row) if row else None
-
-
-    def print(self):
-        print([[c for c in range(self.num_cols) if self[r, c]] for r in range(len(self.rows))])
-
-
-    def __getitem__(self, idx):
-        i, j = idx
-        return self.rows[i] >> j & 1
-
-
-
-
 ###############
 # SUBROUTINES #
 ###############
@@ -159,7 +132,7 @@ def poly_prepare_base(a, b, prime_base):
 
     for pb in prime_base:
         if a % pb.p:
-            pb.ainv  = mod_inv(a, pb.p)
+            pb.ainv  = pow(a, -1, pb.p)
             pb.soln1 = (pb.ainv * (pb.t - b)) % pb.p
             pb.soln2 = (pb.ainv * (-pb.t - b)) % pb.p
 
@@ -250,138 +223,269 @@ def lowest_set_bit(a):
 
 
 def find_next_poly(n, prime_base, i, g, B, a, b):
-    v = lowest_set_bit(i)
-    z = -1 if math.ceil(i / (2**v)) % 2 else 1
-    b = (b + 2*z*B[v-1]) % a
-
+    b = next_b(i, B, a, b)
     poly_prepare_base(a, b, prime_base)
     return gen_polys(a, b, n), a, b
 
 
-def sieve(prime_base, m):
-    sieve_array = [0]*(2*m+1)
+def next_b(i, B, a, b):
+    """
+    Gray code step from the `i-1`-th to the `i`-th `b` sharing the coefficient `a`.
+    """
+    v = lowest_set_bit(i)
+    z = -1 if math.ceil(i / 2**(v+1)) % 2 else 1
+    return (b + 2*z*B[v]) % a
+
+
 
-    for pb in prime_base:
-        if pb.soln1 is None or pb.p < 21:
-            continue
+def siqs_sieve_polys(n: int, m: int, base: tuple, a: int, bs: list, large_prime_bound: int) -> list:
+    """
+    Sieves the polynomials `((a*x + b)^2 - n) / a` over [-m, m] for each `b` in `bs` and returns their relations.
+
+    The interval is sieved in blocks of `SIQS_SIEVE_BLOCK_SIZE` byte counters. Candidates are only trial divided by the
+    primes whose roots they hit. Cofactors below `large_prime_bound` (single) or that split into two primes below it (double)
+    are kept as partial relations.
+
+    Parameters:
+        n                 (int): Integer to factor.
+        m                 (int): Half-width of the sieve interval.
+        base            (tuple): Prime base as (primes, square roots of `n` mod each prime, rounded log2 of each prime).
+        a                 (int): Shared `a` coefficient.
+        bs               (list): `b` coefficients.
+        large_prime_bound (int): Large prime bound.
+
+    Returns:
+        list: Relations as (u, u^2 - n, exponent parity mask, large primes).
+    """
+    primes, roots, logs = base
+    num_primes = len(primes)
+    size       = 2*m + 1
+    threshold  = max(round(math.log2(m * kth_root(n, 2))) - SIQS_TRIAL_DIVISION_EPS, 1)
+    hit_table  = bytes([int(i >= threshold) for i in range(256)])
+
+    # Primes dividing `a` (and tiny primes) aren't sieved; they're just divided out of candidates
+    a_mask  = 0
+    ainvs   = []
+    sieved  = []
+    divided = []
+    for idx, p in enumerate(primes):
+        if a % p:
+            ainvs.append(pow(a, -1, p))
+            if p >= SIQS_MIN_SIEVE_PRIME:
+                sieved.append(idx)
+                continue
+        else:
+            ainvs.append(None)
+            a_mask ^= 1 << (idx+1)
 
-        p  = pb.p
-        lp = pb.lp
+        divided.append(idx)
 
-        # Do the "bit sieve" heuristic
-        for soln in [pb.soln1, pb.soln2]:
-            i_start = -((m + soln) // p)
-            a_start = soln + i_start * p
 
-            for a in range(a_start+m, 2*m+1, p):
-                sieve_array[a] += lp
+    relations = []
+    for b in bs:
+        if 2 * b > a:
+            b = a - b
 
-    return sieve_array
+        c = (b*b - n) // a
 
+        solns = [None] * num_primes
+        for idx in sieved:
+            p, ainv, t = primes[idx], ainvs[idx], roots[idx]
+            solns[idx] = ((ainv * (t - b)) % p, (ainv * (-t - b)) % p)
 
 
-def create_exp_vec(facs: Factors, prime_base: list):
-    exp_vec = SparseVector({}, zero=_zero)
+        for block_start in range(0, size, SIQS_SIEVE_BLOCK_SIZE):
+            block_len = min(SIQS_SIEVE_BLOCK_SIZE, size - block_start)
+            block     = bytearray(block_len)
+            offset    = m - block_start
 
-    for idx, pb in enumerate([PrimeBase(-1, n=0, t=1, lp=1)] + prime_base):
-        if pb.p in facs and facs[pb.p] % 2:
-            exp_vec[idx] = _one
+            for idx in sieved:
+                p, lp = primes[idx], logs[idx]
+                s1, s2 = solns[idx]
 
-    exp_vec.virtual_len = len(prime_base)+1
-    return exp_vec
+                for i in range((s1 + offset) % p, block_len, p):
+                    block[i] += lp
 
+                if s1 != s2:
+                    for i in range((s2 + offset) % p, block_len, p):
+                        block[i] += lp
 
 
-def siqs_trial_div(n: int, m: int, g: Polynomial, h: Polynomial, sieve_array: list, prime_base: list, required_relations: int, smooth_relations: list, progress_update):
-    smooth_threshold = math.log2(m * kth_root(n, 2)) - SIQS_TRIAL_DIVISION_EPS
+            hits = block.translate(hit_table)
+            i    = hits.find(1)
 
-    for i, bit_smooth in enumerate(sieve_array):
-        if bit_smooth >= smooth_threshold:
-            x  = i - m
-            gx = int(g(x))
+            while i != -1:
+                x = i - offset
+                v = (a*x + 2*b)*x + c
 
-            facs = trial_division(gx, prime_base=[pb.p for pb in prime_base])
+                mask = a_mask
+                if v < 0:
+                    mask ^= 1
+                    v    = -v
 
-            # Is it smooth over the prime_base?
-            if facs.recombine() == gx:
-                u = int(h(x))
-                smooth_relations.append((u, gx, create_exp_vec(facs, prime_base)))
-                progress_update(1)
+                for idx in divided:
+                    p = primes[idx]
+                    if not v % p:
+                        e = 0
+                        while not v % p:
+                            v //= p
+                            e  += 1
 
-                if len(smooth_relations) >= required_relations:
-                    return
+                        if e & 1:
+                            mask ^= 1 << (idx+1)
 
 
+                for idx in sieved:
+                    p = primes[idx]
+                    if x % p in solns[idx]:
+                        e = 0
+                        while not v % p:
+                            v //= p
+                            e  += 1
 
-def ge_f2_nullspace(M: Matrix, visual: bool=False):
-    num_rows = len(M.rows)
-    num_cols = M.num_cols
-    marks    = [False] * num_cols
-    iterator = enumerate(M.rows)
+                        if e & 1:
+                            mask ^= 1 << (idx+1)
 
-    if visual:
-        iterator = tqdm(iterator, total=num_rows, unit='row', desc='siqs: Gaussian elimination')
 
-    for i, row in iterator:
-        j = M.find_pivot(i)
-        if j is None:
-            continue
+                u = a*x + b
+                if v == 1:
+                    relations.append((u, u*u - n, mask, ()))
 
-        marks[j] = True
+                elif v < large_prime_bound:
+                    relations.append((u, u*u - n, mask, (v,)))
 
-        for k in range(num_rows):
-            if k == i:
-                continue
+                elif v < large_prime_bound**2 and not is_prime(v):
+                    p = pollards_rho(v)
+                    q = v // p
 
-            if M[k, j]:
-                M.add_pivot(k, row)
+                    if p < large_prime_bound and q < large_prime_bound:
+                        relations.append((u, u*u - n, mask, tuple(sorted((p, q)))))
 
-    M = M.T
-    solutions = []
-    for i, mark in enumerate(marks):
-        if not mark:
-            solutions.append([M.rows[i], i])
+                i = hits.find(1, i+1)
 
-    return solutions, marks, M
+    return relations
 
 
 
-def solve_row(candidate, M, marks):
-    free_row     = candidate[0]
-    indices      = [idx for idx, val in enumerate(bin(free_row)[2:].zfill(M.num_cols)[::-1]) if val == '1']
-    solution_vec = []
+def siqs_poly_batches(n: int, m: int, prime_base: list, batch_size: int=SIQS_POLYS_PER_TASK):
+    """
+    Generates (a, [b_1, ..., b_k]) polynomial batches forever.
+    """
+    while True:
+        _, B, a, b = find_first_poly(n, m, prime_base)
+
+        bs = [b]
+        for i in range(1, 2**(len(B)-1)):
+            b = next_b(i, B, a, b)
+            bs.append(b)
+
+        for i in range(0, len(bs), batch_size):
+            yield a, bs[i:i+batch_size]
+
+
 
+class LargePrimeGraph(object):
+    """
+    Combines partial relations into full relations by finding cycles in the large prime graph.
+
+    Each partial relation is an edge between its large primes (or between 1 and its large prime). Once an edge closes a cycle,
+    the product of the relations along it has every large prime to an even power.
+
+    References:
+        "MPQS with three large primes" (https://www.iacr.org/archive/ants2002/25690226/25690226.pdf)
+    """
 
-    for r, mark in enumerate(marks):
-        if not mark:
-            continue
+    def __init__(self, n: int):
+        self.n      = n
+        self.parent = {}
+        self.forest = {}
 
-        for i in indices:
-            if M[r, i]:
-                solution_vec.append(r)
+
+    def __repr__(self):
+        return f'<LargePrimeGraph: vertices={len(self.parent)}>'
+
+
+    def find(self, v: int) -> int:
+        parent = self.parent
+        parent.setdefault(v, v)
+
+        root = v
+        while parent[root] != root:
+            root = parent[root]
+
+        while parent[v] != root:
+            parent[v], v = root, parent[v]
+
+        return root
+
+
+    def _path(self, start: int, end: int) -> list:
+        prev  = {start: None}
+        queue = [start]
+
+        for v in queue:
+            if v == end:
                 break
 
-    log.debug(f"Found linear dependencies at rows {str(solution_vec)}")
-    solution_vec.append(candidate[1])
-    return solution_vec
+            for w, relation in self.forest[v]:
+                if w not in prev:
+                    prev[w] = (v, relation)
+                    queue.append(w)
+
+        path = []
+        while prev[end]:
+            end, relation = prev[end]
+            path.append(relation)
+
+        return path
+
+
+    def add(self, relation: tuple) -> tuple:
+        """
+        Adds a partial relation.
+
+        Parameters:
+            relation (tuple): Partial relation as (u, u^2 - n, mask, large primes).
+
+        Returns:
+            tuple: Full relation (u, u^2 - n, mask) if a cycle was closed, otherwise None.
+        """
+        u, gx, mask, large_primes = relation
+        v1, v2 = (1, large_primes[0]) if len(large_primes) == 1 else large_primes
+
+        if v1 == v2:
+            return u, gx, mask
+
+        r1, r2 = self.find(v1), self.find(v2)
+
+        if r1 != r2:
+            self.parent[r1] = r2
+            self.forest.setdefault(v1, []).append((v2, relation))
+            self.forest.setdefault(v2, []).append((v1, relation))
+            return None
+
+        for o_u, o_gx, o_mask, _ in self._path(v1, v2):
+            u     = u * o_u % self.n
+            gx   *= o_gx
+            mask ^= o_mask
+
+        return u, gx, mask
 
 
 
 def solve(solution_vec, smooth_nums, n):
-    a_square = b = 1
+    b = 1
     for val in solution_vec:
-        c = smooth_nums[val]
-        a_square *= c[1]
-        b        *= c[0]
+        b = b * smooth_nums[val][0] % n
 
-    a = kth_root(a_square, 2)
+    a = math.isqrt(product([smooth_nums[val][1] for val in solution_vec])) % n
     log.debug(f"Found congruence: {a}^2 = {b}^2 mod {n}")
 
     return gcd(abs(b-a), n), gcd(abs(b+a), n)
 
 
 
-def find_factors(n: int, solutions: list, smooth_nums: list, M: BMatrix, marks: list):
+def find_factors(n: int, solutions: list, smooth_nums: list):
     primes     = Factors()
     left       = n
     composites = Factors()
@@ -390,8 +494,7 @@ def find_factors(n: int, solutions: list, smooth_nums: list, M: BMatrix, marks:
         if left == 1:
             break
 
-        sol_vec = solve_row(solution, M, marks)
-        factors = solve(sol_vec, smooth_nums, n)
+        factors = solve(solution, smooth_nums, n)
 
         for factor in factors:
             fac_prime = is_prime(factor)
@@ -438,63 +541,99 @@ def find_factors(n: int, solutions: list, smooth_nums: list, M: BMatrix, marks:
     return primes, composites
 
 
-def siqs(n: int, bound_ratio: float=1.0, relations_ratio: float=1.05, visual: bool=False):
+def siqs(n: int, bound_ratio: float=1.0, relations_ratio: float=1.05, visual: bool=False, workers: int=1):
+    """
+    Factors `n` using the Self-Initializing Quadratic Sieve with the large prime variation.
+
+    Parameters:
+        n                 (int): Integer to factor.
+        bound_ratio     (float): Multiplier for the size of the prime base.
+        relations_ratio (float): Number of relations to collect relative to the size of the prime base.
+        visual           (bool): Whether or not to display progress bars.
+        workers           (int): Number of worker processes to spread polynomials over.
+
+    Returns:
+        (Factors, Factors): Found primes and composites.
+    """
     nf, m      = siqs_choose_nf_m(len(str(n)))
-    nf        = int(nf * bound_ratio)
+    nf         = int(nf * bound_ratio)
     prime_base = find_base(n, nf)
 
+    base = ([pb.p for pb in prime_base], [pb.t for pb in prime_base], [pb.lp for pb in prime_base])
+    large_prime_bound = min(prime_base[-1].p * SIQS_LARGE_PRIME_FACTOR, prime_base[-1].p**2)
+
+    def sieve_batch(a, bs):
+        return siqs_sieve_polys(n, m, base, a, bs, large_prime_bound)
+
+    tasks = siqs_poly_batches(n, m, prime_base)
+
+    if workers > 1:
+        batches = RUNTIME.get_executor(workers, ProcessExecutor).map(sieve_batch, tasks, starmap=True, ordered=False)
+    else:
+        batches = (sieve_batch(a, bs) for a, bs in tasks)
+
+
     smooth_relations = []
-    num_poly = 0
+    graph = LargePrimeGraph(n)
+    seen  = set()
 
     log.debug(f"Searching for smooth relations using {nf} factors over interval size {m}...")
 
-    while True:
-        required_relations = round(relations_ratio*len(prime_base))
+    try:
+        while True:
+            required_relations = round(relations_ratio*len(prime_base))
 
-        if visual:
-            progress = tqdm(None, total=required_relations-len(smooth_relations), unit='relation', desc='siqs: Smooth number sieve')
-            def progress_update(x):
-                progress.update(x)
-                progress.refresh()
+            if visual:
+                progress = tqdm(None, total=required_relations-len(smooth_relations), unit='relation', desc='siqs: Smooth number sieve')
+                def progress_update(x):
+                    progress.update(x)
+                    progress.refresh()
 
-            def progress_finish():
-                progress.close()
+                def progress_finish():
+                    progress.close()
 
-        else:
-            def progress_update(x):
-                pass
+            else:
+                def progress_update(x):
+                    pass
 
-            def progress_finish():
-                pass
+                def progress_finish():
+                    pass
 
 
-        while len(smooth_relations) < required_relations:
-            if not num_poly:
-                (g, h), B, a, b = find_first_poly(n, m, prime_base)
-            else:
-                (g, h), a, b = find_next_poly(n, prime_base, num_poly, g, B, a, b)
+            while len(smooth_relations) < required_relations:
+                for relation in next(batches):
+                    u = relation[0]
+                    if u in seen:
+                        continue
 
-            num_poly = (num_poly+1) % 2**(len(B)-1)
+                    seen.add(u)
 
-            # Sieve
-            sieve_array = sieve(prime_base, m)
-            siqs_trial_div(n, m, g, h, sieve_array, prime_base, required_relations, smooth_relations, progress_update)
+                    if relation[3]:
+                        relation = graph.add(relation)
+                        if not relation:
+                            continue
+                    else:
+                        relation = relation[:3]
 
+                    smooth_relations.append(relation)
+                    progress_update(1)
 
 
-        progress_finish()
+            progress_finish()
 
-        log.debug("Solving exponent parity matrix for nullspace...")
-        # 'num_cols' is len(prime_base)+1 because we want Gaussian elimination to cancel out negatives
-        exp_vecs = [exp_vec for _, _, exp_vec in smooth_relations]
-        exp_ints = [int(''.join([str(int(exp_vec[b])) for b in range(len(exp_vec))])[::-1], 2) for exp_vec in exp_vecs]
-        bexp_mat = BMatrix(exp_ints, num_cols=len(prime_base)+1).T
+            log.debug("Solving exponent parity matrix for nullspace...")
+            # 'num_cols' is len(prime_base)+1 because we want elimination to cancel out negatives
+            bexp_mat  = SparseGF2Matrix.from_masks([mask for _, _, mask in smooth_relations], num_cols=len(prime_base)+1)
+            solutions = bexp_mat.left_nullspace()
 
-        solutions, marks, M = ge_f2_nullspace(M=bexp_mat, visual=visual)
-        primes, composites = find_factors(n=n, solutions=solutions, smooth_nums=smooth_relations, M=M, marks=marks)
+            primes, composites = find_factors(n=n, solutions=solutions, smooth_nums=smooth_relations)
 
 
-        if primes or composites:
-            return primes, composites
-        else:
-            relations_ratio += 0.05
+            if primes or composites:
+                return primes, composites
+            else:
+                relations_ratio += 0.05
+
+    finally:
+        if workers > 1:
+            batches.close()
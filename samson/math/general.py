@@ -4,6 +4,7 @@ from functools import reduce
 from types import FunctionType
 from copy import deepcopy
 from enum import Enum
+import operator
 import math
 
 # Resolve circular dependencies while reducing function-level imports
@@ -13,6 +14,11 @@ _poly         = LazyLoader('poly', globals(), 'samson.math.polynomial')
 _mat          = LazyLoader('mat', globals(), 'samson.math.matrix')
 _dense        = LazyLoader('dense', globals(), 'samson.math.dense_vector')
 _factor_gen   = LazyLoader('factor_gen', globals(), 'samson.math.factorization.general')
+_sea_mod      = LazyLoader('_sea_mod', globals(), 'samson.math.sea')
+_pollard_dlog = LazyLoader('_pollard_dlog', globals(), 'samson.math.pollard_dlog')
+
+# Frobenius traces keyed by `(a, b, p)`
+_FROBENIUS_TRACE_CACHE = {}
 
 def int_to_poly(integer: int, modulus: int=2) -> 'Polynomial':
     """
@@ -223,15 +229,20 @@ def xgcd(a: int, b: int) -> (int, int, int):
 
     R = a.ring
 
-    # Generic xgcd
-    prevx, x = R.one, R.zero; prevy, y = R.zero, R.one
-    while b:
-        q = a // b
-        x, prevx = prevx - q*x, x
-        y, prevy = prevy - q*y, y
-        a, b = b, a % b
+    # Dense polynomials over ZZ/ZZ(p) use the half-GCD
+    if type(a) is _poly.Polynomial and a.coeff_ring.is_field() and a._has_dense_gcd(b):
+        g, s, t = a._dense_xgcd(b)
+
+    else:
+        # Generic xgcd
+        prevx, x = R.one, R.zero; prevy, y = R.zero, R.one
+        while b:
+            q = a // b
+            x, prevx = prevx - q*x, x
+            y, prevy = prevy - q*y, y
+            a, b = b, a % b
 
-    g, s, t = a, prevx, prevy
+        g, s, t = a, prevx, prevy
 
     # Normalize if possible
     if g.is_invertible() and s:
@@ -611,13 +622,12 @@ def crt_lll(residues: list, remove_redundant: bool=True) -> 'QuotientElement':
         >>> x = 684250860
         >>> rings = [ZZ/ZZ(quotient) for quotient in [229, 246, 93, 22, 408]]
         >>> crt_lll([r(x) for r in rings])
-        <QuotientElement: val=684250860, ring=ZZ/ZZ(1306272792)>
+        <PrimeFieldElement: val=684250860, ring=ZZ/ZZ(1306272792)>
 
     References:
         https://grocid.net/2016/08/11/solving-problems-with-lattice-reduction/
     """
     from samson.math.algebra.fields.fraction_field import FractionField as Frac
-    import operator
     Matrix = _mat.Matrix
 
     R = residues[0].ring.ring
@@ -992,13 +1002,348 @@ def gram_schmidt(matrix: 'Matrix', full: bool=False) -> 'Matrix':
     return Q, mu
 
 
-def lll(in_basis: 'Matrix', delta: float=0.75) -> 'Matrix':
+def _lll_dot(u: list, v: list) -> int:
+    return sum(map(operator.mul, u, v))
+
+
+def _lll_integral(basis: list, delta: 'Fraction') -> bool:
+    """
+    Exact, incremental LLL over integer row vectors using only integer arithmetic. Instead
+    of rational Gram-Schmidt coefficients, the Gram determinants `d` and the scaled
+    coefficients `lam` (`d_(j+1) * mu_kj`) are updated in place after each size-reduction and swap.
+
+    Parameters:
+        basis  (list): List of integer row vectors. Modified in place.
+        delta (Fraction): Lovász constant.
+
+    Returns:
+        bool: Whether or not the reduction completed. Returns False if the rows are linearly dependent,
+        in which case `basis` is still a basis of the same lattice.
+
+    References:
+        "A Course in Computational Algebraic Number Theory" (Cohen), Algorithm 2.6.7
+    """
+    n = len(basis)
+    if not n:
+        return True
+
+    p, q = delta.numerator, delta.denominator
+
+    # Shifted by one relative to the reference: `d[i+1]` belongs to `basis[i]`
+    d   = [1] + [0]*n
+    lam = [[0]*n for _ in range(n)]
+
+
+    def size_reduce(k, l):
+        lam_k = lam[k]
+        d_l   = d[l+1]
+
+        if 2*abs(lam_k[l]) > d_l:
+            r = (2*lam_k[l] + d_l) // (2*d_l)
+            basis[k] = [a - r*b for a, b in zip(basis[k], basis[l])]
+
+            lam_k[l] -= r*d_l
+            lam_l     = lam[l]
+            for i in range(l):
+                lam_k[i] -= r*lam_l[i]
+
+
+    d[1] = _lll_dot(basis[0], basis[0])
+    if not d[1]:
+        return False
+
+    k, k_max = 1, 0
+
+    while k < n:
+        if k > k_max:
+            k_max = k
+            b_k   = basis[k]
+            lam_k = lam[k]
+
+            for j in range(k+1):
+                lam_j = lam[j]
+                u     = _lll_dot(b_k, basis[j])
+
+                for i in range(j):
+                    u = (d[i+1]*u - lam_k[i]*lam_j[i]) // d[i]
+
+                if j < k:
+                    lam_k[j] = u
+                else:
+                    d[k+1] = u
+
+            if not d[k+1]:
+                return False
+
+
+        size_reduce(k, k-1)
+        lam_k = lam[k]
+        l     = lam_k[k-1]
+
+        if q*d[k+1]*d[k-1] < p*d[k]*d[k] - q*l*l:
+            basis[k], basis[k-1] = basis[k-1], basis[k]
+            lam_k1 = lam[k-1]
+
+            for j in range(k-1):
+                lam_k[j], lam_k1[j] = lam_k1[j], lam_k[j]
+
+            B = (d[k-1]*d[k+1] + l*l) // d[k]
+
+            for i in range(k+1, k_max+1):
+                lam_i       = lam[i]
+                t           = lam_i[k]
+                lam_i[k]    = (d[k+1]*lam_i[k-1] - l*t) // d[k]
+                lam_i[k-1]  = (B*t + l*lam_i[k]) // d[k+1]
+
+            d[k] = B
+            k    = max(k-1, 1)
+        else:
+            for l in reversed(range(k-1)):
+                size_reduce(k, l)
+
+            k += 1
+
+    return True
+
+
+def _lll_rational(basis: list, delta: 'Fraction'):
+    """
+    Exact, incremental LLL over integer row vectors. Gram-Schmidt coefficients (`mu`, `B`)
+    are stored as `Fraction`s and updated in place after each size-reduction and swap.
+    Unlike `_lll_integral`, this handles linearly dependent rows, which are reduced to zero
+    vectors at the front of the basis.
+
+    Parameters:
+        basis  (list): List of integer row vectors. Modified in place.
+        delta (Fraction): Lovász constant.
+
+    References:
+        "A Course in Computational Algebraic Number Theory" (Cohen), Algorithm 2.6.3
+    """
+    from fractions import Fraction
+
+    n = len(basis)
+    if not n:
+        return
+
+    zero = Fraction(0)
+    half = Fraction(1, 2)
+    mu   = [[zero]*n for _ in range(n)]
+    B    = [zero]*n
+
+
+    def incremental_gs(k):
+        mu_k = mu[k]
+        b_k  = basis[k]
+
+        for j in range(k):
+            if B[j]:
+                mu_j = mu[j]
+                u    = Fraction(_lll_dot(b_k, basis[j]))
+
+                for i in range(j):
+                    if mu_j[i]:
+                        u -= mu_j[i]*mu_k[i]*B[i]
+
+                mu_k[j] = u / B[j]
+            else:
+                mu_k[j] = zero
+
+        B[k] = Fraction(_lll_dot(b_k, b_k)) - sum([mu_k[i]*mu_k[i]*B[i] for i in range(k)], zero)
+
+
+    def size_reduce(k, l):
+        mu_k = mu[k]
+        if abs(mu_k[l]) > half:
+            q = math.floor(mu_k[l] + half)
+            basis[k] = [a - q*b for a, b in zip(basis[k], basis[l])]
+
+            mu_k[l] -= q
+            mu_l     = mu[l]
+            for i in range(l):
+                if mu_l[i]:
+                    mu_k[i] -= q*mu_l[i]
+
+
+    def swap(k, k_max):
+        basis[k], basis[k-1] = basis[k-1], basis[k]
+        mu_k, mu_k1 = mu[k], mu[k-1]
+
+        for j in range(k-1):
+            mu_k[j], mu_k1[j] = mu_k1[j], mu_k[j]
+
+        m   = mu_k[k-1]
+        B_n = B[k] + m*m*B[k-1]
+
+        # `b_k` was in the span of the previous vectors; its projection moves down
+        if not B_n:
+            B[k], B[k-1] = B[k-1], zero
+            mu_k[k-1]    = zero
+
+            for i in range(k+1, k_max+1):
+                mu[i][k], mu[i][k-1] = mu[i][k-1], zero
+
+        else:
+            new_mu    = m*B[k-1] / B_n
+            mu_k[k-1] = new_mu
+            B[k]      = B[k-1]*B[k] / B_n
+            B[k-1]    = B_n
+
+            for i in range(k+1, k_max+1):
+                mu_i      = mu[i]
+                t         = mu_i[k]
+                mu_i[k]   = mu_i[k-1] - m*t
+                mu_i[k-1] = t + new_mu*mu_i[k]
+
+                if not B[k]:
+                    mu_i[k] = zero
+
+
+    incremental_gs(0)
+    k, k_max = 1, 0
+
+    while k < n:
+        if k > k_max:
+            k_max = k
+            incremental_gs(k)
+
+        size_reduce(k, k-1)
+        mu_k = mu[k][k-1]
+
+        if B[k] < (delta - mu_k*mu_k)*B[k-1]:
+            swap(k, k_max)
+            k = max(k-1, 1)
+        else:
+            for l in reversed(range(k-1)):
+                size_reduce(k, l)
+
+            k += 1
+
+
+
+def _lll_fp(basis: list, delta: float, eta: float=0.51, max_passes: int=128) -> bool:
+    """
+    Floating-point LLL in the style of Schnorr-Euchner and Nguyen-Stehlé's L2. The basis is kept
+    exactly as integers while the Gram-Schmidt vectors and coefficients are approximated with
+    doubles and recomputed lazily (by modified Gram-Schmidt) for the current row only.
+
+    Parameters:
+        basis     (list): List of integer row vectors. Modified in place.
+        delta    (float): Lovász constant.
+        eta      (float): Size-reduction bound (slightly above 1/2 to absorb rounding error).
+        max_passes (int): Maximum number of lazy size-reduction passes before giving up on a row.
+
+    Returns:
+        bool: Whether or not the reduction completed. On failure (loss of precision, overflow, or
+        linear dependence), `basis` is still a basis of the same lattice and can be handed to an exact engine.
+
+    References:
+        "Lattice Basis Reduction: Improved Practical Algorithms and Solving Subset Sum Problems" (Schnorr, Euchner)
+        "An LLL Algorithm with Quadratic Complexity" (https://perso.ens-lyon.fr/damien.stehle/downloads/LLL.pdf)
+    """
+    n = len(basis)
+    if n < 2:
+        return True
+
+    mu    = [[0.0]*n for _ in range(n)]
+    B     = [0.0]*n
+    ortho = [None]*n
+
+    # Column-major copy of `ortho` so projections run in C-level `sum(map(...))` calls
+    cols  = [[0.0]*n for _ in range(len(basis[0]))]
+
+
+    def orthogonalize(k):
+        mu_k = mu[k]
+        b_k  = [float(a) for a in basis[k]]
+
+        for j in range(k):
+            mu_k[j] = _lll_dot(b_k, ortho[j]) / B[j]
+
+        mu_kk = mu_k[:k]
+        v     = [a - sum(map(operator.mul, mu_kk, col)) for a, col in zip(b_k, cols)]
+
+        for a, col in zip(v, cols):
+            col[k] = a
+
+        ortho[k] = v
+        B[k]     = _lll_dot(v, v)
+
+
+    try:
+        orthogonalize(0)
+        if not B[0]:
+            return False
+
+        k = 1
+        while k < n:
+            mu_k = mu[k]
+
+            # Lazy size-reduction. Size-reduction doesn't change `ortho[k]`, so we only
+            # recompute `mu_k` when large multipliers may have amplified rounding error
+            orthogonalize(k)
+
+            for _ in range(max_passes):
+                if max([abs(m) for m in mu_k[:k]]) <= eta:
+                    break
+
+                max_X = 0
+                for j in reversed(range(k)):
+                    X = round(mu_k[j])
+
+                    if X:
+                        basis[k] = [a - X*b for a, b in zip(basis[k], basis[j])]
+                        max_X    = max(max_X, abs(X))
+
+                        mu_j = mu[j]
+                        for i in range(j):
+                            mu_k[i] -= X*mu_j[i]
+
+                        mu_k[j] -= X
+
+                if max_X > 2**10:
+                    orthogonalize(k)
+            else:
+                return False
+
+
+            # Rows are (numerically) dependent; let the exact engine handle it
+            if B[k] <= _lll_dot(basis[k], basis[k]) * 2**-90:
+                return False
+
+
+            # Lovász condition
+            m = mu_k[k-1]
+            if delta * B[k-1] > B[k] + m*m*B[k-1]:
+                basis[k], basis[k-1] = basis[k-1], basis[k]
+                k = max(k-1, 1)
+
+                if k == 1:
+                    orthogonalize(0)
+            else:
+                k += 1
+
+    except (OverflowError, ZeroDivisionError):
+        return False
+
+    return True
+
+
+
+def lll(in_basis: 'Matrix', delta: float=0.75, use_fp: bool=None) -> 'Matrix':
     """
     Performs the Lenstra–Lenstra–Lovász lattice basis reduction algorithm.
 
+    Integer and rational bases are reduced by incremental engines that update the
+    Gram-Schmidt coefficients after every size-reduction and swap instead of recomputing them.
+    The exact engine works entirely in integers. The floating-point (L2-style) engine approximates
+    Gram-Schmidt with doubles and falls back to the exact engine if it loses precision. By default,
+    the floating-point engine is only tried under PyPy, where it outperforms big integer arithmetic.
+
     Parameters:
         in_basis (Matrix): Matrix representing the original basis.
         delta     (float): Minimum optimality of the reduced basis.
+        use_fp     (bool): Whether or not to try the floating-point engine first (default: automatic).
 
     Returns:
         Matrix: Reduced basis.
@@ -1013,9 +1358,66 @@ def lll(in_basis: 'Matrix', delta: float=0.75) -> 'Matrix':
         [ 3,  2,  1,  0]
         [-2,  0,  2,  4]>
 
+        >>> lll(m, use_fp=True)
+        <Matrix: rows=
+        [ 3,  2,  1,  0]
+        [-2,  0,  2,  4]>
+
     References:
         https://github.com/orisano/olll/blob/master/olll.py
         https://en.wikipedia.org/wiki/Lenstra%E2%80%93Lenstra%E2%80%93Lov%C3%A1sz_lattice_basis_reduction_algorithm
+        https://github.com/fplll/fplll
+    """
+    from samson.math.algebra.fields.fraction_field import FractionField
+    from fractions import Fraction
+    import platform
+
+    ZZ     = _integer_ring.ZZ
+    Matrix = _mat.Matrix
+
+    # Prepare ring and basis
+    R = in_basis.coeff_ring
+    if type(R) is not FractionField:
+        R = FractionField(R)
+
+    if R.ring != ZZ:
+        return _lll_generic(in_basis, delta)
+
+
+    # Clear denominators so the engines work over the integers
+    rows  = [[R(elem) for elem in row] for row in in_basis.rows]
+    denom = reduce(lcm, [int(elem.denominator) for row in rows for elem in row], 1)
+    basis = [[int(elem.numerator) * (denom // int(elem.denominator)) for elem in row] for row in rows]
+
+
+    # The floating-point engine can't handle dependent rows or values outside of a double's range
+    if use_fp is None:
+        max_bits = max([abs(elem) for row in basis for elem in row]).bit_length()
+        use_fp   = platform.python_implementation() == 'PyPy' and max_bits < 500 and len(basis) <= len(basis[0])
+
+
+    if not (use_fp and _lll_fp(basis, float(delta))):
+        delta = Fraction(delta)
+
+        if not _lll_integral(basis, delta):
+            _lll_rational(basis, delta)
+
+
+    return Matrix([[R((elem, denom)) for elem in row] for row in basis], coeff_ring=R)
+
+
+
+def _lll_generic(in_basis: 'Matrix', delta: float=0.75) -> 'Matrix':
+    """
+    Ring-agnostic LLL that recomputes Gram-Schmidt after every basis change. Used
+    for bases whose coefficients don't live in `ZZ` or `QQ`.
+
+    Parameters:
+        in_basis (Matrix): Matrix representing the original basis.
+        delta     (float): Minimum optimality of the reduced basis.
+
+    Returns:
+        Matrix: Reduced basis.
     """
     from samson.math.all import QQ
     Matrix = _mat.Matrix
@@ -1472,7 +1874,7 @@ def sieve_of_eratosthenes(n: int, chunk_size: int=1024, prime_base: set=None) ->
         prime_base = PRIMES_UNDER_1000.difference({2})
 
     # Generate what's in prime_base first
-    for p in {2}.union(prime_base):
+    for p in sorted({2}.union(prime_base)):
         if p < n:
             yield p
         else:
@@ -1606,13 +2008,35 @@ def frobenius_endomorphism(point: object, q: int) -> object:
 
 
 
-def frobenius_trace_mod_l(curve: object, l: int) -> 'QuotientElement':
+def _frobenius_trace_mod_2(curve: object) -> 'QuotientElement':
+    # Handle 2 separately to prevent multivariate poly arithmetic
+    from samson.math.symbols import Symbol
+    ZZ = _integer_ring.ZZ
+
+    x = Symbol('x')
+    _ = curve.ring[x]
+
+    defining_poly = x**3 + curve.a*x + curve.b
+    bases         = frobenius_monomial_base(defining_poly)
+    rational_char = bases[1]
+    rational_char = frobenius_map(rational_char, defining_poly, bases=bases)
+
+    if gcd(rational_char - x, defining_poly).degree() == 0:
+        return (ZZ/ZZ(2))(1)
+    else:
+        return (ZZ/ZZ(2))(0)
+
+
+
+def frobenius_trace_mod_l(curve: object, l: int, kernel_poly: 'Polynomial'=None) -> 'QuotientElement':
     """
     Finds the Frobenius trace modulo `l` for faster computation.
 
     Parameters:
-        curve (object): Elliptic curve.
-        l        (int): Prime modulus.
+        curve           (object): Elliptic curve.
+        l                  (int): Prime modulus.
+        kernel_poly (Polynomial): Factor of the `l`-th division polynomial whose roots are a Frobenius-stable subgroup
+                                  (e.g. from `elkies_kernel_polynomial`). Defaults to the whole division polynomial.
 
     Returns:
         QuotientElement: Modular residue of the Frobenius trace.
@@ -1621,11 +2045,19 @@ def frobenius_trace_mod_l(curve: object, l: int) -> 'QuotientElement':
     from samson.math.algebra.fields.fraction_field import FractionField as Frac
     ZZ = _integer_ring.ZZ
 
+    if l == 2:
+        return _frobenius_trace_mod_2(curve)
+
     torsion_quotient_ring = ZZ/ZZ(l)
-    psi = curve.division_poly(l)
+    R = curve.curve_poly_ring
+
+    # The characteristic equation of Frobenius holds on any stable subgroup of E[l]
+    if kernel_poly is None:
+        psi = curve.division_poly(l)
+    else:
+        psi = R(kernel_poly)
 
     # Build symbolic torsion group
-    R = curve.curve_poly_ring
     S = R/psi
     T = Frac(S, simplify=False)
     sym_curve = WeierstrassCurve(a=curve.a, b=curve.b, ring=T)
@@ -1662,12 +2094,75 @@ def frobenius_trace_mod_l(curve: object, l: int) -> 'QuotientElement':
 
 
 
-def frobenius_trace(curve: object) -> int:
+def _frobenius_trace_mod_l_task(key: tuple, l: int, kernel_coeffs: list) -> int:
+    from samson.math.algebra.curves.weierstrass_curve import WeierstrassCurve
+    ZZ = _integer_ring.ZZ
+
+    a, b, p = key
+    R       = ZZ/ZZ(p)
+    curve   = WeierstrassCurve(a=R(a), b=R(b), ring=R)
+
+    if kernel_coeffs is not None:
+        kernel_poly = curve.curve_poly_ring.poly_ring(kernel_coeffs)
+    else:
+        kernel_poly = None
+
+    return int(frobenius_trace_mod_l(curve, l, kernel_poly))
+
+
+
+def _sea_torsion_plan(curve: object, bound: int) -> list:
+    """
+    Chooses torsion primes whose product reaches `bound`. Elkies primes up to `SEA_MAX_L` are preferred since they
+    only need a kernel polynomial of degree (l-1)/2; Atkin primes fall back to the full division polynomial,
+    smallest first.
+
+    Returns:
+        list: Pairs of `(l, kernel_poly)` where `kernel_poly` is None for the full division polynomial.
+    """
+    _sea = _sea_mod
+
+    use_elkies = bool(getattr(curve.ring, 'int_quotient', None))
+    total      = 1
+    plan       = []
+    atkin      = []
+
+    for l in sieve_of_eratosthenes(2**32):
+        elkies_possible = use_elkies and 2 < l <= _sea.SEA_MAX_L
+        if total >= bound or (not elkies_possible and total*math.prod(atkin) >= bound):
+            break
+
+        if l == curve.p:
+            continue
+
+        kernel_poly = _sea.elkies_kernel_polynomial(curve, l) if elkies_possible else None
+
+        if l == 2 or kernel_poly is not None:
+            plan.append((l, kernel_poly))
+            total *= l
+        else:
+            atkin.append(l)
+
+
+    for l in atkin:
+        if total >= bound:
+            break
+
+        plan.append((l, None))
+        total *= l
+
+    return plan
+
+
+
+def frobenius_trace(curve: object, workers: int=1) -> int:
     """
-    Calculates the Frobenius trace of the `curve`.
+    Calculates the Frobenius trace of the `curve` using the Schoof-Elkies-Atkin algorithm. Results are cached by the
+    curve's coefficients and field.
 
     Parameters:
         curve (object): Elliptic curve.
+        workers  (int): Number of processes to compute the residues with.
 
     Returns:
         int: Frobenius trace.
@@ -1681,45 +2176,43 @@ def frobenius_trace(curve: object) -> int:
         >>> frobenius_trace(curve)
         -3
 
+    References:
+        https://en.wikipedia.org/wiki/Schoof%E2%80%93Elkies%E2%80%93Atkin_algorithm
     """
-    from samson.math.symbols import Symbol
     ZZ = _integer_ring.ZZ
 
-    search_range      = hasse_frobenius_trace_interval(curve.p)
-    torsion_primes    = primes_product(search_range[1] - search_range[0], [curve.ring.characteristic])
-    trace_congruences = []
-
-    # Handle 2 separately to prevent multivariate poly arithmetic
-    if 2 in torsion_primes:
-        x = Symbol('x')
-        _ = curve.ring[x]
-
-        defining_poly = x**3 + curve.a*x + curve.b
-        bases         = frobenius_monomial_base(defining_poly)
-        rational_char = bases[1]
-        rational_char = frobenius_map(rational_char, defining_poly, bases=bases)
-
-        if gcd(rational_char - x, defining_poly).degree() == 0:
-            trace_congruences.append((ZZ/ZZ(2))(1))
-        else:
-            trace_congruences.append((ZZ/ZZ(2))(0))
+    key = (int(curve.a), int(curve.b), curve.p)
+    if key in _FROBENIUS_TRACE_CACHE:
+        return _FROBENIUS_TRACE_CACHE[key]
 
-        torsion_primes.remove(2)
+    search_range = hasse_frobenius_trace_interval(curve.p)
+    plan         = _sea_torsion_plan(curve, search_range[1] - search_range[0])
 
+    if workers > 1 and getattr(curve.ring, 'int_quotient', None):
+        from samson.utilities.runtime import RUNTIME
+        from samson.utilities.executors import ProcessExecutor
 
-    for l in torsion_primes:
-        trace_congruences.append(frobenius_trace_mod_l(curve, l))
+        # Symbolic curves don't serialize, so workers rebuild them from integers
+        tasks = [(key, l, [int(c) for c in kernel_poly] if kernel_poly is not None else None) for l, kernel_poly in plan]
+        residues = RUNTIME.get_executor(workers, ProcessExecutor).map(_frobenius_trace_mod_l_task, tasks, starmap=True)
+        trace_congruences = [(ZZ/ZZ(l))(r) for (l, _), r in zip(plan, residues)]
+    else:
+        trace_congruences = [frobenius_trace_mod_l(curve, l, kernel_poly) for l, kernel_poly in plan]
 
     n, mod = crt(trace_congruences)
-    return find_representative((ZZ/ZZ(mod))(n), range(*search_range))
+    trace  = find_representative((ZZ/ZZ(mod))(n), range(*search_range))
 
+    _FROBENIUS_TRACE_CACHE[key] = trace
+    return trace
 
-def schoofs_algorithm(curve: object) -> int:
+
+def schoofs_algorithm(curve: object, workers: int=1) -> int:
     """
     Performs Schoof's algorithm to count the number of points on an elliptic curve.
 
     Parameters:
         curve (object): Elliptic curve to find cardinality of.
+        workers  (int): Number of processes to compute the Frobenius trace with.
 
     Returns:
         int: Curve cardinality.
@@ -1734,7 +2227,7 @@ def schoofs_algorithm(curve: object) -> int:
         57
 
     """
-    return curve.p + 1 - frobenius_trace(curve)
+    return curve.p + 1 - frobenius_trace(curve, workers=workers)
 
 
 def bsgs(g: 'RingElement', h: 'RingElement', end: int, e: 'RingElement'=None, start: int=0) -> int:
@@ -1795,15 +2288,18 @@ def bsgs(g: 'RingElement', h: 'RingElement', end: int, e: 'RingElement'=None, st
 
 
 
-def pohlig_hellman(g: 'RingElement', h: 'RingElement', n: int=None, factors: dict=None) -> int:
+def pohlig_hellman(g: 'RingElement', h: 'RingElement', n: int=None, factors: dict=None, bsgs_limit: int=None, workers: int=1) -> int:
     """
-    Computes the discrete logarithm for finite abelian groups with a smooth order.
+    Computes the discrete logarithm for finite abelian groups with a smooth order. Each prime order subgroup is solved
+    with BSGS if its table fits in `bsgs_limit` elements and with Pollard's rho otherwise.
 
     Parameters:
-        g (RingElement): Generator element.
-        h (RingElement): Result to find discrete logarithm of.
-        n         (int): Order of the group.
-        factors  (dict): `n`'s factorization.
+        g    (RingElement): Generator element.
+        h    (RingElement): Result to find discrete logarithm of.
+        n            (int): Order of the group.
+        factors     (dict): `n`'s factorization.
+        bsgs_limit   (int): Maximum number of elements in a BSGS table. Defaults to `RUNTIME.bsgs_table_limit`.
+        workers      (int): Number of processes to run Pollard's rho with.
 
     Returns:
         int: The discrete logarithm of `h` given `g`.
@@ -1846,13 +2342,22 @@ def pohlig_hellman(g: 'RingElement', h: 'RingElement', n: int=None, factors: dic
     if not factors:
         factors = _factor_gen.factor(n)
 
-    def pp_bsgs(g, h, p, e):
+    if bsgs_limit is None:
+        from samson.utilities.runtime import RUNTIME
+        bsgs_limit = RUNTIME.bsgs_table_limit
+
+    def pp_dlog(g, h, p, e):
         x = [0]*(e+1)
 
         gamma = g*(p**(e-1))
         for k in range(e):
             h_k = (g * -x[k] + h) * (p**(e-1-k))
-            d_k = bsgs(gamma, h_k, p)
+
+            if kth_root(p, 2) <= bsgs_limit:
+                d_k = bsgs(gamma, h_k, p)
+            else:
+                d_k = _pollard_dlog.pollard_rho_dlog(gamma, h_k, p, workers=workers)
+
             x[k+1] = x[k] + d_k * p**k
 
         return x[-1]
@@ -1862,7 +2367,7 @@ def pohlig_hellman(g: 'RingElement', h: 'RingElement', n: int=None, factors: dic
         ex_i = (n // p**e)
         g_i  = g * ex_i
         h_i  = h * ex_i
-        x_i  = pp_bsgs(g_i, h_i, p, e)
+        x_i  = pp_dlog(g_i, h_i, p, e)
         x.append(x_i)
 
     return crt(list(zip(x, [p**e for p, e in  factors.items()])))[0]
@@ -0,0 +1,239 @@
+"""
+Subquadratic GCD, extended GCD, and resultants of dense polynomials over ZZ/ZZ(p) on plain int lists (lowest degree
+first), built on the Kronecker multiplication and Newton division in `samson.math.kronecker`.
+
+The half-GCD computes the product of the Euclidean quotient matrices that halves the degree of its input using only
+the top half of the coefficients, and recurses twice. This gives the exact remainder sequence of the classical
+algorithm (no normalization is done), so results agree with `RingElement.gcd` and `xgcd`.
+
+References:
+    "Modern Computer Algebra" (von zur Gathen, Gerhard), Ch. 11.
+    https://doi.org/10.1016/S0747-7171(08)80131-3 (Thull, Yap, "A Unified Approach to HGCD Algorithms")
+"""
+from samson.math.kronecker import kronecker_mul, dense_divmod, _trim
+
+# Below this many coefficients, `half_gcd` takes classical Euclidean steps instead of recursing
+HALF_GCD_THRESHOLD = 32
+
+
+def _mul(a: list, b: list, modulus: int) -> list:
+    return _trim(kronecker_mul(a, b, modulus))
+
+
+def _add(a: list, b: list, modulus: int) -> list:
+    if len(a) < len(b):
+        a, b = b, a
+
+    return _trim([(x + y) % modulus for x, y in zip(a, b)] + a[len(b):])
+
+
+def _sub(a: list, b: list, modulus: int) -> list:
+    return _add(a, [-c % modulus for c in b], modulus)
+
+
+def _apply(M: tuple, a: list, b: list, modulus: int) -> (list, list):
+    m00, m01, m10, m11 = M
+    return _add(_mul(m00, a, modulus), _mul(m01, b, modulus), modulus), _add(_mul(m10, a, modulus), _mul(m11, b, modulus), modulus)
+
+
+def _compose(N: tuple, M: tuple, modulus: int) -> tuple:
+    n00, n01, n10, n11 = N
+    m00, m01, m10, m11 = M
+    return (
+        _add(_mul(n00, m00, modulus), _mul(n01, m10, modulus), modulus),
+        _add(_mul(n00, m01, modulus), _mul(n01, m11, modulus), modulus),
+        _add(_mul(n10, m00, modulus), _mul(n11, m10, modulus), modulus),
+        _add(_mul(n10, m01, modulus), _mul(n11, m11, modulus), modulus)
+    )
+
+
+def _identity() -> tuple:
+    return ([1], [], [], [1])
+
+
+def _step(a: list, b: list, modulus: int, quotients: list) -> (tuple, list, list):
+    # One classical step: (a, b) -> (b, a mod b)
+    q, r = dense_divmod(a, b, modulus)
+    quotients.append((len(q) - 1, q[-1] if q else 0))
+
+    return ([], [1], [1], [-c % modulus for c in q]), b, r
+
+
+
+def half_gcd(a: list, b: list, modulus: int, quotients: list=None) -> tuple:
+    """
+    Computes the Euclidean transformation that halves the degree of `a`. Requires `deg(a) > deg(b)`.
+
+    Parameters:
+        a          (list): Coefficients, lowest degree first and trimmed.
+        b          (list): Coefficients, lowest degree first and trimmed.
+        modulus     (int): Prime coefficient modulus.
+        quotients  (list): If given, `(degree, leading coefficient)` of each Euclidean quotient is appended.
+
+    Returns:
+        tuple: Matrix `(m00, m01, m10, m11)` of polynomials such that `(m00*a + m01*b, m10*a + m11*b)` are consecutive
+        remainders with degrees at least and below `ceil(deg(a)/2)`, respectively.
+
+    Examples:
+        >>> from samson.math.half_gcd import half_gcd, _apply
+        >>> a, b = [3, 1, 4, 1, 5, 9, 2, 6, 5], [2, 7, 1, 8, 2, 8, 1, 8]
+        >>> [len(c) - 1 for c in _apply(half_gcd(a, b, 101), a, b, 101)]
+        [4, 3]
+
+    """
+    if quotients is None:
+        quotients = []
+
+    n = len(a) - 1
+    m = (n + 1) // 2
+
+    if len(b) - 1 < m:
+        return _identity()
+
+
+    if n < HALF_GCD_THRESHOLD:
+        M = _identity()
+        while len(b) - 1 >= m:
+            Q, a, b = _step(a, b, modulus, quotients)
+            M = _compose(Q, M, modulus)
+
+        return M
+
+
+    # Reduce the top halves, then lift the transformation back to the full operands
+    R    = half_gcd(a[m:], b[m:], modulus, quotients)
+    a, b = _apply(R, a, b, modulus)
+
+    if len(b) - 1 < m:
+        return R
+
+    Q, a, b = _step(a, b, modulus, quotients)
+    R = _compose(Q, R, modulus)
+
+    if len(b) - 1 < m:
+        return R
+
+    k = 2*m - (len(a) - 1)
+    S = half_gcd(a[k:], b[k:], modulus, quotients)
+    return _compose(S, R, modulus)
+
+
+
+def _euclid(a: list, b: list, modulus: int, quotients: list, track: bool) -> (list, tuple):
+    a, b = _trim(list(a)), _trim(list(b))
+    M    = _identity()
+
+    while b:
+        if len(a) > len(b):
+            H = half_gcd(a, b, modulus, quotients)
+            a, b = _apply(H, a, b, modulus)
+            if track:
+                M = _compose(H, M, modulus)
+
+            if not b:
+                break
+
+        Q, a, b = _step(a, b, modulus, quotients)
+        if track:
+            M = _compose(Q, M, modulus)
+
+    return a, M
+
+
+
+def fast_gcd(a: list, b: list, modulus: int) -> list:
+    """
+    GCD of dense polynomials over ZZ/ZZ(`modulus`) using `half_gcd`. Like `RingElement.gcd`, the result is the last
+    nonzero remainder and is not made monic.
+
+    Parameters:
+        a       (list): Coefficients, lowest degree first.
+        b       (list): Coefficients, lowest degree first.
+        modulus  (int): Prime coefficient modulus.
+
+    Returns:
+        list: Coefficients of the GCD, trimmed.
+
+    Examples:
+        >>> from samson.math.half_gcd import fast_gcd
+        >>> fast_gcd([1, 1, 1, 1], [3, 4, 1], 7)
+        [3, 3]
+
+    """
+    return _euclid(a, b, modulus, [], False)[0]
+
+
+
+def fast_xgcd(a: list, b: list, modulus: int) -> (list, list, list):
+    """
+    Extended GCD of dense polynomials over ZZ/ZZ(`modulus`) using `half_gcd`. `s*a + t*b = g`, and the values agree
+    with the classical extended Euclidean algorithm before any normalization.
+
+    Parameters:
+        a       (list): Coefficients, lowest degree first.
+        b       (list): Coefficients, lowest degree first.
+        modulus  (int): Prime coefficient modulus.
+
+    Returns:
+        (list, list, list): Formatted as (g, s, t).
+
+    Examples:
+        >>> from samson.math.half_gcd import fast_xgcd
+        >>> fast_xgcd([1, 1, 1, 1], [3, 4, 1], 7)
+        ([3, 3], [1], [3, 6])
+
+    """
+    g, M = _euclid(a, b, modulus, [], True)
+    return g, M[0], M[1]
+
+
+
+def dense_resultant(a: list, b: list, modulus: int) -> int:
+    """
+    Resultant of dense polynomials over ZZ/ZZ(`modulus`). The degrees and leading coefficients of the Euclidean
+    remainder sequence are recovered from the quotients `half_gcd` records, as truncated remainders don't keep them.
+
+    Parameters:
+        a       (list): Coefficients, lowest degree first.
+        b       (list): Coefficients, lowest degree first.
+        modulus  (int): Prime coefficient modulus.
+
+    Returns:
+        int: Resultant.
+
+    Examples:
+        >>> from samson.math.half_gcd import dense_resultant
+        >>> dense_resultant([1, 0, 1], [3, 1], 7)
+        3
+
+        >>> dense_resultant([1, 1, 1, 1], [3, 4, 1], 7)
+        0
+
+    References:
+        https://en.wikipedia.org/wiki/Resultant#Computation
+    """
+    a, b = _trim(list(a)), _trim(list(b))
+    if not a or not b:
+        return 0
+
+    quotients = []
+    _euclid(a, b, modulus, quotients, False)
+
+    # r_(i-1) = q_i*r_i + r_(i+1), so deg(r_i) = deg(r_(i-1)) - deg(q_i) and lc(r_i) = lc(r_(i-1)) / lc(q_i)
+    sequence = [(len(a) - 1, a[-1]), (len(b) - 1, b[-1])]
+    for q_deg, q_lc in quotients[1:]:
+        d, l = sequence[-1]
+        sequence.append((d - q_deg, l * pow(q_lc, -1, modulus) % modulus))
+
+    # res(r_(i-1), r_i) = (-1)^(d_(i-1)*d_i) * lc(r_i)^(d_(i-1) - d_(i+1)) * res(r_i, r_(i+1))
+    res = 1
+    for (d_prev, _), (d_i, l_i), (d_next, _) in zip(sequence, sequence[1:], sequence[2:]):
+        res = res * pow(l_i, d_prev - d_next, modulus) % modulus
+        if d_prev & d_i & 1:
+            res = -res % modulus
+
+    (d_prev, _), (d_last, l_last) = sequence[-2:]
+    if d_last:
+        return 0
+
+    return res * pow(l_last, d_prev, modulus) % modulus
@@ -0,0 +1,232 @@
+"""
+Dense polynomial arithmetic over ZZ and ZZ/ZZ(n) on plain int lists (lowest degree first).
+
+Multiplication uses Kronecker substitution: both operands are evaluated at `x = 2^(8*width)` by packing their
+coefficients into a single integer, multiplied with CPython's native bigint multiplication, and then unpacked.
+`width` is chosen so no coefficient of the product can overflow its slot. Division uses Newton iteration on the
+reversed divisor, so it also runs at the speed of multiplication.
+
+References:
+    https://en.wikipedia.org/wiki/Kronecker_substitution
+    "Modern Computer Algebra" (von zur Gathen, Gerhard), Ch. 8 and 9.
+"""
+
+# If either the quotient or divisor has at most this many terms, schoolbook division beats Newton iteration
+NEWTON_DIVISION_THRESHOLD = 32
+
+
+def _width(bound: int) -> int:
+    return (bound.bit_length() + 7) // 8 or 1
+
+
+def _pack(coeffs: list, width: int) -> int:
+    return int.from_bytes(b''.join([c.to_bytes(width, 'little') for c in coeffs]), 'little')
+
+
+def _pack_signed(coeffs: list, width: int) -> int:
+    positive = _pack([c if c > 0 else 0 for c in coeffs], width)
+    negative = _pack([-c if c < 0 else 0 for c in coeffs], width)
+    return positive - negative
+
+
+def _unpack(packed: int, width: int, length: int) -> list:
+    buf = packed.to_bytes(width*length, 'little')
+    fb  = int.from_bytes
+    return [fb(buf[i:i+width], 'little') for i in range(0, width*length, width)]
+
+
+def _unpack_signed(packed: int, width: int, length: int) -> list:
+    full  = 1 << (8*width)
+    half  = full >> 1
+    carry = 0
+
+    # Two's complement over the whole buffer, then borrow back into balanced digits
+    coeffs = _unpack(packed % (full**length), width, length)
+    for i, c in enumerate(coeffs):
+        c    += carry
+        carry = c >= half
+        coeffs[i] = c - full if carry else c
+
+    return coeffs
+
+
+def kronecker_mul(a: list, b: list, modulus: int=None) -> list:
+    """
+    Multiplies two dense polynomials given as lists of ints.
+
+    Parameters:
+        a       (list): Coefficients, lowest degree first. In [0, `modulus`) if `modulus` is given.
+        b       (list): Coefficients, lowest degree first. In [0, `modulus`) if `modulus` is given.
+        modulus  (int): Coefficient modulus. If None, coefficients are arbitrary integers.
+
+    Returns:
+        list: Coefficients of the product (length `len(a) + len(b) - 1`, untrimmed).
+
+    Examples:
+        >>> from samson.math.kronecker import kronecker_mul
+        >>> kronecker_mul([1, 2, 3], [4, 5])
+        [4, 13, 22, 15]
+
+        >>> kronecker_mul([-1, 0, 7], [3, -2])
+        [-3, 2, 21, -14]
+
+        >>> kronecker_mul([1, 2, 3], [4, 5], 7)
+        [4, 6, 1, 1]
+
+    """
+    if not a or not b:
+        return []
+
+    length  = len(a) + len(b) - 1
+    squared = a is b
+
+    if modulus:
+        width  = _width((modulus-1)**2 * min(len(a), len(b)))
+        packed = _pack(a, width)
+        packed = packed*packed if squared else packed*_pack(b, width)
+        return [c % modulus for c in _unpack(packed, width, length)]
+
+    else:
+        max_a  = max([abs(c) for c in a])
+        max_b  = max_a if squared else max([abs(c) for c in b])
+        if not max_a or not max_b:
+            return [0]*length
+
+        width  = _width((max_a*max_b*min(len(a), len(b))) << 1)
+        packed = _pack_signed(a, width)
+        packed = packed*packed if squared else packed*_pack_signed(b, width)
+        return _unpack_signed(packed, width, length)
+
+
+
+def newton_inverse(f: list, n: int, modulus: int) -> list:
+    """
+    Computes the power series inverse `g` such that `f*g = 1 mod x^n` over ZZ/ZZ(`modulus`).
+
+    Parameters:
+        f       (list): Coefficients, lowest degree first. `f[0]` must be invertible.
+        n        (int): Precision.
+        modulus  (int): Coefficient modulus.
+
+    Returns:
+        list: Coefficients of `g` (length `n`).
+
+    Examples:
+        >>> from samson.math.kronecker import newton_inverse, kronecker_mul
+        >>> g = newton_inverse([3, 1, 4, 1, 5], 5, 101)
+        >>> kronecker_mul([3, 1, 4, 1, 5], g, 101)[:5]
+        [1, 0, 0, 0, 0]
+
+    """
+    g = [pow(f[0], -1, modulus)]
+    k = 1
+
+    # Each step doubles the precision: g <- g*(2 - f*g)
+    while k < n:
+        k  = min(2*k, n)
+        fg = kronecker_mul(f[:k], g, modulus)[:k]
+        fg = [-c % modulus for c in fg]
+        fg[0] = (fg[0] + 2) % modulus
+        g  = kronecker_mul(g, fg, modulus)[:k]
+
+    return g + [0]*(n - len(g))
+
+
+
+def _trim(coeffs: list) -> list:
+    while coeffs and not coeffs[-1]:
+        coeffs.pop()
+
+    return coeffs
+
+
+
+def dense_divmod(a: list, b: list, modulus: int) -> (list, list):
+    """
+    Euclidean division of dense polynomials over ZZ/ZZ(`modulus`).
+
+    Parameters:
+        a       (list): Dividend, lowest degree first.
+        b       (list): Divisor, lowest degree first. Its leading coefficient must be invertible.
+        modulus  (int): Coefficient modulus.
+
+    Returns:
+        (list, list): Quotient and remainder, both trimmed.
+
+    Examples:
+        >>> from samson.math.kronecker import dense_divmod
+        >>> dense_divmod([11, 124, 47, 76, 111, 14, 14, 4, 115, 94], [101, 62, 76, 93, 92], 127)
+        ([110, 90, 88, 41, 41, 59], [77, 89, 79, 79])
+
+    """
+    a, b = _trim(list(a)), _trim(list(b))
+    n, m = len(a), len(b)
+
+    if n < m:
+        return [], a
+
+    q_len = n - m + 1
+
+    if q_len <= NEWTON_DIVISION_THRESHOLD or m <= NEWTON_DIVISION_THRESHOLD:
+        inv_lc = pow(b[-1], -1, modulus)
+        r      = a
+        q      = [0]*q_len
+
+        for i in range(q_len-1, -1, -1):
+            t = r[i+m-1] * inv_lc % modulus
+            if t:
+                q[i] = t
+                for j, c in enumerate(b):
+                    r[i+j] = (r[i+j] - t*c) % modulus
+
+        return q, _trim(r[:m-1])
+
+
+    # Reversal turns division into a power series product: rev(q) = rev(a) / rev(b) mod x^k.
+    # The inverse is computed once to precision k <= m, then the quotient is peeled off in blocks of k terms
+    k   = min(q_len, m)
+    inv = newton_inverse(b[::-1], k, modulus)
+    r   = a
+    q   = [0]*q_len
+
+    while len(r) >= m:
+        k_i   = min(k, len(r) - m + 1)
+        shift = len(r) - m + 1 - k_i
+        block = kronecker_mul(r[:-k_i-1:-1], inv[:k_i], modulus)[:k_i][::-1]
+
+        q[shift:shift+k_i] = block
+
+        # Only the lowest m-1 coefficients of the block's product survive; the rest cancel the top of `r`
+        prod = kronecker_mul(block, b, modulus)
+        r    = r[:shift+m-1]
+        for i in range(len(r) - shift):
+            r[shift+i] = (r[shift+i] - prod[i]) % modulus
+
+    return q, _trim(r)
+
+
+
+def dense_gcd(a: list, b: list, modulus: int) -> list:
+    """
+    Euclidean GCD of dense polynomials over ZZ/ZZ(`modulus`) for prime `modulus`. Like `RingElement.gcd`, the result
+    is not made monic.
+
+    Parameters:
+        a       (list): Coefficients, lowest degree first.
+        b       (list): Coefficients, lowest degree first.
+        modulus  (int): Prime coefficient modulus.
+
+    Returns:
+        list: Coefficients of the GCD, trimmed.
+
+    Examples:
+        >>> from samson.math.kronecker import dense_gcd
+        >>> dense_gcd([1, 1, 1, 1], [3, 4, 1], 7)
+        [3, 3]
+
+    """
+    a, b = _trim(list(a)), _trim(list(b))
+    while b:
+        a, b = b, dense_divmod(a, b, modulus)[1]
+
+    return a
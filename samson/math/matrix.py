@@ -344,12 +344,13 @@ class Matrix(RingElement):
         return Matrix(self.rows + rows, coeff_ring=self.coeff_ring, ring=self.ring)
 
 
-    def LLL(self, delta: float=0.75) -> 'Matrix':
+    def LLL(self, delta: float=0.75, use_fp: bool=None) -> 'Matrix':
         """
         Performs the Lenstra–Lenstra–Lovász lattice basis reduction algorithm.
 
         Parameters:
             delta (float): Minimum optimality of the reduced basis.
+            use_fp (bool): Whether or not to try the floating-point engine first (default: automatic).
 
         Returns:
             Matrix: Reduced basis.
@@ -364,7 +365,7 @@ class Matrix(RingElement):
             [-2,  0,  2,  4]>
     
         """
-        return lll(self, delta)
+        return lll(self, delta, use_fp)
 
 
     def gram_schmidt(self, full: bool=False) -> 'Matrix':
@@ -0,0 +1,374 @@
+"""
+Pollard's rho and lambda (kangaroo) methods for discrete logarithms in generic groups, with collisions detected through
+distinguished points (van Oorschot-Wiener).
+
+Every walk visits elements of the form g*c0 + h*c1 and keeps track of (c0, c1). Walks only report the elements whose
+key has `dp_bits` zero bits ("distinguished points"), so the store holds a small fraction of the elements visited and
+walks can run independently in worker processes. Once two walks collide they follow the same path and meet again at
+the next distinguished point, where their coefficients give the logarithm.
+
+References:
+    "Parallel Collision Search with Cryptanalytic Applications" (van Oorschot, Wiener)
+    "Handbook of Elliptic and Hyperelliptic Curve Cryptography" (Cohen, Frey), Ch. 19.
+    https://en.wikipedia.org/wiki/Pollard%27s_rho_algorithm_for_logarithms
+"""
+from samson.math.general import random_int, gcd, mod_inv, kth_root
+from samson.utilities.exceptions import ProbabilisticFailureException
+from samson.utilities.executors import ProcessExecutor
+from samson.utilities.runtime import RUNTIME
+from types import FunctionType
+from collections import deque
+import pickle
+import os
+
+# Number of steps in the r-adding walk. Teske found 20 to be indistinguishable from a random walk
+RHO_PARTITIONS = 20
+
+# Rho trails are short, so several are shipped to a worker at once
+RHO_TRAILS_PER_TASK = 64
+
+
+def _element_key(elem: 'RingElement') -> object:
+    # `hash` on most rings depends on the process, so points and residues are keyed by their integers
+    if hasattr(elem, 'x') and hasattr(elem, 'y'):
+        return (int(elem.x), int(elem.y))
+
+    return int(elem)
+
+
+
+def _walk(g: 'RingElement', h: 'RingElement', n: int, steps: list, coeffs: tuple, key: FunctionType, dp_bits: int, max_steps: int, stop_at_dp: bool) -> (list, tuple):
+    c0, c1  = coeffs
+    elem    = g*c0 + h*c1
+    r       = len(steps)
+    dp_mask = (1 << dp_bits) - 1
+    dps     = []
+
+    for _ in range(max_steps):
+        k = key(elem)
+        j, tag = divmod(hash(k), r)
+
+        if not j & dp_mask:
+            dps.append((k, (c0, c1)))
+
+            if stop_at_dp:
+                return dps, None
+
+        M, u, v = steps[tag]
+        elem += M
+        c0   += u
+        c1   += v
+
+        if n:
+            c0 %= n
+            c1 %= n
+
+
+    return dps, None if stop_at_dp else (c0, c1)
+
+
+
+def _solve_collision(c: tuple, d: tuple, n: int, max_candidates: int=2**16) -> list:
+    # g*c0 + h*c1 == g*d0 + h*d1 gives (d1 - c1)*x = c0 - d0 (mod n)
+    a = c[0] - d[0]
+    b = d[1] - c[1]
+
+    if not n:
+        return [a // b] if b and not a % b else []
+
+    a %= n
+    b %= n
+    q  = gcd(b, n)
+
+    if a % q or q > max_candidates:
+        return []
+
+    m  = n // q
+    x0 = (a // q) * mod_inv(b // q, m) % m
+    return [x0 + i*m for i in range(q)]
+
+
+
+class DistinguishedPointStore(object):
+    """
+    Distinguished points of a single discrete logarithm search, keyed by element key.
+
+    If `path` is set, points are appended to the file as they're found and loaded back on construction, so a search
+    can be resumed after a restart. The file starts with a header describing the problem and the walk, which later
+    runs reuse.
+    """
+
+    def __init__(self, path: str=None):
+        """
+        Parameters:
+            path (str): File to persist points in.
+        """
+        self.path   = path
+        self.header = None
+        self.points = {}
+
+        if path and os.path.exists(path):
+            self._load()
+
+
+    def __repr__(self):
+        return f'<DistinguishedPointStore: path={self.path}, points={len(self.points)}>'
+
+    def __str__(self):
+        return self.__repr__()
+
+
+    def __len__(self) -> int:
+        return len(self.points)
+
+
+    def _load(self):
+        with open(self.path, 'rb') as f:
+            try:
+                self.header = pickle.load(f)
+
+                while True:
+                    k, coeffs = pickle.load(f)
+                    self.points.setdefault(k, coeffs)
+
+            # A run killed mid-write leaves a truncated record
+            except (EOFError, pickle.UnpicklingError):
+                pass
+
+
+    def _append(self, record: object):
+        if self.path:
+            with open(self.path, 'ab') as f:
+                pickle.dump(record, f)
+
+
+    def set_header(self, header: dict):
+        """
+        Sets the description of the problem and walk. Must be called before points are added to a new store.
+
+        Parameters:
+            header (dict): Problem description.
+        """
+        if self.header is None:
+            self.header = header
+
+            if self.path:
+                with open(self.path, 'wb') as f:
+                    pickle.dump(header, f)
+
+        elif self.header['problem'] != header['problem']:
+            raise ValueError(f"Distinguished point store at {self.path} belongs to a different problem")
+
+
+    def add(self, k: object, coeffs: tuple) -> tuple:
+        """
+        Adds a distinguished point.
+
+        Parameters:
+            k      (object): Element key.
+            coeffs  (tuple): Coefficients (c0, c1) of the element.
+
+        Returns:
+            tuple: Coefficients already stored under `k`, or None if the point is new.
+        """
+        if k in self.points:
+            return self.points[k]
+
+        self.points[k] = coeffs
+        self._append((k, coeffs))
+        return None
+
+
+
+def _search(g: 'RingElement', h: 'RingElement', n: int, steps: list, key: FunctionType, dp_bits: int, store: DistinguishedPointStore, new_walk: FunctionType, walks: list, stop_at_dp: bool, max_steps: int, budget: int, workers: int, chunksize: int=1) -> int:
+    pending = deque(walks)
+
+    def tasks():
+        while True:
+            coeffs = pending.popleft() if pending else new_walk()
+            yield (g, h, n, steps, coeffs, key, dp_bits, max_steps, stop_at_dp)
+
+
+    if workers > 1:
+        results = RUNTIME.get_executor(workers, ProcessExecutor, chunksize=chunksize).map(_walk, tasks(), starmap=True, ordered=False)
+    else:
+        results = (_walk(*task) for task in tasks())
+
+
+    try:
+        for _ in range(budget):
+            dps, end = next(results)
+
+            for k, coeffs in dps:
+                other = store.add(k, coeffs)
+                if other is None:
+                    continue
+
+                for x in _solve_collision(coeffs, other, n):
+                    if g*x == h:
+                        return x
+
+                # This walk now retraces the other one
+                end = None
+                break
+
+
+            if end is not None:
+                pending.append(end)
+
+    finally:
+        results.close()
+
+    raise ProbabilisticFailureException("Discrete logarithm not found")
+
+
+
+def _open_store(store: DistinguishedPointStore, path: str, header: dict) -> DistinguishedPointStore:
+    if store is None:
+        store = DistinguishedPointStore(path)
+
+    store.set_header(header)
+    return store
+
+
+
+def pollard_rho_dlog(g: 'RingElement', h: 'RingElement', n: int=None, workers: int=1, dp_bits: int=None, path: str=None, store: DistinguishedPointStore=None, key: FunctionType=None) -> int:
+    """
+    Finds the discrete logarithm of `h` to the base `g` using Pollard's rho method with an r-adding walk. Memory use
+    is the number of distinguished points, about sqrt(`n`)/2^`dp_bits`.
+
+    Parameters:
+        g                 (RingElement): Base.
+        h                 (RingElement): Element to find the discrete logarithm of.
+        n                         (int): Order of `g`. Should be prime.
+        workers                   (int): Number of processes to run walks in.
+        dp_bits                   (int): Number of zero bits that make a point distinguished.
+        path                      (str): File to persist distinguished points in.
+        store (DistinguishedPointStore): Store to share between calls (overrides `path`).
+        key                      (func): Maps elements to process-independent hashable keys.
+
+    Returns:
+        int: The discrete logarithm of `h` given `g`.
+
+    Examples:
+        >>> from samson.math.pollard_dlog import pollard_rho_dlog
+        >>> from samson.math.algebra.all import *
+        >>> ring  = ZZ/ZZ(1000003)
+        >>> curve = WeierstrassCurve(a=ring(2), b=ring(3), ring=ring)
+        >>> g = curve.G
+        >>> h = g*123456
+        >>> g*pollard_rho_dlog(g, h, g.order) == h
+        True
+
+        >>> R = (ZZ/ZZ(2039)).mul_group()
+        >>> pollard_rho_dlog(R(7), R(7)*1000, 1019)
+        1000
+
+    References:
+        https://en.wikipedia.org/wiki/Pollard%27s_rho_algorithm_for_logarithms
+    """
+    if not n:
+        n = g.order
+
+    key = key or _element_key
+
+    if dp_bits is None:
+        dp_bits = max(0, n.bit_length() // 4 - 2)
+
+    header = {'problem': (key(g), key(h), n), 'dp_bits': dp_bits, 'coeffs': [(random_int(n), random_int(n)) for _ in range(RHO_PARTITIONS)]}
+    store  = _open_store(store, path, header)
+    coeffs = store.header['coeffs']
+    dp_bits = store.header['dp_bits']
+
+    steps = [(g*u + h*v, u, v) for u, v in coeffs]
+
+    # Give up after many times the expected number of walks
+    expected = (kth_root(n, 2) >> dp_bits) + 1
+    budget   = 32*expected + 16*workers
+
+    return _search(
+        g, h, n, steps, key, dp_bits, store,
+        new_walk=lambda: (random_int(n), random_int(n)),
+        walks=[],
+        stop_at_dp=True,
+        max_steps=20 << dp_bits,
+        budget=budget,
+        workers=workers,
+        chunksize=RHO_TRAILS_PER_TASK
+    )
+
+
+
+def pollard_lambda_dlog(g: 'RingElement', h: 'RingElement', a: int, b: int, workers: int=1, dp_bits: int=None, path: str=None, store: DistinguishedPointStore=None, key: FunctionType=None) -> int:
+    """
+    Finds the discrete logarithm of `h` to the base `g` in the interval [`a`, `b`] using Pollard's lambda method with
+    parallel tame and wild kangaroos.
+
+    Parameters:
+        g                 (RingElement): Base.
+        h                 (RingElement): Element to find the discrete logarithm of.
+        a                         (int): Interval start.
+        b                         (int): Interval end.
+        workers                   (int): Number of processes to run kangaroos in.
+        dp_bits                   (int): Number of zero bits that make a point distinguished.
+        path                      (str): File to persist distinguished points in.
+        store (DistinguishedPointStore): Store to share between calls (overrides `path`).
+        key                      (func): Maps elements to process-independent hashable keys.
+
+    Returns:
+        int: The discrete logarithm of `h` given `g`.
+
+    Examples:
+        >>> from samson.math.pollard_dlog import pollard_lambda_dlog
+        >>> from samson.math.general import find_prime
+        >>> from samson.math.algebra.all import *
+        >>> R = (ZZ/ZZ(find_prime(256))).mul_group()
+        >>> g = R(5)
+        >>> x = 2**128 + 1234567
+        >>> pollard_lambda_dlog(g, g*x, 2**128, 2**128 + 2**24) == x
+        True
+
+    References:
+        https://en.wikipedia.org/wiki/Pollard%27s_kangaroo_algorithm
+    """
+    key   = key or _element_key
+    width = b - a
+
+    if dp_bits is None:
+        dp_bits = max(0, width.bit_length() // 4 - 2)
+
+    # Jumps are powers of two with a mean of about (number of kangaroos)*sqrt(width)/4
+    kangaroos = 2*max(workers, 1)
+    mean_jump = max(1, kangaroos*kth_root(width, 2) // 4)
+
+    k = 1
+    while (1 << k) // k < mean_jump:
+        k += 1
+
+    header = {'problem': (key(g), key(h), a, b), 'dp_bits': dp_bits, 'jumps': [1 << i for i in range(k)]}
+    store  = _open_store(store, path, header)
+    jumps  = store.header['jumps']
+    dp_bits = store.header['dp_bits']
+
+    steps = [(g*u, u, 0) for u in jumps]
+    half  = width // 2 + 1
+
+    # Tame kangaroos start in the upper half of the interval, wild ones at `h` plus an offset in [0, half)
+    def new_walk(wild: int):
+        return (random_int(half), 1) if wild else (a + half + random_int(half), 0)
+
+    max_steps = 16 << dp_bits
+    budget    = 64*((kth_root(width, 2) + (kangaroos << dp_bits)) // max_steps + kangaroos)
+
+    # Half the herd is wild. Retired kangaroos are replaced by one of either kind
+    walks = [new_walk(i & 1) for i in range(kangaroos)]
+
+    return _search(
+        g, h, None, steps, key, dp_bits, store,
+        new_walk=lambda: new_walk(random_int(2)),
+        walks=walks,
+        stop_at_dp=False,
+        max_steps=max_steps,
+        budget=budget,
+        workers=workers
+    )
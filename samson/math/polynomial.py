@@ -3,10 +3,17 @@ from samson.math.general import square_and_mul, gcd, kth_root, coppersmiths
 from samson.math.factorization.general import factor as factor_int, pk_1_smallest_divisor
 from samson.math.factorization.factors import Factors
 from samson.math.sparse_vector import SparseVector
+from samson.math.dense_mod_vector import DenseModVector
+from samson.math.kronecker import kronecker_mul, dense_divmod, dense_gcd
+from samson.math.half_gcd import fast_gcd, fast_xgcd, dense_resultant
 from samson.utilities.general import add_or_increment
+from samson.auxiliary.lazy_loader import LazyLoader
 from types import FunctionType
 import itertools
 
+_integer_ring = LazyLoader('_integer_ring', globals(), 'samson.math.algebra.rings.integer_ring')
+_quot         = LazyLoader('_quot', globals(), 'samson.math.algebra.rings.quotient_ring')
+
 class Polynomial(RingElement):
 
     def __init__(self, coeffs: list, coeff_ring: Ring=None, symbol: object=None, ring: Ring=None):
@@ -46,6 +53,12 @@ class Polynomial(RingElement):
 
             self.coeffs = coeffs
 
+        elif c_type is DenseModVector:
+            if not self.coeff_ring:
+                self.coeff_ring = coeffs.quotient_ring
+
+            self.coeffs = coeffs
+
         else:
             raise Exception(f"'coeffs' is not of an accepted type. Received {type(coeffs)}")
 
@@ -57,6 +70,9 @@ class Polynomial(RingElement):
         if len(self.coeffs.values) == 0:
             self.coeffs = self._create_sparse([self.coeff_ring.zero])
 
+        elif getattr(self.coeff_ring, 'int_quotient', None):
+            self.coeffs = self._select_storage(self.coeffs)
+
 
 
     def shorthand(self, tinyhand: bool=False) -> str:
@@ -124,7 +140,7 @@ class Polynomial(RingElement):
 
     def __getitem__(self, idx: int) -> object:
         vec = self.coeffs[idx]
-        if type(vec) is SparseVector:
+        if type(vec) in (SparseVector, DenseModVector):
             return self._create_poly(vec)
         else:
             return vec
@@ -162,6 +178,15 @@ class Polynomial(RingElement):
         total    = self.coeff_ring.zero
         last_idx = coeffs.last()
 
+        if type(coeffs) is DenseModVector and (type(x) is int or type(x) is _quot.PrimeFieldElement and x.ring == self.coeff_ring):
+            p = coeffs.modulus
+            x = int(x)
+            total = 0
+            for c in reversed(coeffs.ints):
+                total = (total*x + c) % p
+
+            return coeffs._make(total)
+
         for idx, c in coeffs.values.items()[::-1]:
             total *= x**(last_idx-idx)
             total += c
@@ -323,6 +348,47 @@ class Polynomial(RingElement):
         return Polynomial(vec, coeff_ring=self.coeff_ring, ring=self.ring, symbol=self.symbol)
 
 
+    def _int_modulus(self) -> int:
+        # 0 for ZZ, `n` for ZZ/ZZ(n), and None if the coefficients aren't integers
+        if type(self.coeff_ring) is _integer_ring.IntegerRing:
+            return 0
+
+        return getattr(self.coeff_ring, 'int_quotient', None)
+
+
+    def _select_storage(self, vec: SparseVector) -> SparseVector:
+        # Coefficients in ZZ/ZZ(n) are kept as a `DenseModVector` of residues once they're dense enough
+        from samson.utilities.runtime import RUNTIME
+
+        dense = RUNTIME.poly_dense_heuristic(vec)
+        if dense and type(vec) is SparseVector:
+            return DenseModVector.from_sparse(vec, self.coeff_ring)
+
+        elif not dense and type(vec) is DenseModVector:
+            return vec.to_sparse()
+
+        return vec
+
+
+    def _int_coeffs(self) -> list:
+        if type(self.coeffs) is DenseModVector:
+            return list(self.coeffs.ints[:self.degree()+1])
+
+        coeffs = [0]*(self.degree()+1)
+        for idx, coeff in self.coeffs:
+            coeffs[idx] = int(coeff)
+
+        return coeffs
+
+
+    def _from_int_coeffs(self, coeffs: list) -> 'Polynomial':
+        R = self.coeff_ring
+        if getattr(R, 'int_quotient', None):
+            return self._create_poly(DenseModVector(coeffs, R))
+
+        return self._create_poly({idx: _integer_ring.IntegerElement(c, R) for idx, c in enumerate(coeffs) if c})
+
+
     def map_coeffs(self, func: FunctionType) -> 'Polynomial':
         return self._create_poly(self.coeffs.map(func))
 
@@ -1038,6 +1104,8 @@ class Polynomial(RingElement):
             (<Polynomial: -2*x**7, coeff_ring=ZZ>, <Polynomial: 9*x**10 + 24*x**9 + 95*x**8 + -6*x**6 + -16*x**5 + 70*x**4 + -3*x**2 + -8*x + 35, coeff_ring=ZZ>)
 
         """
+        from samson.utilities.runtime import RUNTIME
+
         # Check for zero
         other = self.ring.coerce(other)
         assert other != self.ring.zero
@@ -1047,11 +1115,18 @@ class Polynomial(RingElement):
         if n > self.degree():
             return self.ring.zero, self
 
+        is_field = self.coeff_ring.is_field()
+        modulus  = self._int_modulus()
+
+        # Dense ZZ/ZZ(p) fast path (Newton division over Kronecker products)
+        if modulus and is_field and RUNTIME.poly_kronecker_heuristic(self, other):
+            q, r = dense_divmod(self._int_coeffs(), other._int_coeffs(), modulus)
+            return self._from_int_coeffs(q), self._from_int_coeffs(r)
+
         q = self.ring.zero
         r = self
 
         remainder = self._create_sparse([0])
-        is_field  = self.coeff_ring.is_field()
 
         zero, one = self.coeff_ring.zero, self.coeff_ring.one
 
@@ -1090,9 +1165,17 @@ class Polynomial(RingElement):
         return q, r
 
 
+    def _is_dense_with(self, other: 'Polynomial') -> bool:
+        return type(self.coeffs) is DenseModVector or type(other.coeffs) is DenseModVector
+
+
     def __add__(self, other: 'Polynomial') -> 'Polynomial':
         other = self.ring.coerce(other)
 
+        if self._is_dense_with(other):
+            p = self.coeff_ring.int_quotient
+            return self._from_int_coeffs([(a + b) % p for a, b in itertools.zip_longest(self._int_coeffs(), other._int_coeffs(), fillvalue=0)])
+
         vec = self._create_sparse([])
         for idx, coeff in self.coeffs:
             vec[idx] = coeff + other.coeffs[idx]
@@ -1107,6 +1190,10 @@ class Polynomial(RingElement):
     def __sub__(self, other: 'Polynomial') -> 'Polynomial':
         other = self.ring.coerce(other)
 
+        if self._is_dense_with(other):
+            p = self.coeff_ring.int_quotient
+            return self._from_int_coeffs([(a - b) % p for a, b in itertools.zip_longest(self._int_coeffs(), other._int_coeffs(), fillvalue=0)])
+
         vec = self._create_sparse([])
         for idx, coeff in self.coeffs:
             vec[idx] = coeff - other.coeffs[idx]
@@ -1126,9 +1213,16 @@ class Polynomial(RingElement):
         if gmul is not None:
             return gmul
 
-        other = self.ring.coerce(other)
+        other   = self.ring.coerce(other)
+        modulus = self._int_modulus()
+
+        if modulus is not None and RUNTIME.poly_kronecker_heuristic(self, other):
+            # Kronecker substitution for integer coefficients
+            a = self._int_coeffs()
+            b = a if other is self else other._int_coeffs()
+            poly = self._from_int_coeffs(kronecker_mul(a, b, modulus or None))
 
-        if not RUNTIME.poly_fft_heuristic(self, other):
+        elif not RUNTIME.poly_fft_heuristic(self, other):
             # Naive convolution
             new_coeffs = self._create_sparse([])
 
@@ -1184,6 +1278,10 @@ class Polynomial(RingElement):
 
 
     def __neg__(self) -> object:
+        if type(self.coeffs) is DenseModVector:
+            p = self.coeffs.modulus
+            return self._from_int_coeffs([-c % p for c in self.coeffs.ints])
+
         return self._create_poly([(idx, -coeff) for idx, coeff in self.coeffs])
 
 
@@ -1236,6 +1334,9 @@ class Polynomial(RingElement):
 
 
     def __lshift__(self, num: int):
+        if type(self.coeffs) is DenseModVector:
+            return self._from_int_coeffs([0]*num + self._int_coeffs())
+
         return self._create_poly(self._create_sparse([(idx+num, coeff) for idx, coeff in self.coeffs]))
 
 
@@ -1255,6 +1356,88 @@ class Polynomial(RingElement):
 
 
 
+    def _has_dense_gcd(self, other: 'Polynomial') -> bool:
+        return bool(getattr(self.coeff_ring, 'int_quotient', None)) and type(other) is Polynomial and other.coeff_ring == self.coeff_ring and self._is_dense_with(other)
+
+
+    def _dense_gcd(self, other: 'Polynomial') -> 'Polynomial':
+        from samson.utilities.runtime import RUNTIME
+
+        a, b = self._int_coeffs(), other._int_coeffs()
+        p    = self.coeff_ring.int_quotient
+
+        if RUNTIME.poly_half_gcd_heuristic(self, other):
+            return self._from_int_coeffs(fast_gcd(a, b, p))
+        else:
+            return self._from_int_coeffs(dense_gcd(a, b, p))
+
+
+    def _dense_xgcd(self, other: 'Polynomial') -> ('Polynomial', 'Polynomial', 'Polynomial'):
+        # Unnormalized (g, s, t) of the extended Euclidean algorithm over ZZ/ZZ(p); see `samson.math.general.xgcd`
+        g, s, t = fast_xgcd(self._int_coeffs(), other._int_coeffs(), self.coeff_ring.int_quotient)
+        return self._from_int_coeffs(g), self._from_int_coeffs(s), self._from_int_coeffs(t)
+
+
+    def resultant(self, other: 'Polynomial') -> RingElement:
+        """
+        Computes the resultant of `self` and `other`, i.e. the determinant of their Sylvester matrix. It's zero
+        if and only if they share a root.
+
+        Parameters:
+            other (Polynomial): Other polynomial.
+
+        Returns:
+            RingElement: Resultant in the coefficient ring.
+
+        Examples:
+            >>> from samson.math.all import ZZ, Symbol
+            >>> x = Symbol('x')
+            >>> _ = ZZ[x]
+            >>> (x**2 + 1).resultant(x - 3)
+            <IntegerElement: val=10, ring=ZZ>
+
+            >>> P = (ZZ/ZZ(7))[x]
+            >>> P(x**3 + x**2 + x + 1).resultant(P(x**2 + 4*x + 3))
+            <PrimeFieldElement: val=0, ring=ZZ/ZZ(7)>
+
+        References:
+            https://en.wikipedia.org/wiki/Resultant#Computation
+        """
+        from samson.math.algebra.fields.fraction_field import FractionField
+
+        R     = self.coeff_ring
+        other = self.ring.coerce(other)
+
+        if not self or not other:
+            return R.zero
+
+        if not R.is_field():
+            Q   = FractionField(R)
+            res = self.change_ring(Q).resultant(other.change_ring(Q))
+            return res.numerator // res.denominator
+
+        if getattr(R, 'int_quotient', None):
+            return R(dense_resultant(self._int_coeffs(), other._int_coeffs(), R.int_quotient))
+
+
+        # res(a, b) = (-1)^(deg(a)*deg(b)) * lc(b)^(deg(a) - deg(a mod b)) * res(b, a mod b)
+        a, b = self, other
+        res  = R.one
+        while b.degree():
+            r = a % b
+            if not r:
+                return R.zero
+
+            res *= b.LC()**(a.degree() - r.degree())
+            if a.degree() & b.degree() & 1:
+                res = -res
+
+            a, b = b, r
+
+        return res * b.LC()**a.degree()
+
+
+
     def gcd(self, other: 'Polynomial', use_naive: bool=False) -> 'Polynomial':
         """
         References:
@@ -1265,10 +1448,20 @@ class Polynomial(RingElement):
         # Euclidean division is only defined for polynomials over a field
         R = self.coeff_ring
         if R.is_field():
+            if self._has_dense_gcd(other):
+                return self._dense_gcd(other)
+
             return super().gcd(other)
 
         elif use_naive:
             # Assumes invertibility despite not being a field
+            if self._has_dense_gcd(other):
+                try:
+                    return self._dense_gcd(other).monic()
+                except ValueError:
+                    # A leading coefficient isn't invertible; let the generic path raise
+                    pass
+
             # We use monic to reduce the leading coefficient so the algorithm will terminate
             a, b = self, other
             while b:
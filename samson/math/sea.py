@@ -0,0 +1,373 @@
+"""
+Elkies' improvement to Schoof's algorithm (SEA) for curves y^2 = x^3 + ax + b over ZZ/ZZ(p) on plain int lists.
+
+For a torsion prime `l`, the classical modular polynomial Phi_l(X, Y) vanishes at (j(E), j(E')) exactly when E' is
+`l`-isogenous to E. If Phi_l(X, j(E)) has a root in ZZ/ZZ(p), `l` is an Elkies prime: Frobenius has an eigenspace of
+dimension one in E[l], and the kernel of the isogeny is cut out by a factor of the division polynomial psi_l of degree
+(l-1)/2 instead of (l^2-1)/2. The trace modulo `l` can then be found working modulo that factor.
+
+The Phi_l are derived from the q-expansion of the j-function rather than shipped as data, and are kept in a table
+keyed by `(l, modulus)` once computed.
+
+References:
+    "Elliptic Curves in Cryptography" (Blake, Seroussi, Smart), Ch. VII.
+    https://www.mat.uniroma2.it/~schoof/ctg.pdf (Schoof, "Counting points on elliptic curves over finite fields")
+    https://doi.org/10.1090/S0025-5718-98-00962-4 (Bostan, Morain, Salvy, Schost, "Fast algorithms for computing isogenies")
+"""
+from samson.math.kronecker import kronecker_mul, dense_divmod, _trim
+from samson.math.half_gcd import fast_gcd
+from samson.auxiliary.lazy_loader import LazyLoader
+
+_integer_ring = LazyLoader('_integer_ring', globals(), 'samson.math.algebra.rings.integer_ring')
+_symbols      = LazyLoader('_symbols', globals(), 'samson.math.symbols')
+
+# Largest torsion prime for which `elkies_kernel_polynomial` is attempted
+SEA_MAX_L = 41
+
+# Table of computed classical modular polynomials keyed by `(l, modulus)`
+_MODULAR_POLYNOMIALS = {}
+
+
+def _reduce(coeffs: list, modulus: int) -> list:
+    return [c % modulus for c in coeffs] if modulus else coeffs
+
+
+def _series_mul(a: list, b: list, n: int, modulus: int) -> list:
+    return (kronecker_mul(a[:n], b[:n], modulus) + [0]*n)[:n]
+
+
+def j_invariant_series(n: int, modulus: int=None) -> list:
+    """
+    Coefficients of the q-expansion of the j-function, j(q) = E4(q)^3 / Delta(q), starting from q^-1.
+
+    Parameters:
+        n       (int): Number of coefficients.
+        modulus (int): If given, coefficients are reduced modulo `modulus`.
+
+    Returns:
+        list: Coefficients of q^-1, q^0, ..., q^(n-2).
+
+    Examples:
+        >>> from samson.math.sea import j_invariant_series
+        >>> j_invariant_series(4)
+        [1, 744, 196884, 21493760]
+
+    """
+    # E4 = 1 + 240*sum(sigma_3(k) q^k)
+    sigma3 = [0]*n
+    for d in range(1, n):
+        d3 = d**3
+        for k in range(d, n, d):
+            sigma3[k] += d3
+
+    E4 = _reduce([1] + [240*s for s in sigma3[1:]], modulus)
+
+    # q/Delta = prod(1 - q^k)^-24 = (sum p(k) q^k)^24 for the partition numbers p(k)
+    partitions = [1] + [0]*(n-1)
+    for k in range(1, n):
+        total, i = 0, 1
+        while True:
+            for pent, sign in ((i*(3*i-1)//2, 1 if i & 1 else -1), (i*(3*i+1)//2, 1 if i & 1 else -1)):
+                if pent <= k:
+                    total += sign*partitions[k-pent]
+
+            if i*(3*i-1)//2 > k:
+                break
+
+            i += 1
+
+        partitions[k] = total % modulus if modulus else total
+
+    P3  = _series_mul(_series_mul(partitions, partitions, n, modulus), partitions, n, modulus)
+    P24 = P3
+    for _ in range(3):
+        P24 = _series_mul(P24, P24, n, modulus)
+
+    E4_3 = _series_mul(_series_mul(E4, E4, n, modulus), E4, n, modulus)
+    return _series_mul(E4_3, P24, n, modulus)
+
+
+
+def classical_modular_polynomial(l: int, modulus: int=None) -> dict:
+    """
+    Computes the classical modular polynomial Phi_l(X, Y) for prime `l`. Its coefficients are the unknowns of
+    Phi_l(j(q^l), j(q)) = 0, which are solved for one at a time in decreasing order of pole.
+
+    Parameters:
+        l       (int): Prime level.
+        modulus (int): If given, coefficients are computed modulo `modulus`.
+
+    Returns:
+        dict: Nonzero coefficients keyed by `(i, k)` for the monomial X^i*Y^k.
+
+    Examples:
+        >>> from samson.math.sea import classical_modular_polynomial
+        >>> phi = classical_modular_polynomial(2)
+        >>> phi[(3, 0)], phi[(1, 1)], phi[(2, 1)], phi[(0, 0)]
+        (1, 40773375, 1488, -157464000000000)
+
+    References:
+        https://en.wikipedia.org/wiki/Modular_equation
+    """
+    key = (l, modulus)
+    if key in _MODULAR_POLYNOMIALS:
+        return _MODULAR_POLYNOMIALS[key]
+
+    # Only the polar part and constant term have to cancel. Series are stored shifted by their pole, so
+    # P1[b] = (q*j(q))^b and Pl[a] = (q^l*j(q^l))^a
+    top = l*(l+1)
+    n   = top + 1
+    J1  = j_invariant_series(n, modulus)
+    Jl  = [0]*n
+    for k in range(0, n, l):
+        Jl[k] = J1[k // l]
+
+    P1, Pl = [[1] + [0]*(n-1)], [[1] + [0]*(n-1)]
+    for _ in range(l+1):
+        P1.append(_series_mul(P1[-1], J1, n, modulus))
+        Pl.append(_series_mul(Pl[-1], Jl, n, modulus))
+
+    # `residual[e]` is the coefficient of q^-e of the sum of the terms found so far
+    residual = [0]*n
+
+    def add_series(series, pole):
+        for k in range(pole+1):
+            residual[pole-k] += series[k]
+
+        if modulus:
+            for e in range(pole+1):
+                residual[e] %= modulus
+
+
+    def combine(terms, length):
+        combined = [0]*length
+        for c, series, shift in terms:
+            for k in range(shift, length):
+                combined[k] += c*series[k-shift]
+
+        return _reduce(combined, modulus)
+
+
+    coeffs = {(l+1, 0): 1, (0, l+1): 1}
+    add_series(Pl[l+1], l*(l+1))
+    add_series(P1[l+1], l+1)
+
+    # Phi_l is symmetric, monic in each variable, and has degree at most `l` in the other variable otherwise. Going
+    # down the rows, the unknowns c[a,b] for b <= a have poles l*a + b which no other unknown term reaches, so each
+    # is forced by the residual at its pole. Within a row, only the low coefficients of the row's own terms matter
+    for a in range(l, -1, -1):
+        row = {}
+        for b in range(a, -1, -1):
+            value = residual[l*a + b]
+            for b2, c2 in row.items():
+                s = b2 - b
+                value += c2*(P1[b2][s] + (Pl[a][l]*P1[b2][s-l] if s >= l else 0))
+
+            # The transposed term X^(l-1)*Y^l also has pole l^2
+            if a == l and b == 0:
+                value += row[l-1]
+
+            row[b] = -value % modulus if modulus else -value
+
+
+        for b, c in row.items():
+            coeffs[(a, b)] = coeffs[(b, a)] = c
+
+        # Add the row and its transpose to the residual with one product each
+        pole = l*a + a
+        add_series(_series_mul(Pl[a], combine([(c, P1[b], a-b) for b, c in row.items()], pole+1), pole+1, modulus), pole)
+
+        if a:
+            pole = l*(a-1) + a
+            add_series(_series_mul(P1[a], combine([(c, Pl[b], l*(a-1-b)) for b, c in row.items() if b < a], pole+1), pole+1, modulus), pole)
+
+
+    phi = {k: v for k, v in coeffs.items() if v}
+    _MODULAR_POLYNOMIALS[key] = phi
+    return phi
+
+
+
+def _powmod(base: list, exponent: int, mod: list, modulus: int) -> list:
+    result = [1]
+    base   = dense_divmod(base, mod, modulus)[1]
+
+    while exponent:
+        if exponent & 1:
+            result = dense_divmod(kronecker_mul(result, base, modulus), mod, modulus)[1]
+
+        base = dense_divmod(kronecker_mul(base, base, modulus), mod, modulus)[1]
+        exponent >>= 1
+
+    return result
+
+
+
+def _phi_partial(phi: dict, dx: int, dy: int, x: int, y: int, modulus: int) -> int:
+    total = 0
+    for (i, k), c in phi.items():
+        if i >= dx and k >= dy:
+            falling = 1
+            for m in range(dx):
+                falling *= i - m
+
+            for m in range(dy):
+                falling *= k - m
+
+            total += c*falling*pow(x, i - dx, modulus)*pow(y, k - dy, modulus)
+
+    return total % modulus
+
+
+
+def _weierstrass_coeffs(a: int, b: int, n: int, modulus: int) -> list:
+    # Laurent coefficients of the Weierstrass function: wp(z) = z^-2 + sum(c_k z^(2k))
+    c = [0, -a*pow(5, -1, modulus) % modulus, -b*pow(7, -1, modulus) % modulus]
+    for k in range(3, n+1):
+        c.append(3*pow((k-2)*(2*k+3), -1, modulus)*sum(c[i]*c[k-1-i] for i in range(1, k-1)) % modulus)
+
+    return c
+
+
+
+def isogenous_j_invariants(a: int, b: int, l: int, modulus: int) -> list:
+    """
+    Finds the j-invariants of the curves `l`-isogenous to y^2 = x^3 + `a`x + `b` over ZZ/ZZ(`modulus`). The list is
+    empty exactly when `l` is an Atkin prime for the curve.
+
+    Parameters:
+        a       (int): Curve coefficient.
+        b       (int): Curve coefficient.
+        l       (int): Odd prime.
+        modulus (int): Prime modulus of the field.
+
+    Returns:
+        list: Roots of Phi_l(X, j) in ZZ/ZZ(`modulus`).
+    """
+    p = modulus
+    j = 6912*a**3*pow(4*a**3 + 27*b**2, -1, p) % p
+
+    phi = classical_modular_polynomial(l, p)
+    f   = [0]*(l+2)
+    for (i, k), c in phi.items():
+        f[k] = (f[k] + c*pow(j, i, p)) % p
+
+    f = _trim(f)
+
+    # The roots of `f` in the field are those of gcd(X^p - X, f)
+    frob = _powmod([0, 1], p, f, p) + [0, 0]
+    frob[1] -= 1
+    g = fast_gcd(f, _trim([c % p for c in frob]), p)
+
+    if len(g) < 2:
+        return []
+
+    ZZ = _integer_ring.ZZ
+    x  = _symbols.Symbol('x')
+    return [int(r) for r in (ZZ/ZZ(p))[x](g).roots()]
+
+
+
+def elkies_kernel_polynomial(curve: 'WeierstrassCurve', l: int) -> 'Polynomial':
+    """
+    Computes the kernel polynomial of an `l`-isogeny from `curve`, the factor of the `l`-th division polynomial of
+    degree (l-1)/2 vanishing on the kernel. The isogenous curve comes from a root of the modular polynomial, and the
+    power sums of the kernel's x-coordinates from comparing the Laurent expansions of both Weierstrass functions.
+
+    Parameters:
+        curve (WeierstrassCurve): Short Weierstrass curve over ZZ/ZZ(p) with large enough `p`.
+        l                  (int): Odd prime.
+
+    Returns:
+        Polynomial: Monic kernel polynomial, or None if `l` is an Atkin prime or the curve is degenerate for these
+        formulas (e.g. j = 0 or 1728).
+
+    Examples:
+        >>> from samson.math.sea import elkies_kernel_polynomial
+        >>> from samson.math.algebra.all import *
+        >>> ring  = ZZ/ZZ(1000003)
+        >>> curve = WeierstrassCurve(a=3, b=5, ring=ring)
+        >>> h = elkies_kernel_polynomial(curve, 7)
+        >>> h.degree(), curve.division_poly(7).x_poly % h == h.ring.zero
+        (3, True)
+
+    References:
+        "Elliptic Curves in Cryptography" (Blake, Seroussi, Smart), Ch. VII.3-VII.4.
+    """
+    p    = curve.p
+    a, b = int(curve.a), int(curve.b)
+    d    = (l-1) // 2
+
+    # Denominators below go up to (2d+1)! and (d-2)(2d+3)
+    if not a or not b or p <= 2*l + 3:
+        return None
+
+    inv = lambda v: pow(v % p, -1, p)
+
+    j_tilde = isogenous_j_invariants(a, b, l, p)
+    if not j_tilde:
+        return None
+
+    j   = 6912*a**3*inv(4*a**3 + 27*b**2) % p
+    jt  = j_tilde[0]
+    phi = classical_modular_polynomial(l, p)
+
+    Px, Py   = _phi_partial(phi, 1, 0, j, jt, p), _phi_partial(phi, 0, 1, j, jt, p)
+    Pxx, Pyy = _phi_partial(phi, 2, 0, j, jt, p), _phi_partial(phi, 0, 2, j, jt, p)
+    Pxy      = _phi_partial(phi, 1, 1, j, jt, p)
+
+    # Repeated roots and the special j-invariants would need higher derivatives
+    if not Px or not Py or jt in (0, 1728):
+        return None
+
+    # Normalized Eisenstein series of both curves
+    E4, E6 = -a*inv(3) % p, -b*inv(2) % p
+    jp  = -E6*j*inv(E4) % p
+    jtp = -jp*Px*inv(l*Py) % p
+    E4t = jtp**2*inv(jt*(jt - 1728)) % p
+    E6t = -E4t*jtp*inv(jt) % p
+
+    if not E4t or not E6t:
+        return None
+
+    at, bt = -3*l**4*E4t % p, -2*l**6*E6t % p
+
+    J  = -(jp**2*Pxx + 2*l*jp*jtp*Pxy + l**2*jtp**2*Pyy)*inv(jp*Px) % p
+    p1 = l*inv(2)*J + l*inv(4)*(E4**2*inv(E6) - l*E4t**2*inv(E6t)) + l*inv(3)*(E6*inv(E4) - l*E6t*inv(E4t))
+
+    # `p1` is stated for y^2 = x^3 - E4/48*x - E6/864, whose x-coordinates are -1/12 of ours
+    S = [(l-1) % p, -12*p1 % p]
+
+    # d^2/dz^2 f(wp) = f''(wp)*(4wp^3 + 4a*wp + 4b) + f'(wp)*(6wp^2 + 2a), so W[k] is the 2k-th derivative of wp
+    # as a polynomial in wp, and summing it over the kernel gives (2k)! times the difference of Laurent coefficients
+    c, ct  = _weierstrass_coeffs(a, b, d, p), _weierstrass_coeffs(at, bt, d, p)
+    W      = [0, 1]
+    factorial = 1
+
+    for k in range(1, d):
+        dW  = [i*W[i] % p for i in range(1, len(W))]
+        ddW = [i*dW[i] % p for i in range(1, len(dW))]
+        W   = [0]*(len(W)+1)
+
+        for i, v in enumerate(ddW):
+            for e, m in ((0, 4*b), (1, 4*a), (3, 4)):
+                W[i+e] += v*m
+
+        for i, v in enumerate(dW):
+            for e, m in ((0, 2*a), (2, 6)):
+                W[i+e] += v*m
+
+        W = [v % p for v in W]
+        factorial = factorial*(2*k-1)*(2*k) % p
+
+        acc = factorial*(ct[k] - c[k]) - sum(W[m]*S[m] for m in range(k+1))
+        S.append(acc*inv(W[k+1]) % p)
+
+    # Each x-coordinate appears twice among the kernel points, so halve the power sums and apply Newton's identities
+    s = [S[m]*inv(2) % p for m in range(d+1)]
+    e = [1]
+    for k in range(1, d+1):
+        e.append(sum((-1)**(i-1)*e[k-i]*s[i] for i in range(1, k+1))*inv(k) % p)
+
+    P = curve.curve_poly_ring.poly_ring
+    return P([(-1)**(d-k)*e[d-k] % p for k in range(d+1)])
@@ -0,0 +1,534 @@
+from samson.utilities.general import rand_bytes
+from collections import defaultdict
+import logging
+
+log = logging.getLogger(__name__)
+
+GF2_DENSE_THRESHOLD = 2**14
+GF2_SGE_EXCESS      = 64
+
+
+def _transpose_words(words: list, width: int) -> list:
+    """
+    Transposes a list of `width`-bit words into `width` integers of `len(words)` bits. Bit `i` of
+    output `j` is bit `j` of word `len(words)-1-i`; only the ordering needs to be consistent.
+    """
+    if not words:
+        return [0]*width
+
+    fmt = f'0{width}b'
+    return [int(''.join(col), 2) for col in zip(*[format(word, fmt) for word in words])][::-1]
+
+
+def _mul_tables(M: list) -> list:
+    """
+    Builds 8-bit lookup tables for right-multiplying blocks by the 64x64 matrix `M`.
+    """
+    tables = []
+    for k in range(0, 64, 8):
+        table = [0]*256
+        for b, row in enumerate(M[k:k+8]):
+            step = 1 << b
+            for v in range(step):
+                table[v | step] = table[v] ^ row
+
+        tables.append(table)
+
+    return tables
+
+
+def _block_mul(V: list, M: list) -> list:
+    """
+    Computes `V*M` where `V` is a block vector and `M` is a 64x64 matrix.
+    """
+    t0, t1, t2, t3, t4, t5, t6, t7 = _mul_tables(M)
+    return [t0[v & 255] ^ t1[v >> 8 & 255] ^ t2[v >> 16 & 255] ^ t3[v >> 24 & 255] ^ t4[v >> 32 & 255] ^ t5[v >> 40 & 255] ^ t6[v >> 48 & 255] ^ t7[v >> 56] for v in V]
+
+
+def _block_inner(V: list, W: list) -> list:
+    """
+    Computes the 64x64 matrix `V^T * W`.
+    """
+    tables = [[0]*256 for _ in range(8)]
+    t0, t1, t2, t3, t4, t5, t6, t7 = tables
+
+    for v, w in zip(V, W):
+        if v:
+            t0[v & 255]       ^= w
+            t1[v >> 8 & 255]  ^= w
+            t2[v >> 16 & 255] ^= w
+            t3[v >> 24 & 255] ^= w
+            t4[v >> 32 & 255] ^= w
+            t5[v >> 40 & 255] ^= w
+            t6[v >> 48 & 255] ^= w
+            t7[v >> 56]       ^= w
+
+
+    result = []
+    for table in tables:
+        for b in range(8):
+            bit = 1 << b
+            acc = 0
+            for v in range(bit, 256):
+                if v & bit:
+                    acc ^= table[v]
+
+            result.append(acc)
+
+    return result
+
+
+def _mat_mul(P: list, Q: list) -> list:
+    result = []
+    for row in P:
+        acc = 0
+        j   = 0
+        while row:
+            if row & 1:
+                acc ^= Q[j]
+
+            row >>= 1
+            j    += 1
+
+        result.append(acc)
+
+    return result
+
+
+def _select_subspace(T: list, S_prev: int, N: int) -> (list, int):
+    """
+    Chooses the columns `S` of `T = V^T*A*V` to keep and computes `W_inv = S*(S^T*T*S)^-1*S^T`
+    (Montgomery's step 2). Columns dropped in the previous iteration are given priority.
+    """
+    order = [j for j in range(N) if not (S_prev >> j) & 1] + [j for j in range(N) if (S_prev >> j) & 1]
+    M     = [T[j] | (1 << (N + j)) for j in range(N)]
+    S     = 0
+
+    for idx, c in enumerate(order):
+        for bit in (c, N + c):
+            for k in range(idx, N):
+                if (M[order[k]] >> bit) & 1:
+                    M[c], M[order[k]] = M[order[k]], M[c]
+                    break
+
+            if (M[c] >> bit) & 1:
+                pivot = M[c]
+                for k in range(N):
+                    if k != idx and (M[order[k]] >> bit) & 1:
+                        M[order[k]] ^= pivot
+
+                if bit == c:
+                    S |= 1 << c
+                else:
+                    M[c] = 0
+
+                break
+
+    return [row >> N for row in M], S
+
+
+
+class SparseGF2Matrix(object):
+    """
+    Sparse matrix over GF(2). Each row is stored as a sorted list of the columns holding a one.
+    """
+
+    def __init__(self, rows: list, num_cols: int=None):
+        """
+        Parameters:
+            rows    (list): List of rows as iterables of column indices.
+            num_cols (int): Number of columns. Inferred if not given.
+        """
+        self.rows     = [sorted(row) for row in rows]
+        self.num_cols = num_cols if num_cols is not None else max([row[-1]+1 for row in self.rows if row] + [0])
+
+
+    def __repr__(self):
+        return f"<SparseGF2Matrix: num_rows={self.num_rows}, num_cols={self.num_cols}, weight={self.weight}>"
+
+    def __str__(self):
+        return self.__repr__()
+
+
+    def __getitem__(self, idx: object) -> object:
+        if type(idx) is tuple:
+            row, col = idx
+            return int(col in self.rows[row])
+
+        return self.rows[idx]
+
+
+    def __len__(self) -> int:
+        return self.num_rows
+
+
+    @staticmethod
+    def from_masks(masks: list, num_cols: int=None) -> 'SparseGF2Matrix':
+        """
+        Builds a matrix from rows encoded as integers (bit `j` set means column `j` is one).
+
+        Parameters:
+            masks   (list): Rows as integers.
+            num_cols (int): Number of columns.
+
+        Returns:
+            SparseGF2Matrix: Matrix.
+        """
+        rows = []
+        for mask in masks:
+            row = []
+            col = 0
+            while mask:
+                if mask & 1:
+                    row.append(col)
+
+                mask >>= 1
+                col   += 1
+
+            rows.append(row)
+
+        return SparseGF2Matrix(rows, num_cols=num_cols)
+
+
+    def to_masks(self) -> list:
+        """
+        Returns the rows encoded as integers.
+        """
+        return [sum(1 << c for c in row) for row in self.rows]
+
+
+    @property
+    def num_rows(self) -> int:
+        return len(self.rows)
+
+
+    @property
+    def weight(self) -> int:
+        """
+        Number of nonzero entries.
+        """
+        return sum(len(row) for row in self.rows)
+
+
+    @property
+    def T(self) -> 'SparseGF2Matrix':
+        cols = [[] for _ in range(self.num_cols)]
+        for r, row in enumerate(self.rows):
+            for c in row:
+                cols[c].append(r)
+
+        return SparseGF2Matrix(cols, num_cols=self.num_rows)
+
+
+    def mul_block(self, block: list) -> list:
+        """
+        Computes `M*B` where `B` is a block of `num_cols` words.
+
+        Parameters:
+            block (list): Block vector indexed by column.
+
+        Returns:
+            list: Block vector indexed by row.
+        """
+        result = []
+        for row in self.rows:
+            acc = 0
+            for c in row:
+                acc ^= block[c]
+
+            result.append(acc)
+
+        return result
+
+
+    def tmul_block(self, block: list) -> list:
+        """
+        Computes `M^T*B` where `B` is a block of `num_rows` words.
+
+        Parameters:
+            block (list): Block vector indexed by row.
+
+        Returns:
+            list: Block vector indexed by column.
+        """
+        result = [0]*self.num_cols
+        for row, word in zip(self.rows, block):
+            if word:
+                for c in row:
+                    result[c] ^= word
+
+        return result
+
+
+    def structured_elimination(self, excess: int=GF2_SGE_EXCESS) -> ('SparseGF2Matrix', list, list):
+        """
+        Shrinks the matrix while preserving its left nullspace (structured Gaussian elimination).
+        Rows holding a column's only one are dropped, rows sharing a column of weight two are merged,
+        and the heaviest rows are trimmed once there are more than `excess` surplus rows.
+
+        Parameters:
+            excess (int): Number of surplus rows to keep over the number of active columns.
+
+        Returns:
+            (SparseGF2Matrix, list, list): Reduced matrix, the original rows each reduced row is the sum of (as bitmasks),
+                and dependencies found along the way (as bitmasks).
+        """
+        rows     = {}
+        combos   = {}
+        deps     = []
+        col_rows = defaultdict(set)
+
+        for r, row in enumerate(self.rows):
+            if row:
+                rows[r]   = set(row)
+                combos[r] = 1 << r
+                for c in row:
+                    col_rows[c].add(r)
+            else:
+                deps.append(1 << r)
+
+
+        def delete_row(r):
+            for c in rows.pop(r):
+                col_rows[c].discard(r)
+
+            del combos[r]
+
+
+        changed = True
+        while changed:
+            changed = False
+
+            for c in list(col_rows):
+                col = col_rows.get(c)
+                if col is None:
+                    continue
+
+                if len(col) == 1:
+                    delete_row(next(iter(col)))
+                    changed = True
+
+                elif len(col) == 2:
+                    r1, r2 = col
+                    row1   = rows[r1]
+
+                    for c2 in rows[r2]:
+                        if c2 in row1:
+                            col_rows[c2].discard(r1)
+                            col_rows[c2].discard(r2)
+                        else:
+                            col_rows[c2].discard(r2)
+                            col_rows[c2].add(r1)
+
+                    row1 ^= rows.pop(r2)
+                    combos[r1] ^= combos.pop(r2)
+
+                    if not row1:
+                        deps.append(combos[r1])
+                        delete_row(r1)
+
+                    changed = True
+
+                if not col:
+                    del col_rows[c]
+
+
+            surplus = len(rows) - len(col_rows) - excess
+            if surplus > 0:
+                for r in sorted(rows, key=lambda r: len(rows[r]), reverse=True)[:surplus]:
+                    delete_row(r)
+
+                changed = True
+
+
+        col_map  = {c: idx for idx, c in enumerate(sorted(c for c, col in col_rows.items() if col))}
+        reduced  = SparseGF2Matrix([[col_map[c] for c in row] for row in rows.values()], num_cols=len(col_map))
+        log.debug(f"Structured elimination reduced {self.num_rows}x{self.num_cols} to {reduced.num_rows}x{reduced.num_cols}")
+
+        return reduced, list(combos.values()), deps
+
+
+    def left_nullspace(self, max_vectors: int=64, method: str='auto') -> list:
+        """
+        Finds sets of rows that sum to zero.
+
+        Parameters:
+            max_vectors (int): Maximum number of dependencies to return (best-effort).
+            method      (str): 'lanczos', 'dense', or 'auto' to pick by the size of the pruned matrix.
+
+        Returns:
+            list: Dependencies as lists of row indices.
+
+        Examples:
+            >>> from samson.math.sparse_gf2 import SparseGF2Matrix
+            >>> SparseGF2Matrix([[0, 1], [1, 2], [0, 2], [3]]).left_nullspace()
+            [[0, 1, 2]]
+
+        """
+        reduced, combos, deps = self.structured_elimination()
+
+        if reduced.num_rows:
+            if method == 'dense' or (method == 'auto' and reduced.num_rows <= GF2_DENSE_THRESHOLD):
+                found = dense_left_nullspace(reduced.to_masks())
+            else:
+                found = block_lanczos(reduced)
+
+            for dep in found[:max(max_vectors - len(deps), 0)]:
+                mask = 0
+                idx  = 0
+                while dep:
+                    if dep & 1:
+                        mask ^= combos[idx]
+
+                    dep >>= 1
+                    idx  += 1
+
+                deps.append(mask)
+
+        return [[idx for idx, bit in enumerate(bin(dep)[2:][::-1]) if bit == '1'] for dep in deps[:max_vectors] if dep]
+
+
+
+def dense_left_nullspace(masks: list) -> list:
+    """
+    Finds dependencies between rows encoded as integers using dense elimination.
+
+    Parameters:
+        masks (list): Rows as integers.
+
+    Returns:
+        list: Dependencies as bitmasks over the rows.
+
+    Examples:
+        >>> from samson.math.sparse_gf2 import dense_left_nullspace
+        >>> dense_left_nullspace([0b011, 0b110, 0b101])
+        [7]
+
+    """
+    basis = {}
+    deps  = []
+
+    for i, vec in enumerate(masks):
+        combo = 1 << i
+        while vec:
+            pivot = vec.bit_length() - 1
+            if pivot not in basis:
+                basis[pivot] = (vec, combo)
+                break
+
+            b_vec, b_combo = basis[pivot]
+            vec   ^= b_vec
+            combo ^= b_combo
+        else:
+            deps.append(combo)
+
+    return deps
+
+
+
+def block_lanczos(M: SparseGF2Matrix, max_attempts: int=4) -> list:
+    """
+    Finds dependencies between the rows of `M` using Montgomery's Block Lanczos algorithm over `A = M*M^T`,
+    iterating blocks of 64 vectors packed into words. Works best on matrices with few surplus rows (see `SparseGF2Matrix.structured_elimination`).
+
+    Parameters:
+        M   (SparseGF2Matrix): Matrix.
+        max_attempts    (int): Number of random starting blocks to try before giving up.
+
+    Returns:
+        list: Dependencies as bitmasks over the rows.
+
+    References:
+        "A Block Lanczos Algorithm for Finding Dependencies over GF(2)" (https://doi.org/10.1007/3-540-49264-X_9)
+    """
+    N    = 64
+    n    = M.num_rows
+    full = (1 << N) - 1
+    I    = [1 << j for j in range(N)]
+
+    def A(V):
+        return M.mul_block(M.tmul_block(V))
+
+
+    for attempt in range(max_attempts):
+        data = rand_bytes(n*N // 8)
+        Y    = [int.from_bytes(data[i*N // 8:(i+1)*N // 8], 'little') for i in range(n)]
+        V0   = A(Y)
+        X    = [0]*n
+
+        V, V1, V2 = V0, [0]*n, [0]*n
+        Winv1, Winv2 = [0]*N, [0]*N
+        vAv1, vA2v1  = [0]*N, [0]*N
+        S1 = full
+
+        for _ in range(n // max(N - 1, 1) + 16):
+            AV = A(V)
+
+            # Pack `AV` and `V0` together so both inner products with `V` share one pass
+            packed = _block_inner(V, [av | (v0 << N) for av, v0 in zip(AV, V0)])
+            vAv    = [row & full for row in packed]
+            vV0    = [row >> N for row in packed]
+
+            if not any(vAv):
+                break
+
+            vA2v    = _block_inner(AV, AV)
+            Winv, S = _select_subspace(vAv, S1, N)
+
+            D = [i ^ x for i, x in zip(I, _mat_mul(Winv, [(a2 & S) ^ a for a2, a in zip(vA2v, vAv)]))]
+            E = _mat_mul(Winv1, [a & S for a in vAv])
+            F = _mat_mul(_mat_mul(Winv2, [i ^ x for i, x in zip(I, _mat_mul(vAv1, Winv1))]), [(a2 & S1) ^ a for a2, a in zip(vA2v1, vAv1)])
+            F = [f & S for f in F]
+
+            # Apply `D` and `Winv*V^T*V0` to `V` in one pass
+            DQ     = _block_mul(V, [d | (q << N) for d, q in zip(D, _mat_mul(Winv, vV0))])
+            X      = [x ^ (dq >> N) for x, dq in zip(X, DQ)]
+            V_next = [(av & S) ^ (dq & full) ^ e ^ f for av, dq, e, f in zip(AV, DQ, _block_mul(V1, E), _block_mul(V2, F))]
+
+            V, V1, V2    = V_next, V, V1
+            Winv1, Winv2 = Winv, Winv1
+            vAv1, vA2v1  = vAv, vA2v
+            S1 = S
+
+        else:
+            log.debug(f"Block Lanczos did not converge (attempt {attempt+1})")
+            continue
+
+
+        # `M^T*(X - Y)` and `M^T*V` are small; find combinations of their columns that vanish
+        Z     = [(x ^ y) | (v << N) for x, y, v in zip(X, Y, V)]
+        BZ    = _transpose_words(M.tmul_block(Z), 2*N)
+        Z_T   = _transpose_words(Z, 2*N)
+        basis = {}
+        deps  = []
+
+        for combo in dense_left_nullspace(BZ):
+            dep = 0
+            j   = 0
+            while combo:
+                if combo & 1:
+                    dep ^= Z_T[j]
+
+                combo >>= 1
+                j     += 1
+
+            # Undo the bit-reversal from `_transpose_words`
+            dep = int(format(dep, f'0{n}b')[::-1], 2) if dep else 0
+
+            # Keep only nonzero, independent dependencies
+            vec = dep
+            while vec:
+                pivot = vec.bit_length() - 1
+                if pivot not in basis:
+                    basis[pivot] = vec
+                    deps.append(dep)
+                    break
+
+                vec ^= basis[pivot]
+
+        if deps:
+            return deps
+
+        log.debug(f"Block Lanczos found no dependencies (attempt {attempt+1})")
+
+    return []
@@ -89,6 +89,10 @@ class Symbol(Polynomial):
         try:
             attr = object.__getattribute__(self, name)
         except AttributeError:
+            # `var` is missing while unpickling, so don't recurse looking for it
+            if name == 'var':
+                raise
+
             attr = object.__getattribute__(self.var, name)
 
         return attr
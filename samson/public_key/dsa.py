@@ -1,4 +1,5 @@
 from samson.math.general import mod_inv, find_prime, random_int_between, is_prime
+from samson.math.algebra.curves.multi_scalar_mul import multi_exponentiation
 from samson.utilities.bytes import Bytes
 
 from samson.encoding.openssh.openssh_dsa_key import OpenSSHDSAPrivateKey, OpenSSHDSAPublicKey, SSH2DSAPublicKey
@@ -125,7 +126,7 @@ class DSA(EncodablePKI, SignatureAlg):
         w = mod_inv(s, self.q)
         u_1 = (self.hash_obj.hash(message).int() * w) % self.q
         u_2 = (r * w) % self.q
-        v = (pow(self.g, u_1, self.p) * pow(self.y, u_2, self.p) % self.p) % self.q
+        v = multi_exponentiation([self.g, self.y], [u_1, u_2], self.p) % self.q
         return v == r
 
 
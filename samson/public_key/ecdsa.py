@@ -1,5 +1,6 @@
 from samson.math.general import mod_inv, random_int_between
 from samson.math.algebra.curves.weierstrass_curve import WeierstrassCurve
+from samson.math.algebra.curves.multi_scalar_mul import multi_scalar_mul, batch_multi_scalar_mul
 from samson.utilities.bytes import Bytes
 from samson.public_key.dsa import DSA
 from samson.hashes.sha2 import SHA256
@@ -110,6 +111,13 @@ class ECDSA(DSA):
         Returns:
             bool: Whether the signature is valid or not.
         """
+        u_1, u_2 = self._verification_scalars(message, sig)
+        v = multi_scalar_mul([self.G, self.Q], [u_1, u_2])
+        return v.x == sig[0]
+
+
+
+    def _verification_scalars(self, message: bytes, sig: (int, int)) -> (int, int):
         (r, s) = sig
         w = mod_inv(s, self.q)
 
@@ -118,8 +126,41 @@ class ECDSA(DSA):
 
         u_1 = (z * w) % self.q
         u_2 = (r * w) % self.q
-        v = u_1 * self.G + u_2 * self.Q
-        return v.x == r
+        return u_1, u_2
+
+
+
+    def batch_verify(self, messages: list, sigs: list) -> bool:
+        """
+        Verifies many `messages` against their `sigs` at once. The window tables of `G` and `Q` are shared by all
+        signatures, and the resulting points are normalized with a single inversion.
+
+        Parameters:
+            messages (list): Messages.
+            sigs     (list): Signatures of `messages`.
+
+        Returns:
+            bool: Whether all of the signatures are valid.
+
+        Examples:
+            >>> from samson.public_key.ecdsa import ECDSA
+            >>> from samson.math.algebra.curves.named import P256
+            >>> ecdsa = ECDSA(P256.G)
+            >>> msgs  = [b'a', b'b', b'c']
+            >>> sigs  = [ecdsa.sign(m) for m in msgs]
+            >>> ecdsa.batch_verify(msgs, sigs)
+            True
+
+            >>> ecdsa.batch_verify(msgs, sigs[::-1])
+            False
+
+        """
+        if len(messages) != len(sigs):
+            raise ValueError("`messages` and `sigs` must be the same length")
+
+        rows = [self._verification_scalars(m, sig) for m, sig in zip(messages, sigs)]
+        vs   = batch_multi_scalar_mul([self.G, self.Q], rows)
+        return all(v.x == sig[0] for v, sig in zip(vs, sigs))
 
 
     @staticmethod
@@ -66,12 +66,61 @@ class RC4(StreamCipher):
         Returns:
             Bytes: Keystream.
         """
-        keystream = Bytes(b'')
+        S, i, j   = self.S, self.i, self.j
+        keystream = bytearray(length)
 
-        for _ in range(length):
-            self.i = (self.i + 1) % 256
-            self.j = (self.j + self.S[self.i]) % 256
-            self.S[self.i], self.S[self.j] = self.S[self.j], self.S[self.i]
-            keystream += bytes([self.S[(self.S[self.i] + self.S[self.j]) % 256]])
+        for k in range(length):
+            i = (i + 1) & 0xFF
+            s_i = S[i]
+            j = (j + s_i) & 0xFF
+            s_j = S[j]
+            S[i], S[j] = s_j, s_i
+            keystream[k] = S[(s_i + s_j) & 0xFF]
 
-        return keystream
+        self.i, self.j = i, j
+        return Bytes(keystream)
+
+
+
+    @staticmethod
+    def keystreams(keys: list, length: int) -> list:
+        """
+        Lazily generates the first `length` bytes of keystream for each key in `keys` without instantiating a cipher
+        per key. Useful for sampling keystream biases.
+
+        Parameters:
+            keys  (iter): Keys.
+            length (int): Desired length of each keystream in bytes.
+
+        Returns:
+            generator: Keystreams as `bytes`.
+
+        Examples:
+            >>> from samson.stream_ciphers.rc4 import RC4
+            >>> list(RC4.keystreams([b'Key', b'Wiki'], 4)) == [RC4(b'Key').generate(4), RC4(b'Wiki').generate(4)]
+            True
+
+        """
+        identity = list(range(256))
+
+        for key in keys:
+            key_length = len(key)
+            S = identity[:]
+            j = 0
+            for i in range(256):
+                s_i = S[i]
+                j = (j + s_i + key[i % key_length]) & 0xFF
+                S[i] = S[j]
+                S[j] = s_i
+
+            keystream = bytearray(length)
+            i = j = 0
+            for k in range(length):
+                i = (i + 1) & 0xFF
+                s_i = S[i]
+                j = (j + s_i) & 0xFF
+                s_j = S[j]
+                S[i], S[j] = s_j, s_i
+                keystream[k] = S[(s_i + s_j) & 0xFF]
+
+            yield bytes(keystream)
@@ -0,0 +1,237 @@
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, wait, FIRST_COMPLETED
+from types import FunctionType
+from collections import deque
+from itertools import islice
+import threading
+import asyncio
+import dill
+
+
+def _chunked(iterable, chunksize: int):
+    iterator = iter(iterable)
+    while True:
+        chunk = list(islice(iterator, chunksize))
+        if not chunk:
+            return
+
+        yield chunk
+
+
+def _run_chunk(func: FunctionType, chunk: list, starmap: bool, cancelled: threading.Event=None) -> list:
+    results = []
+    for args in chunk:
+        if cancelled and cancelled.is_set():
+            break
+
+        results.append(func(*args) if starmap else func(args))
+
+    return results
+
+
+def _run_pickled_chunk(payload: bytes) -> list:
+    # `dill` lets closures and lambdas (what attacks usually pass) cross the process boundary
+    func, chunk, starmap = dill.loads(payload)
+    return _run_chunk(func, chunk, starmap)
+
+
+
+class Executor(object):
+    """
+    Base class for `RUNTIME` execution backends.
+
+    Work is split into chunks of `chunksize` items. At most `2*workers` chunks are in flight at once, so results
+    stream back as they finish and the remainder can be cancelled once a hit is found.
+    """
+
+    def __init__(self, workers: int=None, chunksize: int=1):
+        """
+        Parameters:
+            workers   (int): Number of workers. Defaults to the backend's default.
+            chunksize (int): Number of items shipped to a worker per task.
+        """
+        self.workers   = workers
+        self.chunksize = chunksize
+
+
+    def __repr__(self):
+        return f"<{self.__class__.__name__}: workers={self.workers}, chunksize={self.chunksize}>"
+
+    def __str__(self):
+        return self.__repr__()
+
+
+    def _build_pool(self) -> object:
+        raise NotImplementedError()
+
+
+    def _submit(self, pool: object, func: FunctionType, chunk: list, starmap: bool, cancelled: threading.Event) -> 'Future':
+        return pool.submit(_run_chunk, func, chunk, starmap, cancelled)
+
+
+    def map(self, func: FunctionType, iterable: object, starmap: bool=False, ordered: bool=True, chunksize: int=None) -> object:
+        """
+        Lazily applies `func` to every item in `iterable`.
+
+        Closing the returned generator cancels outstanding work.
+
+        Parameters:
+            func      (func): Function to apply.
+            iterable  (iter): Items (or argument tuples if `starmap`).
+            starmap   (bool): Whether to unpack each item into `func`'s arguments.
+            ordered   (bool): Whether to yield results in input order or in completion order.
+            chunksize  (int): Overrides the executor's chunk size.
+
+        Returns:
+            generator: Results.
+        """
+        chunks    = _chunked(iterable, chunksize or self.chunksize)
+        cancelled = threading.Event()
+        pool      = self._build_pool()
+        in_flight = deque()
+
+        def fill():
+            for chunk in islice(chunks, 2*(pool._max_workers) - len(in_flight)):
+                in_flight.append(self._submit(pool, func, chunk, starmap, cancelled))
+
+        try:
+            fill()
+            while in_flight:
+                if ordered:
+                    future = in_flight.popleft()
+                else:
+                    done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                    future  = done.pop()
+                    in_flight.remove(future)
+
+                results = future.result()
+                fill()
+                yield from results
+
+        finally:
+            cancelled.set()
+            for future in in_flight:
+                future.cancel()
+
+            pool.shutdown(wait=False)
+
+
+    def first(self, func: FunctionType, iterable: object, predicate: FunctionType=lambda result: result is not None, starmap: bool=False, chunksize: int=None) -> object:
+        """
+        Returns the first result (in completion order) satisfying `predicate` and cancels the remaining work.
+
+        Parameters:
+            func      (func): Function to apply.
+            iterable  (iter): Items (or argument tuples if `starmap`).
+            predicate (func): Determines whether a result is a hit.
+            starmap   (bool): Whether to unpack each item into `func`'s arguments.
+            chunksize  (int): Overrides the executor's chunk size.
+
+        Returns:
+            object: First hit or None.
+
+        Examples:
+            >>> from samson.utilities.executors import ThreadExecutor
+            >>> ThreadExecutor(4).first(lambda x: x if x*x == 49 else None, range(100))
+            7
+
+        """
+        results = self.map(func, iterable, starmap=starmap, ordered=False, chunksize=chunksize)
+
+        try:
+            for result in results:
+                if predicate(result):
+                    return result
+        finally:
+            results.close()
+
+
+
+class ThreadExecutor(Executor):
+    """
+    Thread pool backend. Best for I/O-bound oracles; CPU-bound work is serialized by the GIL.
+    """
+
+    def _build_pool(self) -> ThreadPoolExecutor:
+        return ThreadPoolExecutor(max_workers=self.workers)
+
+
+
+class ProcessExecutor(Executor):
+    """
+    Process pool backend for CPU-bound work. Tasks are serialized with `dill`, so closures may be used.
+    """
+
+    def _build_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(max_workers=self.workers)
+
+
+    def _submit(self, pool: object, func: FunctionType, chunk: list, starmap: bool, cancelled: threading.Event) -> 'Future':
+        return pool.submit(_run_pickled_chunk, dill.dumps((func, chunk, starmap), recurse=True))
+
+
+
+class AsyncioExecutor(Executor):
+    """
+    asyncio backend for I/O-bound oracles. Coroutine functions are awaited directly while regular functions run
+    in the loop's default thread pool. At most `workers` chunks run concurrently.
+    """
+
+    async def _map_async(self, func: FunctionType, iterable: object, starmap: bool, ordered: bool, chunksize: int, predicate: FunctionType=None) -> list:
+        loop      = asyncio.get_running_loop()
+        semaphore = asyncio.Semaphore(self.workers or 8)
+        is_coro   = asyncio.iscoroutinefunction(func)
+
+        async def run_chunk(chunk):
+            async with semaphore:
+                results = []
+                for args in chunk:
+                    args = args if starmap else (args,)
+                    if is_coro:
+                        results.append(await func(*args))
+                    else:
+                        results.append(await loop.run_in_executor(None, func, *args))
+
+                return results
+
+
+        tasks = [asyncio.ensure_future(run_chunk(chunk)) for chunk in _chunked(iterable, chunksize or self.chunksize)]
+
+        try:
+            if ordered and not predicate:
+                return [result for results in await asyncio.gather(*tasks) for result in results]
+
+            all_results = []
+            for next_done in asyncio.as_completed(tasks):
+                for result in await next_done:
+                    if predicate and predicate(result):
+                        return [result]
+
+                    all_results.append(result)
+
+            return all_results
+
+        finally:
+            for task in tasks:
+                task.cancel()
+
+
+    def _run(self, coro: 'Coroutine') -> object:
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coro)
+
+        # Already inside an event loop (e.g. Jupyter); run ours on a separate thread
+        with ThreadPoolExecutor(max_workers=1) as pool:
+            return pool.submit(asyncio.run, coro).result()
+
+
+    def map(self, func: FunctionType, iterable: object, starmap: bool=False, ordered: bool=True, chunksize: int=None) -> object:
+        yield from self._run(self._map_async(func, iterable, starmap, ordered, chunksize))
+
+
+    def first(self, func: FunctionType, iterable: object, predicate: FunctionType=lambda result: result is not None, starmap: bool=False, chunksize: int=None) -> object:
+        results = self._run(self._map_async(func, iterable, starmap, False, chunksize, predicate))
+
+        if results and predicate(results[0]):
+            return results[0]
@@ -1,6 +1,6 @@
 from samson.auxiliary.progress import Progress
 from samson.ace.exploit import DynamicExploit, register_knowns
-from multiprocessing.dummy import Pool
+from samson.utilities.executors import Executor, ThreadExecutor
 from functools import wraps
 from types import FunctionType
 import logging
@@ -16,6 +16,21 @@ def default_poly_fft_heuristic(p1, p2):
     return p1.coeffs.sparsity * p2.coeffs.sparsity > (2**24 // p1.ring.structure_depth**2)
 
 
+def default_poly_kronecker_heuristic(p1, p2):
+    # Dense packing costs O(degree) while the naive product costs O(sparsity^2)
+    return 4 * p1.coeffs.sparsity * p2.coeffs.sparsity >= p1.degree() + p2.degree() + 2
+
+
+def default_poly_half_gcd_heuristic(p1, p2):
+    # Below this, Euclid's divisions are cheaper than the half-GCD's matrix products
+    return min(p1.degree(), p2.degree()) >= 512
+
+
+def default_poly_dense_heuristic(vec):
+    # Residue arrays beat per-coefficient ring elements once a quarter of the coefficients are nonzero
+    return vec.len() >= 16 and 4 * vec.sparsity >= vec.len()
+
+
 class RuntimeConfiguration(object):
     """
     Global runtime configuration. Allows for the dynamic configuration of existing samson code.
@@ -59,6 +74,19 @@ class RuntimeConfiguration(object):
 
         self.random = lambda size: URANDOM.read(size)
         self.poly_fft_heuristic = default_poly_fft_heuristic
+        self.poly_kronecker_heuristic = default_poly_kronecker_heuristic
+        self.poly_dense_heuristic = default_poly_dense_heuristic
+        self.poly_half_gcd_heuristic = default_poly_half_gcd_heuristic
+
+        # Fixed-base tables for named curve generators
+        self.fixed_base_table_limit = 8
+        self.fixed_base_table_dir   = os.environ.get('SAMSON_FIXED_BASE_DIR')
+
+        # Largest BSGS table (in group elements) `pohlig_hellman` builds before switching to Pollard's rho
+        self.bsgs_table_limit = 2**18
+
+        # Backend used by `threaded` and attack fan-out (see `samson.utilities.executors`)
+        self.executor = ThreadExecutor
 
         if minimize_output:
             self.default_short_printer = lambda elem: elem.tinyhand()
@@ -281,16 +309,41 @@ class RuntimeConfiguration(object):
         IPython.core.interactiveshell.InteractiveShell._showtraceback = showtraceback
 
 
-    def threaded(self, threads: int, starmap: bool=False):
+    def get_executor(self, workers: int=None, executor: type=None, **kwargs) -> Executor:
         """
-        Runs the function with `threads` threads. The returned function should take an iterable.
+        Instantiates the configured execution backend.
 
         Parameters:
-            threads (int): Number of threads to run.
-        
+            workers     (int): Number of workers.
+            executor   (type): Executor class to use instead of `self.executor`.
+            **kwargs (kwargs): Keyword arguments to pass to the executor.
+
+        Returns:
+            Executor: Execution backend.
+
+        Examples:
+            >>> from samson.utilities.runtime import RUNTIME
+            >>> from samson.utilities.executors import ProcessExecutor
+            >>> list(RUNTIME.get_executor(2, ProcessExecutor).map(lambda i: i*i, range(5)))
+            [0, 1, 4, 9, 16]
+
+        """
+        return (executor or self.executor)(workers, **kwargs)
+
+
+    def threaded(self, threads: int, starmap: bool=False, ordered: bool=True, executor: type=None):
+        """
+        Runs the function with `threads` workers of the configured backend (`RUNTIME.executor`). The returned function should take an iterable.
+
+        Parameters:
+            threads     (int): Number of workers to run.
+            starmap    (bool): Whether to unpack each item into the function's arguments.
+            ordered    (bool): Whether results are returned in input order.
+            executor   (type): Executor class to use instead of `RUNTIME.executor`.
+
         Returns:
             list: Results.
-        
+
         Examples:
             >>> from samson.utilities.runtime import RUNTIME
             >>> @RUNTIME.threaded(threads=10)
@@ -302,13 +355,7 @@ class RuntimeConfiguration(object):
         """
         def _outer_wrap(func):
             def _runner(iterable):
-                with Pool(threads) as pool:
-                    if starmap:
-                        pool_runner = pool.starmap
-                    else:
-                        pool_runner = pool.map
-
-                    return pool_runner(func, iterable)
+                return list(self.get_executor(threads, executor).map(func, iterable, starmap=starmap, ordered=ordered))
             return _runner
 
         return _outer_wrap
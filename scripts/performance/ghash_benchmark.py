@@ -0,0 +1,52 @@
+#!/usr/bin/python3
+"""
+Benchmarks GHASH throughput for different aggregation factors, along with end-to-end AES-GCM.
+
+Each aggregation factor `k` folds `k` blocks into one reduction pass using precomputed tables for `H^1..H^k`.
+"""
+from samson.macs.ghash import GHASH
+from samson.block_ciphers.modes.gcm import GCM
+from samson.block_ciphers.rijndael import Rijndael
+from samson.utilities.bytes import Bytes
+import argparse
+import time
+
+
+def best_of(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.time()
+        func()
+        timings.append(time.time() - start)
+
+    return min(timings)
+
+
+def main(sizes, aggregates, repeat):
+    H = Bytes.random(16)
+    print(f"{'bytes':>9} " + ' '.join([f'{"k=" + str(k):>10}' for k in aggregates]) + f' {"AES-GCM":>10}    (MB/s)')
+
+    for size in sizes:
+        data = Bytes.random(size)
+        rates = []
+
+        for k in aggregates:
+            ghash = GHASH(H, aggregate=k)
+            rates.append(size / best_of(lambda: ghash.generate(data), repeat) / 1e6)
+
+        gcm = GCM(Rijndael(Bytes.random(16)))
+        rates.append(size / best_of(lambda: gcm.encrypt(Bytes.random(12), data), repeat) / 1e6)
+
+        print(f'{size:>9} ' + ' '.join([f'{rate:>10.3f}' for rate in rates]), flush=True)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--sizes', type=int, nargs='+', default=[64, 1024, 16384, 262144], help='Message sizes in bytes.')
+    parser.add_argument('--aggregates', type=int, nargs='+', default=[1, 2, 4, 8], help='Aggregation factors to benchmark.')
+    parser.add_argument('--repeat', type=int, default=3, help='Number of runs per measurement (best is reported).')
+
+    args = parser.parse_args()
+    main(args.sizes, args.aggregates, args.repeat)
@@ -0,0 +1,68 @@
+#!/usr/bin/python3
+"""
+Benchmarks Merkle-Damgard hash throughput against `hashlib` as a reference.
+
+The word-oriented cores keep the chaining value as a tuple of ints across blocks and unpack each block with a
+single `struct` call. Hashes `hashlib` does not provide (e.g. MD4 on OpenSSL 3) report `nan` as the reference.
+"""
+from samson.hashes.md4 import MD4
+from samson.hashes.md5 import MD5
+from samson.hashes.sha1 import SHA1
+from samson.hashes.sha2 import SHA224, SHA256, SHA384, SHA512
+from samson.hashes.ripemd160 import RIPEMD160
+from samson.utilities.bytes import Bytes
+import argparse
+import hashlib
+import time
+
+HASHES = {
+    'md4': MD4,
+    'md5': MD5,
+    'sha1': SHA1,
+    'sha224': SHA224,
+    'sha256': SHA256,
+    'sha384': SHA384,
+    'sha512': SHA512,
+    'ripemd160': RIPEMD160
+}
+
+
+def best_of(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.time()
+        func()
+        timings.append(time.time() - start)
+
+    return min(timings)
+
+
+def reference_rate(name: str, data: bytes, repeat: int) -> float:
+    try:
+        hashlib.new(name)
+    except ValueError:
+        return float('nan')
+
+    return len(data) / best_of(lambda: hashlib.new(name, data).digest(), repeat) / 1e6
+
+
+def main(names, size, repeat):
+    data = Bytes.random(size)
+    print(f"{'hash':>10} {'samson':>10} {'hashlib':>10}    (MB/s)")
+
+    for name in names:
+        hash_obj = HASHES[name]()
+        rate     = size / best_of(lambda: hash_obj.hash(data), repeat) / 1e6
+        print(f'{name:>10} {rate:>10.3f} {reference_rate(name, data, repeat):>10.3f}', flush=True)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--hashes', nargs='+', default=list(HASHES), choices=list(HASHES), help='Hashes to benchmark.')
+    parser.add_argument('--size', type=int, default=65536, help='Message size in bytes.')
+    parser.add_argument('--repeat', type=int, default=3, help='Number of runs per measurement (best is reported).')
+
+    args = parser.parse_args()
+    main(args.hashes, args.size, args.repeat)
@@ -0,0 +1,76 @@
+#!/usr/bin/python3
+"""
+Benchmarks the LLL engines in `samson.math.general` on random lattices.
+
+The default lattice is a q-ary lattice (the kind generated by fplll's `latticegen q`):
+the first `n/2` rows are `q` times unit vectors and the remaining rows are `(A | I)` for
+a random `A` mod `q`.
+"""
+from samson.math.general import _lll_fp, _lll_integral, _lll_rational, random_int
+from fractions import Fraction
+import argparse
+import time
+
+
+def qary_lattice(n: int, bits: int) -> list:
+    k = n // 2
+    q = 2**bits - 1
+
+    rows = [[q if i == j else 0 for j in range(n)] for i in range(k)]
+    for i in range(k, n):
+        rows.append([random_int(q) for _ in range(k)] + [1 if i == j else 0 for j in range(k, n)])
+
+    return rows
+
+
+def knapsack_lattice(n: int, bits: int) -> list:
+    weights = [random_int(2**bits) for _ in range(n)]
+    rows    = [[1 if i == j else 0 for j in range(n)] + [weights[i]] for i in range(n)]
+    rows.append([0]*n + [-sum(weights[::2])])
+
+    return rows
+
+
+ENGINES = {
+    'fp': lambda basis, delta: _lll_fp(basis, float(delta)),
+    'integral': lambda basis, delta: _lll_integral(basis, Fraction(delta)),
+    'rational': lambda basis, delta: _lll_rational(basis, Fraction(delta)) or True
+}
+
+LATTICES = {
+    'qary': qary_lattice,
+    'knapsack': knapsack_lattice
+}
+
+
+def main(dims, bits, delta, engines, lattice):
+    print(f"{'dim':>5} " + ' '.join([f'{engine:>12}' for engine in engines]))
+
+    for n in dims:
+        basis   = LATTICES[lattice](n, bits)
+        timings = []
+
+        for engine in engines:
+            reduced = [row[:] for row in basis]
+
+            start  = time.time()
+            result = ENGINES[engine](reduced, delta)
+            timing = time.time() - start
+
+            timings.append(f'{timing:>11.3f}s' if result else f'{"failed":>12}')
+
+        print(f'{n:>5} ' + ' '.join(timings), flush=True)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--dims', type=int, nargs='+', default=list(range(10, 121, 10)), help='Lattice dimensions to benchmark.')
+    parser.add_argument('--bits', type=int, default=30, help='Bit size of the lattice entries.')
+    parser.add_argument('--delta', type=float, default=0.99, help='Lovász constant.')
+    parser.add_argument('--engines', nargs='+', default=['fp', 'integral'], choices=list(ENGINES), help='Engines to benchmark.')
+    parser.add_argument('--lattice', default='qary', choices=list(LATTICES), help='Type of lattice to reduce.')
+
+    args = parser.parse_args()
+    main(args.dims, args.bits, args.delta, args.engines, args.lattice)
@@ -0,0 +1,57 @@
+#!/usr/bin/python3
+"""
+Compares the classical Euclidean GCD against the half-GCD for dense polynomials over ZZ/ZZ(p), along with the
+resultant built on top of the half-GCD. Use this to tune `RUNTIME.poly_half_gcd_heuristic`.
+"""
+from samson.math.algebra.rings.integer_ring import ZZ
+from samson.math.general import random_int, find_prime
+from samson.math.symbols import Symbol
+from samson.utilities.runtime import RUNTIME
+import argparse
+import time
+
+
+def best_of(func, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.time()
+        func()
+        timings.append(time.time() - start)
+
+    return min(timings)
+
+
+def main(degrees, bits, repeat):
+    x = Symbol('x')
+    p = find_prime(bits)
+    P = (ZZ/ZZ(p))[x]
+    heuristic = RUNTIME.poly_half_gcd_heuristic
+
+    print(f"{'degree':>8} {'euclid':>10} {'half-gcd':>10} {'resultant':>10}    (ms)")
+    for degree in degrees:
+        a = P([random_int(p) for _ in range(degree+1)])
+        b = P([random_int(p) for _ in range(degree)])
+
+        try:
+            RUNTIME.poly_half_gcd_heuristic = lambda p1, p2: False
+            euclid = best_of(lambda: a.gcd(b), repeat)
+
+            RUNTIME.poly_half_gcd_heuristic = lambda p1, p2: True
+            half = best_of(lambda: a.gcd(b), repeat)
+        finally:
+            RUNTIME.poly_half_gcd_heuristic = heuristic
+
+        res = best_of(lambda: a.resultant(b), repeat)
+        print(f'{degree:>8} {euclid*1e3:>10.1f} {half*1e3:>10.1f} {res*1e3:>10.1f}', flush=True)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--degrees', type=int, nargs='+', default=[64, 128, 256, 512, 1024, 2048], help='Polynomial degrees.')
+    parser.add_argument('--bits', type=int, default=64, help='Size of the prime modulus in bits.')
+    parser.add_argument('--repeat', type=int, default=3, help='Number of runs per measurement (best is reported).')
+
+    args = parser.parse_args()
+    main(args.degrees, args.bits, args.repeat)
@@ -0,0 +1,67 @@
+#!/usr/bin/python3
+"""
+Measures the per-operation cost of `ZZ/ZZ(p)` element arithmetic, plus elliptic curve point addition and
+scalar multiplication built on top of it.
+"""
+from samson.math.algebra.rings.integer_ring import ZZ
+from samson.math.algebra.curves.named import P256
+from samson.math.general import random_int
+import argparse
+import time
+
+
+def per_op(func, iterations: int, repeat: int) -> float:
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func(iterations)
+        timings.append(time.perf_counter() - start)
+
+    return min(timings) / iterations
+
+
+def main(iterations, repeat):
+    p = P256.p
+    R = ZZ/ZZ(p)
+    a, b = R(random_int(p)), R(random_int(p))
+    k    = random_int(p)
+
+    def run(op):
+        def loop(n):
+            for _ in range(n):
+                op()
+        return loop
+
+    ops = [
+        ('add',     lambda: a + b),
+        ('sub',     lambda: a - b),
+        ('mul',     lambda: a * b),
+        ('mul int', lambda: a * 12345),
+        ('add int', lambda: a + 12345),
+        ('neg',     lambda: -a),
+        ('div',     lambda: a / b),
+        ('pow',     lambda: a**k),
+        ('eq',      lambda: a == b),
+        ('coerce',  lambda: R(k)),
+    ]
+
+    print(f"{'op':>10} {'us/op':>10}")
+    for name, op in ops:
+        scale = 100 if name in ('pow', 'div') else 1
+        print(f'{name:>10} {per_op(run(op), max(iterations // scale, 1), repeat) * 1e6:>10.3f}', flush=True)
+
+    G = P256.G
+    Q = G * random_int(P256.q)
+    print(f"{'pt add':>10} {per_op(run(lambda: G + Q), max(iterations // 100, 1), repeat) * 1e6:>10.3f}")
+    print(f"{'scalar mul':>10} {per_op(run(lambda: G * k), 1, repeat) * 1e6:>10.3f}")
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--iterations', type=int, default=20000, help='Number of operations per measurement.')
+    parser.add_argument('--repeat', type=int, default=3, help='Number of runs per measurement (best is reported).')
+
+    args = parser.parse_args()
+    main(args.iterations, args.repeat)
@@ -0,0 +1,56 @@
+#!/usr/bin/python3
+"""
+Compares Schoof's algorithm against Schoof-Elkies-Atkin (SEA) for counting points on random curves over ZZ/ZZ(p).
+The SEA timings are given both with the modular polynomials cold and already in the table. Use this to tune
+`samson.math.sea.SEA_MAX_L`.
+"""
+from samson.math.algebra.rings.integer_ring import ZZ
+from samson.math.algebra.curves.weierstrass_curve import WeierstrassCurve
+from samson.math.general import random_int, find_prime, frobenius_trace
+from samson.math import general, sea
+import argparse
+import time
+
+
+def timed(func) -> (object, float):
+    start  = time.time()
+    result = func()
+    return result, time.time() - start
+
+
+def main(bits, workers):
+    sea_max_l = sea.SEA_MAX_L
+
+    print(f"{'bits':>6} {'schoof':>10} {'sea cold':>10} {'sea warm':>10}    (s)")
+    for size in bits:
+        p = find_prime(size)
+        R = ZZ/ZZ(p)
+        curve = WeierstrassCurve(a=R(random_int(p)), b=R(random_int(p)), ring=R)
+
+        try:
+            sea.SEA_MAX_L = 0
+            general._FROBENIUS_TRACE_CACHE.clear()
+            schoof, schoof_time = timed(lambda: frobenius_trace(curve, workers=workers))
+        finally:
+            sea.SEA_MAX_L = sea_max_l
+
+        sea._MODULAR_POLYNOMIALS.clear()
+        general._FROBENIUS_TRACE_CACHE.clear()
+        cold, cold_time = timed(lambda: frobenius_trace(curve, workers=workers))
+
+        general._FROBENIUS_TRACE_CACHE.clear()
+        warm, warm_time = timed(lambda: frobenius_trace(curve, workers=workers))
+
+        assert schoof == cold == warm
+        print(f'{size:>6} {schoof_time:>10.2f} {cold_time:>10.2f} {warm_time:>10.2f}', flush=True)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(
+        description=__doc__,
+        formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument('--bits', type=int, nargs='+', default=[16, 32, 48, 64], help='Sizes of the prime field in bits.')
+    parser.add_argument('--workers', type=int, default=1, help='Number of processes computing residues.')
+
+    args = parser.parse_args()
+    main(args.bits, args.workers)
@@ -123,3 +123,26 @@ class AlgebraTestCase(unittest.TestCase):
         self.assertEqual(P_q.one * P_q.characteristic, P_q.zero)
         self.assertEqual(Zp_star.one * Zp_star.characteristic, Zp_star.zero)
         self.assertEqual(Zn_star.one * Zn_star.characteristic, Zn_star.zero)
+
+
+    def test_prime_field_arithmetic(self):
+        p  = find_prime(128)
+        Zp = ZZ/ZZ(p)
+
+        for _ in range(100):
+            a, b, k = random_int(p-1)+1, random_int(p-1)+1, random_int(2**130) - 2**129
+            A, B    = Zp(a), Zp(b)
+
+            self.assertEqual(int(A + B), (a + b) % p)
+            self.assertEqual(int(A - B), (a - b) % p)
+            self.assertEqual(int(A * B), (a * b) % p)
+            self.assertEqual(int(A + k), (a + k) % p)
+            self.assertEqual(int(k - A), (k - a) % p)
+            self.assertEqual(int(A * k), (a * k) % p)
+            self.assertEqual(int(A / B * B), a)
+            self.assertEqual(int(-A), -a % p)
+            self.assertEqual(A**k, A**(k % (p-1)))
+            self.assertEqual(A, Zp(a + p))
+            self.assertEqual(hash(A), hash(Zp(a + p)))
+
+        self.assertRaises(NotInvertibleException, lambda: ~Zp.zero)
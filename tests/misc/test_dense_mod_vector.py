@@ -0,0 +1,52 @@
+from samson.math.algebra.rings.integer_ring import ZZ
+from samson.math.dense_mod_vector import DenseModVector
+from samson.math.sparse_vector import SparseVector
+from samson.math.general import random_int, find_prime
+from samson.math.symbols import Symbol
+from samson.utilities.runtime import RUNTIME
+import unittest
+
+x = Symbol('x')
+
+class DenseModVectorTestCase(unittest.TestCase):
+    def _compare(self, R, ops):
+        P = R[x]
+        p = R.int_quotient
+        heuristic = RUNTIME.poly_dense_heuristic
+
+        for _ in range(10):
+            a = [random_int(p) for _ in range(random_int(60)+1)]
+            b = [random_int(p) for _ in range(random_int(30)+1)] + [1]
+
+            try:
+                RUNTIME.poly_dense_heuristic = lambda vec: True
+                pa, pb = P(a), P(b)
+                self.assertIs(type(pa.coeffs), DenseModVector)
+                dense = [op(pa, pb) for op in ops]
+
+                RUNTIME.poly_dense_heuristic = lambda vec: False
+                pa, pb = P(a), P(b)
+                self.assertIs(type(pa.coeffs), SparseVector)
+                sparse = [op(pa, pb) for op in ops]
+            finally:
+                RUNTIME.poly_dense_heuristic = heuristic
+
+            self.assertEqual(dense, sparse)
+
+
+    def test_zz_mod_p(self):
+        ops = [
+            lambda a, b: a + b,
+            lambda a, b: a - b,
+            lambda a, b: -a,
+            lambda a, b: a*b,
+            divmod,
+            lambda a, b: (a*b).gcd(b*b),
+            lambda a, b: a(b.LC()),
+            lambda a, b: a << 5,
+            lambda a, b: a >> 3,
+            lambda a, b: a.derivative()
+        ]
+
+        self._compare(ZZ/ZZ(find_prime(16)), ops)
+        self._compare(ZZ/ZZ(find_prime(128)), ops)
@@ -77,3 +77,11 @@ class EnglishAnalyzerTestCase(unittest.TestCase):
         all_values = [english_val] + edge_cases
 
         self._check_best_sample(english_val, all_values)
+
+
+
+    def test_batch_matches_analyze(self):
+        english_val = Bytes(ENGLISH_VALUES[0])
+        candidates  = [english_val ^ Bytes([char]).stretch(len(english_val)) for char in range(256)] + [english_val]
+
+        self.assertEqual(self.analyzer.analyze_batch(candidates), [self.analyzer.analyze(candidate) for candidate in candidates])
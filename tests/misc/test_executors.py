@@ -0,0 +1,44 @@
+from samson.utilities.executors import ThreadExecutor, ProcessExecutor, AsyncioExecutor
+from samson.utilities.runtime import RUNTIME
+import asyncio
+import unittest
+
+
+async def _async_square(x):
+    await asyncio.sleep(0)
+    return x*x
+
+
+class ExecutorsTestCase(unittest.TestCase):
+    def test_map(self):
+        offset = 3
+        for executor in [ThreadExecutor(4, chunksize=3), ProcessExecutor(2, chunksize=5), AsyncioExecutor(4)]:
+            self.assertEqual(list(executor.map(lambda x: x + offset, range(50))), [x + offset for x in range(50)])
+            self.assertEqual(sorted(executor.map(lambda x, y: x*y, zip(range(20), range(20)), starmap=True, ordered=False)), [x*x for x in range(20)])
+
+
+    def test_async_map(self):
+        self.assertEqual(list(AsyncioExecutor(4).map(_async_square, range(20))), [x*x for x in range(20)])
+
+
+    def test_first(self):
+        seen = []
+
+        def find(x):
+            seen.append(x)
+            return x if x == 10 else None
+
+        self.assertEqual(ThreadExecutor(2).first(find, range(10**6)), 10)
+        self.assertLess(len(seen), 1000)
+
+        for executor in [ProcessExecutor(2, chunksize=16), AsyncioExecutor(4)]:
+            self.assertEqual(executor.first(lambda x: x if x == 10 else None, range(1000)), 10)
+            self.assertIsNone(executor.first(lambda x: None, range(100)))
+
+
+    def test_threaded(self):
+        @RUNTIME.threaded(threads=4, starmap=True, executor=ProcessExecutor)
+        def add(x, y):
+            return x + y
+
+        self.assertEqual(add(zip(range(10), range(10))), [2*x for x in range(10)])
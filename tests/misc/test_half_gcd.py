@@ -0,0 +1,54 @@
+from samson.math.algebra.rings.integer_ring import ZZ
+from samson.math.general import random_int, find_prime, xgcd
+from samson.math.matrix import Matrix
+from samson.math.symbols import Symbol
+from samson.utilities.runtime import RUNTIME
+import unittest
+
+x = Symbol('x')
+
+class HalfGCDTestCase(unittest.TestCase):
+    def test_gcd_xgcd(self):
+        p = find_prime(64)
+        P = (ZZ/ZZ(p))[x]
+        heuristic = RUNTIME.poly_half_gcd_heuristic
+        dense     = RUNTIME.poly_dense_heuristic
+
+        for _ in range(3):
+            c = P([random_int(p) for _ in range(random_int(30)+1)] + [1])
+            a = P([random_int(p) for _ in range(random_int(100)+300)]) * c
+            b = P([random_int(p) for _ in range(random_int(100)+300)]) * c
+
+            try:
+                RUNTIME.poly_half_gcd_heuristic = lambda p1, p2: True
+                fast = a.gcd(b)
+
+                RUNTIME.poly_half_gcd_heuristic = lambda p1, p2: False
+                slow = a.gcd(b)
+
+                # Sparse storage takes the generic Euclidean path
+                RUNTIME.poly_dense_heuristic = lambda vec: False
+                generic = xgcd(P(a.coeffs.list()), P(b.coeffs.list()))
+            finally:
+                RUNTIME.poly_half_gcd_heuristic = heuristic
+                RUNTIME.poly_dense_heuristic    = dense
+
+            self.assertEqual(fast, slow)
+            self.assertEqual(fast.monic(), c.monic())
+            self.assertEqual(xgcd(a, b), generic)
+
+
+    def test_resultant(self):
+        R = ZZ/ZZ(find_prime(32))
+        P = R[x]
+
+        for _ in range(10):
+            a = [R.random(R.quotient) for _ in range(random_int(6)+2)]
+            b = [R.random(R.quotient) for _ in range(random_int(6)+2)]
+            n, m = len(a)-1, len(b)-1
+
+            rows = [[R.zero]*i + a[::-1] + [R.zero]*(m-1-i) for i in range(m)]
+            rows += [[R.zero]*i + b[::-1] + [R.zero]*(n-1-i) for i in range(n)]
+
+            if a[-1] and b[-1]:
+                self.assertEqual(P(a).resultant(P(b)), Matrix(rows, R).det())
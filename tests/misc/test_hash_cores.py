@@ -0,0 +1,70 @@
+from samson.hashes.md4 import MD4
+from samson.hashes.md5 import MD5
+from samson.hashes.sha1 import SHA1
+from samson.hashes.sha2 import SHA224, SHA256, SHA384, SHA512
+from samson.hashes.ripemd160 import RIPEMD160
+from samson.utilities.bytes import Bytes
+import hashlib
+import unittest
+
+
+class HashCoreTestCase(unittest.TestCase):
+    def _run_test(self, hash_type, reference):
+        for length in [0, 1, 55, 56, 64, 111, 112, 128, 1000]:
+            message = Bytes.random(length)
+            self.assertEqual(hash_type().hash(message), hashlib.new(reference, message).digest())
+
+
+    def _run_block_test(self, hash_type):
+        # Compressing block by block through `compression_func` must agree with the multi-block core
+        hash_obj = hash_type()
+        padded   = hash_obj.pad_func(Bytes.random(300))
+        state    = hash_obj.initial_state
+
+        for i in range(0, len(padded), hash_obj.block_size):
+            state = hash_obj.compression_func(padded[i:i+hash_obj.block_size], state)
+
+        self.assertEqual(state, hash_obj.process_blocks(hash_obj.initial_state, padded, len(padded)))
+
+
+    def _run_vectors(self, hash_type, vectors):
+        for message, expected in vectors:
+            self.assertEqual(hash_type().hash(message).hex().decode(), expected)
+
+        self._run_block_test(hash_type)
+
+
+    def test_md4(self):
+        # https://tools.ietf.org/html/rfc1320
+        self._run_vectors(MD4, [
+            (b'', '31d6cfe0d16ae931b73c59d7e0c089c0'),
+            (b'abc', 'a448017aaf21d8525fc10ae87aa6729d'),
+            (b'12345678901234567890123456789012345678901234567890123456789012345678901234567890', 'e33b4ddc9c38f2199c3e7b164fcc0536')
+        ])
+
+
+    def test_ripemd160(self):
+        # https://homes.esat.kuleuven.be/~bosselae/ripemd160.html
+        self._run_vectors(RIPEMD160, [
+            (b'', '9c1185a5c5e9fc54612808977ee8f548b2258d31'),
+            (b'abc', '8eb208f7e05d987a9b044a8e98c6b087f15a0bfc'),
+            (b'abcdbcdecdefdefgefghfghighijhijkijkljklmklmnlmnomnopnopq', '12a053384a9c0c88e405a06c27dcf49ada62eb2b')
+        ])
+
+
+    def test_md5(self):
+        self._run_test(MD5, 'md5')
+        self._run_block_test(MD5)
+
+
+    def test_sha1(self):
+        self._run_test(SHA1, 'sha1')
+        self._run_block_test(SHA1)
+
+
+    def test_sha2(self):
+        for hash_type, reference in [(SHA224, 'sha224'), (SHA256, 'sha256'), (SHA384, 'sha384'), (SHA512, 'sha512')]:
+            self._run_test(hash_type, reference)
+            self._run_block_test(hash_type)
+
+        self._run_test(lambda: SHA512(trunc=256), 'sha512_256')
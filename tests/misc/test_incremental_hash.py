@@ -0,0 +1,75 @@
+from samson.hashes.md4 import MD4
+from samson.hashes.md5 import MD5
+from samson.hashes.sha1 import SHA1
+from samson.hashes.sha2 import SHA224, SHA256, SHA384, SHA512
+from samson.hashes.ripemd160 import RIPEMD160
+from samson.hashes.whirlpool import Whirlpool
+from samson.macs.hmac import HMAC
+from samson.utilities.bytes import Bytes
+import hashlib
+import hmac
+import io
+import unittest
+
+
+class IncrementalHashTestCase(unittest.TestCase):
+    def _run_test(self, hash_type, reference=None):
+        for length in [0, 1, 55, 56, 64, 111, 112, 128, 300]:
+            message  = Bytes.random(length)
+            expected = hashlib.new(reference, message).digest() if reference else hash_type().hash(message)
+            hash_obj = hash_type()
+
+            for i in range(0, length, 13):
+                hash_obj.update(message[i:i+13])
+
+            self.assertEqual(hash_obj.digest(), expected)
+
+            # `digest` doesn't consume the state and `copy` forks it
+            forked = hash_obj.copy().update(b'tail')
+            self.assertEqual(hash_obj.digest(), expected)
+            self.assertEqual(forked.digest(), hash_type().hash(message + b'tail'))
+            self.assertEqual(hash_type().update_stream(io.BytesIO(message), chunk_size=7).digest(), expected)
+
+
+    def test_md4(self):
+        self._run_test(MD4)
+
+
+    def test_md5(self):
+        self._run_test(MD5, 'md5')
+
+
+    def test_sha1(self):
+        self._run_test(SHA1, 'sha1')
+
+
+    def test_sha2(self):
+        self._run_test(SHA224, 'sha224')
+        self._run_test(SHA256, 'sha256')
+        self._run_test(SHA384, 'sha384')
+        self._run_test(SHA512, 'sha512')
+        self._run_test(lambda: SHA512(trunc=256), 'sha512_256')
+
+
+    def test_ripemd160(self):
+        self._run_test(RIPEMD160)
+
+
+    def test_whirlpool(self):
+        self._run_test(Whirlpool)
+
+
+    def test_reset(self):
+        sha256 = SHA256().update(b'garbage')
+        self.assertEqual(sha256.reset().update(b'samson').digest(), SHA256().hash(b'samson'))
+
+
+    def test_hmac_midstate(self):
+        for key_len in [0, 16, 64, 100]:
+            key     = Bytes.random(key_len)
+            message = Bytes.random(200)
+            mac     = HMAC(key, SHA256())
+
+            self.assertEqual(mac.generate(message), hmac.new(key, message, 'sha256').digest())
+            self.assertEqual(mac.generate(message[:10]), hmac.new(key, message[:10], 'sha256').digest())
+            self.assertEqual(HMAC.prf(SHA256())(key, message), hmac.new(key, message, 'sha256').digest())
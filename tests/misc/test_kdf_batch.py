@@ -0,0 +1,33 @@
+from samson.kdfs.pbkdf2 import PBKDF2
+from samson.kdfs.scrypt import Scrypt
+from samson.kdfs.bcrypt import Bcrypt
+from samson.encoding.general import bcrypt_b64_decode
+from samson.macs.hmac import HMAC
+from samson.hashes.sha2 import SHA256
+from samson.utilities.bytes import Bytes
+import unittest
+
+
+class KDFBatchTestCase(unittest.TestCase):
+    def _run_test(self, kdf, *args):
+        passwords = [Bytes(f'password{i}'.encode()) for i in range(6)]
+        expected  = [kdf.derive(password, *args) for password in passwords]
+
+        for workers in [1, 2]:
+            derived = list(kdf.derive_many(iter(passwords), *args, workers=workers, chunksize=2))
+            self.assertEqual(derived, list(zip(passwords, expected)))
+
+            self.assertEqual(kdf.crack(iter(passwords), expected[4], *args, workers=workers, chunksize=2), passwords[4])
+            self.assertIsNone(kdf.crack(iter(passwords[:4]), expected[4], *args, workers=workers, chunksize=2))
+
+
+    def test_pbkdf2(self):
+        self._run_test(PBKDF2(HMAC.prf(SHA256()), 32, 20), b'salt')
+
+
+    def test_scrypt(self):
+        self._run_test(Scrypt(desired_len=32, cost=16, parallelization_factor=2, block_size_factor=2), b'salt')
+
+
+    def test_bcrypt(self):
+        self._run_test(Bcrypt(cost=4), bcrypt_b64_decode(b'zVHmKQtGGQob.b/Nc7l9NO'))
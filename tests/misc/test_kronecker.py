@@ -0,0 +1,40 @@
+from samson.math.algebra.rings.integer_ring import ZZ
+from samson.math.general import random_int, find_prime
+from samson.math.symbols import Symbol
+from samson.utilities.runtime import RUNTIME
+import unittest
+
+x = Symbol('x')
+
+class KroneckerTestCase(unittest.TestCase):
+    def _compare(self, R, max_coeff, ops):
+        P = R[x]
+        heuristic = RUNTIME.poly_kronecker_heuristic
+
+        for _ in range(10):
+            a = P([random_int(max_coeff) - max_coeff // 3 for _ in range(random_int(80)+1)])
+            b = P([random_int(max_coeff) - max_coeff // 3 for _ in range(random_int(40)+1)] + [1])
+
+            try:
+                RUNTIME.poly_kronecker_heuristic = lambda p1, p2: True
+                fast = [op(a, b) for op in ops]
+
+                RUNTIME.poly_kronecker_heuristic = lambda p1, p2: False
+                slow = [op(a, b) for op in ops]
+            finally:
+                RUNTIME.poly_kronecker_heuristic = heuristic
+
+            self.assertEqual(fast, slow)
+
+
+    def test_zz(self):
+        self._compare(ZZ, 2**70, [lambda a, b: a*b, lambda a, b: a*a])
+
+
+    def test_zz_mod_p(self):
+        p = find_prime(128)
+        self._compare(ZZ/ZZ(p), p, [lambda a, b: a*b, lambda a, b: a*a, divmod])
+
+
+    def test_zz_mod_2(self):
+        self._compare(ZZ/ZZ(2), 2, [lambda a, b: a*b, divmod])
@@ -0,0 +1,65 @@
+from samson.math.algebra.all import ZZ, QQ
+from samson.math.matrix import Matrix
+from samson.math.general import crt_lll, gram_schmidt
+from samson.utilities.bytes import Bytes
+import unittest
+
+
+def random_basis(n, bits):
+    return Matrix([[Bytes.random(bits // 8).int() - 2**(bits-1) for _ in range(n)] for _ in range(n)], ZZ)
+
+
+class LLLTestCase(unittest.TestCase):
+    def assert_reduced(self, basis, delta):
+        ortho, mu = gram_schmidt(basis)
+        B = [sum([elem*elem for elem in row], QQ.zero) for row in ortho.rows]
+
+        eta   = QQ((51, 100))
+        delta = QQ(delta) - QQ((1, 10**6))
+
+        for i in range(basis.num_rows):
+            for j in range(i):
+                self.assertLessEqual(abs(mu[i, j]), eta)
+
+        for k in range(1, basis.num_rows):
+            self.assertGreaterEqual(B[k], (delta - mu[k, k-1]**2) * B[k-1])
+
+
+    def test_engines(self):
+        for n in [2, 5, 10]:
+            basis = random_basis(n, 64)
+            fp    = basis.LLL(0.99, use_fp=True)
+            exact = basis.LLL(0.99, use_fp=False)
+
+            self.assert_reduced(fp, 0.99)
+            self.assert_reduced(exact, 0.99)
+            self.assertEqual(abs(fp.det()), abs(basis.det()))
+            self.assertEqual(abs(exact.det()), abs(basis.det()))
+
+
+    def test_large_entries(self):
+        # Gram matrix won't fit in a double; must fall back to exact arithmetic
+        basis = random_basis(6, 512)
+        self.assert_reduced(basis.LLL(0.99), 0.99)
+
+
+    def test_rational(self):
+        basis   = Matrix([[QQ((1, 3)), QQ(2), QQ(3)], [QQ(4), QQ((5, 7)), QQ(6)], [QQ(7), QQ(8), QQ((9, 2))]], QQ)
+        reduced = basis.LLL()
+        self.assertEqual(reduced.coeff_ring, QQ)
+        self.assertEqual(abs(reduced.det()), abs(basis.det()))
+
+
+    def test_dependent(self):
+        basis   = Matrix([[1, 2, 3], [2, 4, 6], [3, 5, 7], [4, 6, 8]], ZZ)
+        reduced = basis.LLL()
+
+        self.assertEqual(reduced.num_rows, 4)
+        self.assertEqual(reduced[0], [QQ.zero]*3)
+        self.assertEqual(reduced[1], [QQ.zero]*3)
+
+
+    def test_crt_lll(self):
+        x     = 684250860
+        rings = [ZZ/ZZ(quotient) for quotient in [229, 246, 93, 22, 408]]
+        self.assertEqual(crt_lll([r(x) for r in rings]).val, x)
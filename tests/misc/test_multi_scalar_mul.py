@@ -0,0 +1,89 @@
+from samson.math.algebra.rings.integer_ring import ZZ
+from samson.math.algebra.curves.named import P256, EdwardsCurve25519
+from samson.math.algebra.curves.multi_scalar_mul import multi_scalar_mul, batch_multi_scalar_mul, multi_exponentiation, PIPPENGER_THRESHOLD
+from samson.math.general import random_int, find_prime
+from samson.public_key.ecdsa import ECDSA
+from samson.public_key.eddsa import EdDSA
+import unittest
+
+
+class MultiScalarMulTestCase(unittest.TestCase):
+    def _naive(self, points, scalars, n):
+        Q = points[0]*(scalars[0] % n)
+        for P, k in zip(points[1:], scalars[1:]):
+            Q += P*(k % n)
+
+        return Q
+
+
+    def _run_group(self, G, n, sizes):
+        for size in sizes:
+            points  = [G*random_int(n) for _ in range(size)]
+            scalars = [random_int(n) - n // 4 for _ in range(size)]
+            scalars[0] = 0
+            self.assertEqual(multi_scalar_mul(points, scalars), self._naive(points, scalars, n))
+
+
+    def test_weierstrass(self):
+        self._run_group(P256.G, P256.q, [1, 2, 7])
+
+
+    def test_edwards(self):
+        self._run_group(EdwardsCurve25519.B, EdwardsCurve25519.l, [1, 2, 7])
+
+
+    def test_mul_group(self):
+        p = find_prime(128)
+        R = (ZZ/ZZ(p)).mul_group()
+        self._run_group(R(3), p-1, [1, 3, 9])
+
+
+    def test_pippenger(self):
+        ring  = ZZ/ZZ(1000003)
+        G     = (ring.mul_group())(5)
+        sizes = [PIPPENGER_THRESHOLD, PIPPENGER_THRESHOLD + 5]
+        self._run_group(G, 1000002, sizes)
+
+
+    def test_cancellation(self):
+        G = P256.G
+        self.assertEqual(multi_scalar_mul([G, G*3], [3, -1]), P256.zero)
+
+
+    def test_batch(self):
+        G, Q = P256.G, P256.G*random_int(P256.q)
+        rows = [[random_int(P256.q) - P256.q // 2 for _ in range(2)] for _ in range(5)] + [[0, 0]]
+        self.assertEqual(batch_multi_scalar_mul([G, Q], rows), [self._naive([G, Q], row, P256.q) for row in rows])
+
+
+    def test_multi_exponentiation(self):
+        p = find_prime(512)
+        bases     = [random_int(p) for _ in range(4)]
+        exponents = [random_int(p) for _ in range(4)]
+        exponents[1] = -exponents[1]
+
+        expected = 1
+        for b, e in zip(bases, exponents):
+            expected = expected * pow(b, e, p) % p
+
+        self.assertEqual(multi_exponentiation(bases, exponents, p), expected)
+
+
+    def test_ecdsa_batch_verify(self):
+        ecdsa = ECDSA(P256.G)
+        msgs  = [bytes([i])*i for i in range(8)]
+        sigs  = [ecdsa.sign(m) for m in msgs]
+
+        self.assertTrue(ecdsa.batch_verify(msgs, sigs))
+
+        sigs[5] = (sigs[5][0], sigs[5][1] + 1)
+        self.assertFalse(ecdsa.batch_verify(msgs, sigs))
+
+
+    def test_eddsa_batch_verify(self):
+        eddsa = EdDSA()
+        msgs  = [bytes([i])*i for i in range(8)]
+        sigs  = [eddsa.sign(m) for m in msgs]
+
+        self.assertTrue(eddsa.batch_verify(msgs, sigs))
+        self.assertFalse(eddsa.batch_verify(msgs[::-1], sigs))
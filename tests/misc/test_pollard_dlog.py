@@ -0,0 +1,74 @@
+from samson.math.algebra.rings.integer_ring import ZZ
+from samson.math.algebra.curves.weierstrass_curve import WeierstrassCurve
+from samson.math.general import random_int, find_prime, is_prime, pohlig_hellman
+from samson.math.pollard_dlog import pollard_rho_dlog, pollard_lambda_dlog, DistinguishedPointStore
+from tempfile import TemporaryDirectory
+import unittest
+import os
+
+
+class PollardDlogTestCase(unittest.TestCase):
+    def _subgroup(self, bits):
+        q = find_prime(bits)
+        k = 2
+        while not is_prime(k*q + 1):
+            k += 2
+
+        R = (ZZ/ZZ(k*q + 1)).mul_group()
+        return R(3)*k, q
+
+
+    def test_rho(self):
+        g, q = self._subgroup(24)
+
+        for workers in [1, 2]:
+            x = random_int(q)
+            self.assertEqual(pollard_rho_dlog(g, g*x, q, workers=workers), x)
+
+
+    def test_rho_curve(self):
+        ring  = ZZ/ZZ(1000003)
+        curve = WeierstrassCurve(a=ring(2), b=ring(3), ring=ring)
+
+        # G has order 999708 = 2^2 * 3 * 83309
+        g = curve.G*12
+        h = g*54321
+        self.assertEqual(pollard_rho_dlog(g, h, 83309), 54321)
+
+
+    def test_persistence(self):
+        g, q = self._subgroup(24)
+        x = random_int(q)
+        h = g*x
+
+        with TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'dlog.dps')
+            self.assertEqual(pollard_rho_dlog(g, h, q, path=path), x)
+
+            store = DistinguishedPointStore(path)
+            self.assertGreater(len(store), 0)
+            self.assertEqual(pollard_rho_dlog(g, h, q, store=store), x)
+
+            # Simulate a run killed mid-write
+            with open(path, 'ab') as f:
+                f.write(b'\x80\x04')
+
+            self.assertEqual(len(DistinguishedPointStore(path)), len(store))
+
+            with self.assertRaises(ValueError):
+                pollard_rho_dlog(g, g*(x+1), q, path=path)
+
+
+    def test_lambda(self):
+        g, q = self._subgroup(64)
+        a = random_int(q // 2)
+
+        for workers in [1, 2]:
+            x = a + random_int(2**20)
+            self.assertEqual(pollard_lambda_dlog(g, g*x, a, a + 2**20, workers=workers), x)
+
+
+    def test_pohlig_hellman_rho(self):
+        g, q = self._subgroup(28)
+        x = random_int(q)
+        self.assertEqual(pohlig_hellman(g, g*x, q, bsgs_limit=2**4), x)
@@ -0,0 +1,41 @@
+from samson.analysis.general import rc4_bias_counts, rc4_bias_map_from_counts, generate_rc4_bias_map, generate_random_rc4_bias_counts, save_rc4_bias_counts, merge_rc4_bias_map_files
+from samson.utilities.bytes import Bytes
+import tempfile
+import os
+import unittest
+
+
+class RC4BiasTestCase(unittest.TestCase):
+    def test_counts(self):
+        ciphertexts = [Bytes.random(8) for _ in range(500)] + [Bytes.random(3) for _ in range(50)]
+        counts      = rc4_bias_counts(ciphertexts, positions=8)
+
+        for i in range(8):
+            expected = [0]*256
+            for ciphertext in ciphertexts:
+                if i < len(ciphertext):
+                    expected[ciphertext[i]] += 1
+
+            self.assertEqual(list(counts[i*256:(i+1)*256]), expected)
+
+        bias_map = generate_rc4_bias_map(ciphertexts)
+        self.assertEqual(bias_map[:8], rc4_bias_map_from_counts(counts))
+        self.assertEqual(bias_map[8:], [[]]*248)
+
+        # Accumulates in place
+        rc4_bias_counts(ciphertexts, positions=8, counts=counts)
+        self.assertEqual(sum(counts[:256]), 2*len(ciphertexts))
+
+
+    def test_merge_files(self):
+        counts = generate_random_rc4_bias_counts(b'\x00' * 4, sample_size=2000)
+
+        with tempfile.TemporaryDirectory() as tmp:
+            base = os.path.join(tmp, 'bias')
+            for i in range(3):
+                save_rc4_bias_counts(f'{base}.{i}', counts)
+
+            merged = merge_rc4_bias_map_files(base, 3)
+
+        self.assertEqual(merged, [[(b, 3*c) for b, c in row] for row in rc4_bias_map_from_counts(counts)])
+        self.assertEqual(sum(count for _, count in merged[1]), 3*2000)
@@ -0,0 +1,46 @@
+from samson.math.algebra.rings.integer_ring import ZZ
+from samson.math.algebra.curves.weierstrass_curve import WeierstrassCurve
+from samson.math.general import random_int, find_prime, frobenius_trace, frobenius_trace_mod_l
+from samson.math.sea import classical_modular_polynomial, elkies_kernel_polynomial
+from samson.math import general
+import unittest
+
+
+class SEATestCase(unittest.TestCase):
+    def _random_curve(self, bits):
+        p = find_prime(bits)
+        R = ZZ/ZZ(p)
+        return WeierstrassCurve(a=R(random_int(p)), b=R(random_int(p)), ring=R)
+
+
+    def test_modular_polynomial(self):
+        phi = classical_modular_polynomial(3)
+
+        self.assertEqual(phi[(4, 0)], 1)
+        self.assertEqual(phi[(3, 3)], -1)
+        self.assertEqual(phi[(1, 1)], -770845966336000000)
+        self.assertEqual(phi[(0, 1)], 1855425871872000000000)
+        self.assertEqual(classical_modular_polynomial(7, 65537), {k: v % 65537 for k, v in classical_modular_polynomial(7).items() if v % 65537})
+
+
+    def test_kernel_polynomial(self):
+        curve = self._random_curve(48)
+
+        for l in [3, 5, 7, 11, 13]:
+            h = elkies_kernel_polynomial(curve, l)
+            if h is None:
+                continue
+
+            self.assertEqual(h.degree(), (l-1) // 2)
+            self.assertEqual(curve.division_poly(l).x_poly % h, h.ring.zero)
+            self.assertEqual(frobenius_trace_mod_l(curve, l, h), frobenius_trace_mod_l(curve, l))
+
+
+    def test_frobenius_trace(self):
+        for bits in [12, 24]:
+            curve = self._random_curve(bits)
+            trace = frobenius_trace(curve)
+            self.assertEqual((curve.p + 1 - trace)*curve.random(), curve.zero)
+
+            general._FROBENIUS_TRACE_CACHE.clear()
+            self.assertEqual(frobenius_trace(curve, workers=2), trace)
@@ -0,0 +1,30 @@
+from samson.math.factorization.siqs import siqs, LargePrimeGraph
+import unittest
+
+
+class SIQSTestCase(unittest.TestCase):
+    def test_factor(self):
+        p, q = 1071540459673829, 1080330929476769
+        primes, _ = siqs(p*q)
+        self.assertEqual(set(primes), {p, q})
+
+
+    def test_factor_parallel(self):
+        p, q = 3331113965338635107, 2459377476347141881
+        primes, _ = siqs(p*q, workers=2)
+        self.assertEqual(set(primes), {p, q})
+
+
+    def test_large_prime_cycles(self):
+        n     = 10403
+        graph = LargePrimeGraph(n)
+
+        # u^2 - n with the large primes 101 and 103 split across three relations
+        relations = [(u, u*u - n, 0, large_primes) for u, large_primes in [(1, (101,)), (2, (101, 103)), (3, (103,))]]
+
+        self.assertIsNone(graph.add(relations[0]))
+        self.assertIsNone(graph.add(relations[1]))
+
+        u, gx, mask = graph.add(relations[2])
+        self.assertEqual(u, 6)
+        self.assertEqual(gx, (1 - n)*(4 - n)*(9 - n))
@@ -0,0 +1,49 @@
+from samson.math.sparse_gf2 import SparseGF2Matrix, block_lanczos, dense_left_nullspace
+from samson.math.general import random_int
+import unittest
+
+
+class SparseGF2TestCase(unittest.TestCase):
+    def _random_matrix(self, num_rows, num_cols):
+        return SparseGF2Matrix([{random_int(num_cols) for _ in range(5 + random_int(20))} for _ in range(num_rows)], num_cols=num_cols)
+
+
+    def _assert_dependencies(self, M, deps):
+        self.assertTrue(deps)
+        for dep in deps:
+            self.assertTrue(dep)
+            self.assertFalse(any(M.tmul_block([int(r in dep) for r in range(M.num_rows)])))
+
+
+    def test_structured_elimination(self):
+        # Column 3 is a singleton; columns 0, 1 and 2 are doubletons
+        M = SparseGF2Matrix([[0, 1], [1, 2], [0, 2], [3]])
+        reduced, combos, deps = M.structured_elimination(excess=0)
+
+        self.assertEqual(reduced.num_rows, 0)
+        self.assertEqual(combos, [])
+        self.assertEqual(deps, [0b111])
+
+        M    = SparseGF2Matrix(M.rows + [[1, 4, 5], [0, 4, 5], [1, 2, 5]])
+        deps = M.left_nullspace()
+        self.assertEqual(len(deps), 2)
+        self._assert_dependencies(M, deps)
+
+
+    def test_block_lanczos(self):
+        M    = self._random_matrix(820, 800)
+        deps = block_lanczos(M)
+
+        self.assertGreaterEqual(len(deps), 20)
+        self._assert_dependencies(M, [[r for r in range(M.num_rows) if dep >> r & 1] for dep in deps])
+
+
+    def test_methods_agree(self):
+        M = self._random_matrix(330, 300)
+
+        for method in ['dense', 'lanczos']:
+            deps = M.left_nullspace(method=method)
+            self.assertGreaterEqual(len(deps), 30)
+            self._assert_dependencies(M, deps)
+
+        self.assertEqual(dense_left_nullspace([0b011, 0b110, 0b101, 0b011]), [0b0111, 0b1001])
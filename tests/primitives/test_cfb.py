@@ -123,3 +123,16 @@ class CFBTestCase(unittest.TestCase):
         expected_ciphertext = Bytes(0x75A385741AB9CEF82031623D55B1E471).zfill(16)
 
         self._run_test(key, iv, plaintext, expected_ciphertext)
+
+
+    def test_streaming(self):
+        key, iv   = Bytes.random(16), Bytes.random(16)
+        plaintext = Bytes.random(1000)
+        expected  = CFB(Rijndael(key), iv).encrypt(plaintext)
+
+        cfb = CFB(Rijndael(key), iv)
+        ciphertext = b''.join([cfb.encrypt_into(plaintext[i:i+7]) for i in range(0, len(plaintext), 7)])
+        self.assertEqual(ciphertext, expected)
+
+        cfb.reset()
+        self.assertEqual(b''.join([cfb.decrypt_into(expected[i:i+23]) for i in range(0, len(expected), 23)]), plaintext)
@@ -3,6 +3,7 @@ from samson.utilities.bytes import Bytes
 from samson.block_ciphers.modes.ctr import CTR
 from math import ceil
 import codecs
+import io
 import unittest
 
 
@@ -34,3 +35,22 @@ class CTRTestCase(unittest.TestCase):
             ctr.counter = 1
             self.assertEqual(ciphertext, expected_ciphertext)
             self.assertEqual(plaintext, ctr.decrypt(ciphertext))
+
+
+    def test_streaming(self):
+        key, nonce = Bytes.random(16), Bytes.random(8)
+        plaintext  = Bytes.random(1000)
+        expected   = CTR(Rijndael(key), nonce).encrypt(plaintext)
+
+        # Chunks that don't line up with the block size must continue the keystream
+        ctr = CTR(Rijndael(key), nonce)
+        ciphertext = b''.join([ctr.encrypt(plaintext[i:i+7]) for i in range(0, len(plaintext), 7)])
+        self.assertEqual(ciphertext, expected)
+
+        buffer = bytearray(plaintext)
+        CTR(Rijndael(key), nonce).encrypt_into(buffer, buffer)
+        self.assertEqual(buffer, expected)
+
+        out = io.BytesIO()
+        CTR(Rijndael(key), nonce).decrypt_stream(io.BytesIO(expected), out, chunk_size=100)
+        self.assertEqual(out.getvalue(), plaintext)
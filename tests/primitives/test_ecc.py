@@ -1,4 +1,10 @@
-from samson.math.algebra.curves.named import EdwardsCurve25519, Curve25519, Curve448
+from samson.math.algebra.curves.named import EdwardsCurve25519, EdwardsCurve448, Curve25519, Curve448, P192, P256, P384, P521, FIXED_BASE_TABLES
+from samson.math.algebra.curves.fixed_base_table import FixedBaseTable
+from samson.math.algebra.curves.montgomery_curve import Curve25519Crv, Curve448Crv
+from samson.math.algebra.rings.ring import RingElement
+from samson.math.algebra.curves.weierstrass_curve import WeierstrassCurve
+from samson.math.algebra.rings.integer_ring import ZZ
+from samson.math.general import fast_mul, random_int
 from samson.math.algebra.curves.twisted_edwards_curve import TwistedEdwardsPoint
 from samson.utilities.bytes import Bytes
 import unittest
@@ -68,3 +74,51 @@ class ECCTestCase(unittest.TestCase):
         expected_point = TwistedEdwardsPoint(x=17634806241944143926862694387797098711831272351350528794179127045273395268845, y=37345872894299654648114376969666691683138900003498308543502943378943868815380, curve=EdwardsCurve25519)
 
         self._run_edwards_test(point, scalar, expected_point)
+
+
+
+    def test_weierstrass_jacobian_mul(self):
+        for curve in [P192, P256, P521]:
+            G = curve.G
+            for k in [0, 1, 2, 3, -7, curve.q - 1, curve.q, curve.q + 1, random_int(2**20), random_int(curve.q), -random_int(curve.q)]:
+                self.assertEqual(G*k, fast_mul(G, k))
+
+
+    def test_weierstrass_jacobian_small_order(self):
+        R = ZZ/ZZ(1009)
+        E = WeierstrassCurve(a=R(2), b=R(3), ring=R)
+
+        for _ in range(10):
+            P = E.random()
+            for k in range(40):
+                self.assertEqual(P*k, fast_mul(P, k))
+
+            self.assertEqual(P*P.order, E.POINT_AT_INFINITY)
+
+
+
+    def test_fixed_base_table(self):
+        for curve in [P192, P256, P521]:
+            G = curve.G
+            for k in [0, 1, 2, -1, curve.q - 1, curve.q, random_int(curve.q)]:
+                self.assertEqual(FIXED_BASE_TABLES[curve] * k, G._jacobian_mul(k, curve.p))
+
+        for curve in [EdwardsCurve25519, EdwardsCurve448]:
+            for k in [0, 1, 2, curve.l - 1, random_int(curve.l)]:
+                self.assertEqual(curve.B * k, RingElement.__mul__(curve.B, k))
+
+        for curve, plain_curve in [(Curve25519, Curve25519Crv()), (Curve448, Curve448Crv())]:
+            for _ in range(3):
+                k = random_int(curve.p)
+                self.assertEqual(curve.clamp_to_curve(k) * curve.U, plain_curve.clamp_to_curve(k) * plain_curve.U)
+
+
+    def test_fixed_base_table_serialization(self):
+        for G in [P256.G, EdwardsCurve448.B]:
+            table = FixedBaseTable(G, width=3)
+            loaded = FixedBaseTable.deserialize(G, table.serialize())
+            k = random_int(2**512)
+            self.assertEqual(loaded * k, table * k)
+
+        with self.assertRaises(ValueError):
+            FixedBaseTable.deserialize(P384.G, FixedBaseTable(P256.G, width=3).serialize())
@@ -0,0 +1,56 @@
+from samson.macs.ghash import GHASH
+from samson.block_ciphers.modes.gcm import GCM
+from samson.block_ciphers.rijndael import Rijndael
+from samson.utilities.bytes import Bytes
+import unittest
+
+
+def reference_mul(x, y):
+    z = 0
+    for i in range(127, -1, -1):
+        if (x >> i) & 1:
+            z ^= y
+
+        y = (y >> 1) ^ (0xe1 << 120 if y & 1 else 0)
+
+    return z
+
+
+class GHASHTestCase(unittest.TestCase):
+    # https://csrc.nist.rip/groups/ST/toolkit/BCM/documents/proposedmodes/gcm/gcm-spec.pdf (Test Case 2)
+    def test_vec0(self):
+        H = Rijndael(Bytes(b'').zfill(16)).encrypt(Bytes(b'').zfill(16))
+        self.assertEqual(H, Bytes(0x66e94bd4ef8a2c3b884cfa59ca342b2e))
+
+        ghash = GHASH(H)
+        ghash.update(Bytes(0x0388dace60b6a392f328c2b971b2fe78)).update(Bytes(128).zfill(16))
+        self.assertEqual(ghash.digest(), Bytes(0xf38cbb1ad69223dcc3457ae5b6b0f885))
+
+
+    def test_aggregation(self):
+        H = Bytes.random(16).int()
+
+        for length in [0, 5, 16, 33, 64, 100, 257]:
+            data     = Bytes.random(length)
+            padded   = data.pad_congruent_right(16) if length else data
+            expected = 0
+            for block in padded.chunk(16):
+                expected = reference_mul(expected ^ block.int(), H)
+
+            for aggregate in [1, 3, 8]:
+                ghash = GHASH(H, aggregate=aggregate)
+                self.assertEqual(ghash.generate(data).int(), expected)
+
+                for i in range(0, length, 7):
+                    ghash.update(data[i:i+7])
+
+                self.assertEqual(ghash.digest().int(), expected)
+
+
+    def test_gcm_tag(self):
+        key   = Bytes(0xfeffe9928665731c6d6a8f9467308308)
+        nonce = Bytes(0xcafebabefacedbaddecaf888)
+        data  = Bytes(0xfeedfacedeadbeeffeedfacedeadbeefabaddad2)
+        plaintext = Bytes(0xd9313225f88406e5a55909c5aff5269a86a7a9531534f7da2e4c303d8a318a721c3c0c95956809532fcf0e2449a6b525b16aedf5aa0de657ba637b39)
+
+        self.assertEqual(GCM(Rijndael(key)).encrypt(nonce, plaintext, data)[-16:], Bytes(0x5bc94fbc3221a5db94fae95ae7121a47))
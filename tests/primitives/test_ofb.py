@@ -121,3 +121,16 @@ class OFBTestCase(unittest.TestCase):
         expected_ciphertext = Bytes(0x0126141D67F37BE8538F5A8BE740E484).zfill(16)
 
         self._run_test(key, iv, plaintext, expected_ciphertext)
+
+
+    def test_streaming(self):
+        key, iv   = Bytes.random(16), Bytes.random(16)
+        plaintext = Bytes.random(1000)
+        expected  = OFB(Rijndael(key), iv).encrypt(plaintext)
+
+        ofb = OFB(Rijndael(key), iv)
+        ciphertext = b''.join([ofb.encrypt_into(plaintext[i:i+7]) for i in range(0, len(plaintext), 7)])
+        self.assertEqual(ciphertext, expected)
+
+        ofb.reset()
+        self.assertEqual(b''.join([ofb.decrypt_into(expected[i:i+23]) for i in range(0, len(expected), 23)]), plaintext)
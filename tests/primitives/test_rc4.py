@@ -143,6 +143,8 @@ class RC4TestCase(unittest.TestCase):
         for i, start in enumerate([0, 16, 240, 256, 496, 512, 752, 768, 1008, 1024, 1520, 1536, 2032, 2048, 3056, 3072, 4080, 4096]):
             self.assertEqual(keystream[start:start + 16], codecs.decode(test_vec[i], 'hex_codec'))
 
+        self.assertEqual(next(RC4.keystreams([key], 4112)), keystream)
+
 
     def test_vec0(self):
         self._run_test(TEST_KEY_0, TEST_VEC_0)
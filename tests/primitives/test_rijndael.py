@@ -90,3 +90,17 @@ class RijndaelTestCase(unittest.TestCase):
 
         test_vector = b'16990D2F01F21A61678538BD10F1F231A1DCB8D4E73CDDF6A33B5B5FA2368E14'.lower()
         self._run_test(key, plaintext, block_size, test_vector, 1000)
+
+
+    def test_blocks_match_rounds(self):
+        for key_size in range(16, 33, 4):
+            for block_size in range(16, 33, 4):
+                rijndael  = Rijndael(Bytes.random(key_size), block_size=block_size)
+                plaintext = Bytes.random(block_size*3)
+
+                ciphertext = rijndael.encrypt_blocks(plaintext)
+                expected   = b''.join([list(rijndael.yield_encrypt(block))[-1] for block in plaintext.chunk(block_size)])
+
+                self.assertEqual(ciphertext, expected)
+                self.assertEqual(rijndael.decrypt_blocks(ciphertext), plaintext)
+                self.assertEqual(list(rijndael.yield_decrypt(ciphertext[:block_size]))[-1], plaintext[:block_size])